@@ -0,0 +1,148 @@
+# analysis_cache.py
+import hashlib
+import threading
+
+from cachetools import TTLCache
+
+import metrics
+from reviewer import instrumentation
+from reviewer.analysis import build_resume_profile, match_resume_profile, match_roles
+
+# Streamlit reruns main.py on every widget change, but imported modules are kept
+# in memory, so this cache is shared by every session in the process.
+ANALYSIS_CACHE_SIZE = 256
+ANALYSIS_CACHE_TTL = 60 * 60  # seconds
+# Role-independent resume profiles, keyed by resume digest only, so trying
+# another job role or description on the same resume reuses the profile
+PROFILE_CACHE_SIZE = 64
+
+_analysis_cache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL)
+_profile_cache = TTLCache(maxsize=PROFILE_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL)
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "profile_hits": 0, "profile_misses": 0}
+
+
+def normalize_resume_text(resume_text):
+    """
+    Normalizes resume text so equivalent uploads share one cache entry.
+
+    Only changes that cannot affect the analysis are applied: line endings are
+    unified and surrounding whitespace is stripped.
+    """
+    return resume_text.replace("\r\n", "\n").strip()
+
+
+def analysis_cache_key(resume_text, job_role, settings=None, job_description=""):
+    """
+    Builds the content-addressed cache key for an analysis request.
+
+    Args:
+        resume_text: Normalized resume text
+        job_role: Target job role as entered by the user
+        settings: Optional dict of analysis settings (model, depth, aspects, ...)
+        job_description: Optional job description text
+
+    Returns:
+        tuple: (resume digest, job role, job description digest, frozen settings)
+    """
+    digest = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    description_digest = hashlib.sha256(job_description.strip().encode("utf-8")).hexdigest()
+    frozen_settings = tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in (settings or {}).items()
+    ))
+    return digest, job_role, description_digest, frozen_settings
+
+
+def _cached_resume_profile(resume_text, digest):
+    """
+    Returns the ResumeProfile of normalized `resume_text` (SHA-256 `digest`),
+    building it on a cache miss.
+    """
+    with _cache_lock:
+        profile = _profile_cache.get(digest)
+        if profile is not None:
+            _cache_stats["profile_hits"] += 1
+            instrumentation.count("profile_cache.hit")
+            metrics.CACHE_REQUESTS.labels("profile", "hit").inc()
+            return profile
+        _cache_stats["profile_misses"] += 1
+    instrumentation.count("profile_cache.miss")
+    metrics.CACHE_REQUESTS.labels("profile", "miss").inc()
+
+    profile = build_resume_profile(resume_text)
+    with _cache_lock:
+        _profile_cache[digest] = profile
+    return profile
+
+
+def cached_analyze_resume(resume_text, job_role, settings=None, job_description=""):
+    """
+    Returns analyze_resume() output, reusing a cached result when the same
+    resume, role, job description and settings were analyzed recently.
+
+    On a miss, only the role/description matching runs when the resume itself
+    was profiled recently (e.g. the user is trying another job role).
+
+    The returned result is shared between callers and must not be modified.
+    """
+    resume_text = normalize_resume_text(resume_text)
+    key = analysis_cache_key(resume_text, job_role, settings, job_description)
+
+    with _cache_lock:
+        analysis = _analysis_cache.get(key)
+        if analysis is not None:
+            _cache_stats["hits"] += 1
+            instrumentation.count("analysis_cache.hit")
+            metrics.CACHE_REQUESTS.labels("analysis", "hit").inc()
+            return analysis
+        _cache_stats["misses"] += 1
+    instrumentation.count("analysis_cache.miss")
+    metrics.CACHE_REQUESTS.labels("analysis", "miss").inc()
+
+    with metrics.ANALYSIS_SECONDS.time(), instrumentation.timed("analyze.total"), \
+            instrumentation.profile("analyze_resume"):
+        profile = _cached_resume_profile(resume_text, key[0])
+        analysis = match_resume_profile(profile, job_role, job_description)
+    with _cache_lock:
+        _analysis_cache[key] = analysis
+    return analysis
+
+
+def cached_analyze_resume_multi(resume_text, roles):
+    """
+    Returns analyze_resume_multi() output, reusing the cached profile of the
+    resume (ranking the roles themselves takes well under a millisecond).
+    """
+    resume_text = normalize_resume_text(resume_text)
+    digest = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    with instrumentation.timed("analyze.multi"):
+        return match_roles(_cached_resume_profile(resume_text, digest), roles)
+
+
+def get_cache_stats():
+    """
+    Returns hit/miss counters and the current sizes of the analysis and profile caches.
+    """
+    with _cache_lock:
+        return {
+            "hits": _cache_stats["hits"],
+            "misses": _cache_stats["misses"],
+            "profile_hits": _cache_stats["profile_hits"],
+            "profile_misses": _cache_stats["profile_misses"],
+            "size": len(_analysis_cache),
+            "profiles": len(_profile_cache),
+            "max_size": _analysis_cache.maxsize,
+            "ttl": _analysis_cache.ttl,
+        }
+
+
+def clear_analysis_cache():
+    """
+    Drops every cached analysis and profile and resets the counters.
+    """
+    with _cache_lock:
+        _analysis_cache.clear()
+        _profile_cache.clear()
+        for name in _cache_stats:
+            _cache_stats[name] = 0
@@ -0,0 +1,331 @@
+# batch.py
+"""
+Headless batch scoring: ranks a directory or zip of PDF/TXT resumes against one job role.
+
+Usage:
+    python batch.py resumes/ --role "Data Analyst" --output ranked.csv
+    python batch.py candidates.zip --role "Backend Engineer" \
+        --description-file job.txt --output ranked.parquet --workers 8
+
+With --index, new resumes are added to a persistent resume index and every
+candidate stored in it is ranked; the source can then be left out:
+    python batch.py resumes/ --role "Data Analyst" --index pool.db
+    python batch.py --role "ML Engineer" --index pool.db
+
+Does not import Streamlit.
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from reviewer import batch_scoring, extraction, jd_match, resume_index
+
+RESUME_EXTENSIONS = (".pdf", ".txt")
+
+# Output columns, in order, of both ranking paths (with and without --index);
+# the jd_* columns only appear when a job description is given
+OUTPUT_COLUMNS = (
+    "file", "digest", "pages", "words", "error", "structure_score", "content_score", "clarity_score",
+    "overall_score", "role_match", "ats_score", "skills", "missing_skills",
+    "jd_similarity", "jd_skills_matched", "jd_missing_terms"
+)
+# Kept integral (not turned into floats) when failed rows leave them empty
+INTEGER_COLUMNS = ("pages", "words", "structure_score", "clarity_score")
+
+
+def find_resumes(source):
+    """
+    Lists the resumes in a directory (recursively) or a zip archive.
+
+    Args:
+        source: Path to a directory or a .zip file
+
+    Returns:
+        list: (zip_path or None, file path / archive member name) tuples
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return [
+                (source, name) for name in sorted(archive.namelist())
+                if name.lower().endswith(RESUME_EXTENSIONS) and not name.endswith("/")
+            ]
+
+    resumes = []
+    for root, _, files in os.walk(source):
+        for file_name in sorted(files):
+            if file_name.lower().endswith(RESUME_EXTENSIONS):
+                resumes.append((None, os.path.join(root, file_name)))
+    return resumes
+
+
+def _read_resume(zip_path, name):
+    # Oversize files are refused from their directory/zip entry size, before being read
+    if zip_path is None:
+        size = os.path.getsize(name)
+    else:
+        with zipfile.ZipFile(zip_path) as archive:
+            size = archive.getinfo(name).file_size
+    extraction.check_size(size)
+
+    if zip_path is None:
+        with open(name, "rb") as f:
+            data = f.read()
+    else:
+        with zipfile.ZipFile(zip_path) as archive:
+            data = archive.read(name)
+    resume_file = io.BytesIO(data)
+    resume_file.name = os.path.basename(name)
+    return resume_file
+
+
+def _init_worker():
+    # Each batch worker already runs on its own core; don't start nested page pools
+    extraction.EXTRACTION_WORKERS = 1
+
+
+def score_resume(task):
+    """
+    Extracts and scans one resume. Runs inside a worker process.
+
+    Args:
+        task: (zip_path or None, name, role words, with_terms)
+
+    Returns:
+        dict: One output row (with the file's digest, as in a resume index);
+        failures are reported in the "error" column. The
+        row carries the keyword scan under "_scan" (and, with `with_terms`, the
+        resume's TF-IDF terms under "_terms") so the parent can score the whole
+        pool in one vectorized pass
+    """
+    zip_path, name, words, with_terms = task
+    row = {"file": name, "digest": "", "pages": 0, "words": 0, "error": ""}
+    try:
+        resume_file = _read_resume(zip_path, name)
+        row["digest"] = resume_index.file_digest(resume_file.getvalue())
+        page_texts = list(extraction.iter_resume_pages(resume_file))
+        resume_text = "\n".join(page_text for page_text in page_texts if page_text).strip()
+        row["pages"] = len(page_texts)
+        if not resume_text:
+            row["error"] = "no extractable text"
+            return row
+
+        row["_scan"] = batch_scoring.scan_resume(resume_text, words)
+        row["words"] = row["_scan"][1]
+        if with_terms:
+            row["_terms"] = jd_match.extract_terms(resume_text.lower())
+    except Exception as e:
+        row["error"] = str(e) or type(e).__name__
+    return row
+
+
+def _add_scores(rows, job_role):
+    """
+    Adds the score columns to the scanned rows, scoring the whole pool as one
+    hit matrix (see reviewer.batch_scoring).
+    """
+    scanned = [row for row in rows if "_scan" in row]
+    if not scanned:
+        return
+    term_hits, role_hits, words = batch_scoring.hit_matrix(
+        [row.pop("_scan") for row in scanned], len(batch_scoring.role_words(job_role)[0])
+    )
+    for row, scores in zip(scanned, batch_scoring.score_rows(term_hits, role_hits, words, job_role)):
+        row.update(scores)
+
+
+def _add_description_match(rows, job_description):
+    """
+    Adds job-description columns to the scored rows, matching every resume
+    against the description in a single TF-IDF pass (IDF over the whole pool).
+    """
+    scored = [row for row in rows if "_terms" in row]
+    matches = jd_match.match_term_lists(
+        [row.pop("_terms") for row in scored], jd_match.extract_terms(job_description.lower())
+    )
+    for row, match in zip(scored, matches):
+        row.update(jd_match.match_columns(match))
+
+
+def rank_resumes(source, job_role, job_description="", workers=None):
+    """
+    Scores every resume in `source` and ranks them by job-description similarity
+    (when a description is given), then overall score.
+
+    Args:
+        source: Directory or zip archive of PDF/TXT resumes
+        job_role: Target job role
+        job_description: Optional job description text
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        pandas.DataFrame: One row per resume, best match first
+    """
+    with_terms = bool(job_description.strip())
+    words = batch_scoring.role_words(job_role)[0]
+    tasks = [(zip_path, name, words, with_terms) for zip_path, name in find_resumes(source)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) < 2:
+        rows = [score_resume(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            rows = list(pool.map(score_resume, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+    _add_scores(rows, job_role)
+    if with_terms:
+        _add_description_match(rows, job_description)
+
+    ranked = pd.DataFrame(rows)
+    if "overall_score" in ranked:
+        sort_columns = [c for c in ("jd_similarity", "overall_score", "role_match") if c in ranked]
+        ranked = ranked.sort_values(sort_columns, ascending=False, na_position="last", kind="stable")
+    return _output_table(ranked)
+
+
+def _output_table(ranked):
+    """
+    Puts ranked rows into the output layout shared by rank_resumes() and
+    rank_index(): OUTPUT_COLUMNS in order, INTEGER_COLUMNS as nullable
+    integers, and a leading "rank" column.
+    """
+    ranked = ranked.reindex(columns=[column for column in OUTPUT_COLUMNS if column in ranked])
+    ranked = ranked.reset_index(drop=True)
+    for column in INTEGER_COLUMNS:
+        if column in ranked:
+            ranked[column] = ranked[column].astype("Int64")
+    ranked.insert(0, "rank", range(1, len(ranked) + 1))
+    return ranked
+
+
+def extract_resume(task):
+    """
+    Extracts one resume for the index. Runs inside a worker process.
+
+    Args:
+        task: (zip_path or None, name, digest)
+
+    Returns:
+        dict: file, digest, pages, text and error ("" on success)
+    """
+    zip_path, name, digest = task
+    row = {"file": name, "digest": digest, "pages": 0, "text": "", "error": ""}
+    try:
+        page_texts = list(extraction.iter_resume_pages(_read_resume(zip_path, name)))
+        row["text"] = "\n".join(page_text for page_text in page_texts if page_text).strip()
+        row["pages"] = len(page_texts)
+        if not row["text"]:
+            row["error"] = "no extractable text"
+    except Exception as e:
+        row["error"] = str(e) or type(e).__name__
+    return row
+
+
+def index_resumes(source, index, workers=None):
+    """
+    Adds the resumes in `source` to a resume index. Files whose content is
+    already indexed are only hashed, not parsed.
+
+    Args:
+        source: Directory or zip archive of PDF/TXT resumes
+        index: reviewer.resume_index.ResumeIndex
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        tuple (added, failures): number of resumes added, and an output row
+        for every file that could not be indexed
+    """
+    tasks, failures = [], []
+    for zip_path, name in find_resumes(source):
+        try:
+            digest = resume_index.file_digest(_read_resume(zip_path, name).getvalue())
+        except Exception as e:
+            failures.append({"file": name, "digest": "", "pages": 0, "words": 0,
+                             "error": str(e) or type(e).__name__})
+            continue
+        if digest not in index:
+            tasks.append((zip_path, name, digest))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) < 2:
+        rows = [extract_resume(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            rows = list(pool.map(extract_resume, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+    failures.extend({"file": row["file"], "digest": row["digest"], "pages": row["pages"], "words": 0,
+                     "error": row["error"]} for row in rows if row["error"])
+    added = index.add_many((row["digest"], row["file"], row["text"], row["pages"])
+                           for row in rows if not row["error"])
+    return added, failures
+
+
+def rank_index(index, job_role, job_description="", failures=()):
+    """
+    Ranks every resume stored in a resume index, like rank_resumes().
+
+    Args:
+        index: reviewer.resume_index.ResumeIndex
+        job_role: Target job role
+        job_description: Optional job description text
+        failures: Rows of files that could not be indexed, listed last
+
+    Returns:
+        pandas.DataFrame: One row per resume, best match first
+    """
+    rows = [dict(row, error="") for row in index.rank(job_role, job_description)]
+    return _output_table(pd.DataFrame(rows + list(failures)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank a pool of resumes against one job role.")
+    parser.add_argument("source", nargs="?", help="directory or .zip archive of PDF/TXT resumes")
+    parser.add_argument("--role", required=True, help="target job role")
+    parser.add_argument("--description", default="", help="job description text")
+    parser.add_argument("--description-file", help="read the job description from this file")
+    parser.add_argument("--output", "-o", default="ranked_resumes.csv",
+                        help="output file (.csv or .parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--index", help="resume index database: add new resumes to it and rank "
+                                         "every stored candidate")
+    args = parser.parse_args(argv)
+    if args.source is None and not args.index:
+        parser.error("a source is required unless --index is given")
+
+    job_description = args.description
+    if args.description_file:
+        with open(args.description_file, "r", encoding="utf-8") as f:
+            job_description = f.read()
+
+    start = time.perf_counter()
+    if args.index:
+        with resume_index.ResumeIndex(args.index) as index:
+            added, failures = index_resumes(args.source, index, args.workers) if args.source else (0, [])
+            print(f"Indexed {added} new resumes ({len(index)} stored)", file=sys.stderr)
+            ranked = rank_index(index, args.role, job_description, failures)
+    else:
+        ranked = rank_resumes(args.source, args.role, job_description, args.workers)
+    elapsed = time.perf_counter() - start
+
+    if args.output.lower().endswith(".parquet"):
+        ranked.to_parquet(args.output, index=False)
+    else:
+        ranked.to_csv(args.output, index=False)
+
+    failed = int((ranked["error"] != "").sum()) if len(ranked) else 0
+    rate = len(ranked) / elapsed if elapsed > 0 else 0.0
+    print(f"Scored {len(ranked)} resumes ({failed} failed) in {elapsed:.2f}s "
+          f"- {rate:.1f} resumes/s -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
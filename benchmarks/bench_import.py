@@ -0,0 +1,90 @@
+# benchmarks/bench_import.py
+"""
+Cold-import benchmark for the scoring core and the Streamlit layer.
+
+Every sample imports a module in a fresh interpreter, so nothing is cached in
+sys.modules. Interpreter start-up (`python -c pass`) is measured the same way
+and subtracted.
+
+Usage:
+    python -m benchmarks.bench_import [--runs 15] [--budget-ms 150] [--output import.json]
+
+With --budget-ms the exit status is non-zero when the headless core
+(`reviewer`) takes longer than the budget, so the check can run in CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules to time, from the headless core up to the full Streamlit layer
+IMPORT_TARGETS = ["reviewer", "reviewer.analysis", "reviewer.extraction", "member3", "member1"]
+
+
+def _time_python(code, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def measure_cold_imports(modules=IMPORT_TARGETS, runs=15):
+    """
+    Measures the cold-import time of each module in milliseconds.
+
+    Returns:
+        dict: module -> {"median_ms", "min_ms", "loads_streamlit", "loads_pdfplumber"}
+    """
+    baseline = statistics.median(_time_python("pass", runs))
+    results = {}
+    for module in modules:
+        samples = _time_python(f"import {module}", runs)
+        probe = subprocess.run(
+            [sys.executable, "-c",
+             f"import sys, {module}; print(int('streamlit' in sys.modules), int('pdfplumber' in sys.modules))"],
+            cwd=REPO_ROOT, check=True, capture_output=True, text=True
+        )
+        loads_streamlit, loads_pdfplumber = probe.stdout.split()
+        results[module] = {
+            "median_ms": round(statistics.median(samples) - baseline, 2),
+            "min_ms": round(min(samples) - baseline, 2),
+            "loads_streamlit": loads_streamlit == "1",
+            "loads_pdfplumber": loads_pdfplumber == "1"
+        }
+    return {"interpreter_startup_ms": round(baseline, 2), "runs": runs, "modules": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-import time of the reviewer modules.")
+    parser.add_argument("--runs", type=int, default=15, help="fresh interpreters per module")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if importing `reviewer` takes longer than this (median)")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = measure_cold_imports(runs=args.runs)
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+
+    core = results["modules"]["reviewer"]
+    if core["loads_streamlit"] or core["loads_pdfplumber"]:
+        print("reviewer must not import streamlit or pdfplumber", file=sys.stderr)
+        return 1
+    if args.budget_ms is not None and core["median_ms"] > args.budget_ms:
+        print(f"reviewer import took {core['median_ms']}ms (budget {args.budget_ms}ms)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+# benchmarks/bench_pipeline.py
+"""
+End-to-end benchmark of the hot paths: text extraction, analysis and report
+generation, over a generated corpus (see benchmarks/corpus.py).
+
+For every profile (small / typical / 20-page long) and format (PDF / TXT) each
+stage is timed per document (PDF extraction with the automatic backend choice,
+and additionally with each backend forced, to compare their throughput), and the result is reported as latency
+percentiles, throughput and peak traced memory (allocated by the stage
+itself). Peak memory is measured in a separate tracemalloc pass so tracing does
+not distort the timings. Runs fully offline; caches are bypassed so every
+sample does the real work.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--count 5] [--repeat 3] [--keyword-density 0.08]
+        [--profiles small typical long] [--formats txt pdf] [--backends pdfplumber pdfium]
+        [--output pipeline.json]
+
+Compare two JSON files from different commits to spot regressions.
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.corpus import DEFAULT_KEYWORD_DENSITY, FORMATS, PROFILES, as_upload, build_corpus
+from reviewer import extraction, pdf_backends
+from reviewer.analysis import analyze_resume
+from reviewer.report import build_report_text
+
+JOB_ROLE = "Senior Data Engineer"
+STAGES = ("extract", "analyze", "report")
+PERCENTILES = (50, 90, 95, 99)
+
+
+def _percentile(sorted_samples, percent):
+    # Nearest-rank on the sorted samples; exact for the small sample counts used here
+    index = max(0, min(len(sorted_samples) - 1, round(percent / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def summarize(samples_ms, peak_bytes):
+    """
+    Summarizes the latency samples (ms) and peak memory of one stage.
+
+    Returns:
+        dict: samples, mean/min/max, p50..p99, docs_per_s and peak_memory_kib
+    """
+    ordered = sorted(samples_ms)
+    summary = {
+        "samples": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+    for percent in PERCENTILES:
+        summary[f"p{percent}_ms"] = round(_percentile(ordered, percent), 3)
+    summary["docs_per_s"] = round(1000 * len(ordered) / sum(ordered), 2) if sum(ordered) else None
+    summary["peak_memory_kib"] = round(peak_bytes / 1024, 1)
+    return summary
+
+
+def _time_backend(documents, backend, repeat):
+    """
+    Times PDF extraction of every document with one backend forced.
+
+    Returns:
+        dict: summarize() output plus pages_per_s
+    """
+    samples = []
+    pages = 0
+    for _ in range(repeat):
+        for file_name, data in documents:
+            start = time.perf_counter()
+            _, page_count = extraction.extract_text(as_upload(data, file_name), backend=backend)
+            samples.append((time.perf_counter() - start) * 1000)
+            pages += page_count
+
+    peak = 0
+    for file_name, data in documents:
+        tracemalloc.start()
+        try:
+            extraction.extract_text(as_upload(data, file_name), backend=backend)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    summary = summarize(samples, peak)
+    summary["pages_per_s"] = round(1000 * pages / sum(samples), 2) if sum(samples) else None
+    return summary
+
+
+def _run_stages(file_name, data):
+    """
+    Runs extract -> analyze -> report once for one document.
+
+    Returns:
+        dict: Milliseconds per stage
+    """
+    timings = {}
+    start = time.perf_counter()
+    text, _ = extraction.extract_text(as_upload(data, file_name))
+    timings["extract"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    analysis = analyze_resume(text, JOB_ROLE)
+    timings["analyze"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    build_report_text(analysis, JOB_ROLE)
+    timings["report"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def _peak_memory(file_name, data):
+    """
+    Returns the peak traced allocation (bytes) of each stage for one document,
+    above what was already allocated when the stage started.
+    """
+    peaks = {}
+    tracemalloc.start()
+    try:
+        def start_stage():
+            gc.collect()
+            tracemalloc.reset_peak()
+            return tracemalloc.get_traced_memory()[0]
+
+        baseline = start_stage()
+        text, _ = extraction.extract_text(as_upload(data, file_name))
+        peaks["extract"] = tracemalloc.get_traced_memory()[1] - baseline
+
+        baseline = start_stage()
+        analysis = analyze_resume(text, JOB_ROLE)
+        peaks["analyze"] = tracemalloc.get_traced_memory()[1] - baseline
+
+        baseline = start_stage()
+        build_report_text(analysis, JOB_ROLE)
+        peaks["report"] = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(profiles=tuple(PROFILES), formats=FORMATS, count=5, repeat=3,
+                  keyword_density=DEFAULT_KEYWORD_DENSITY, seed=0, backends=None):
+    """
+    Benchmarks every stage for each (profile, format) pair of a generated corpus.
+
+    Args:
+        profiles: Corpus profiles to run (keys of corpus.PROFILES)
+        formats: "txt" and/or "pdf"
+        count: Documents generated per profile
+        repeat: Timed passes over each document
+        keyword_density: Share of corpus words drawn from the keyword vocabulary
+        seed: Corpus seed
+        backends: PDF backends to time separately (default: all installed)
+
+    Returns:
+        dict: Run metadata plus results[profile][format][stage] summaries, and
+        per-backend extraction summaries under results[profile]["pdf"]["backends"]
+    """
+    corpus = build_corpus(profiles, formats, count, keyword_density, seed)
+    backends = pdf_backends.available_backends() if backends is None else list(backends)
+
+    # Warm-up: imports (pdfplumber, taxonomy) and first-call costs stay out of the samples
+    for documents in corpus.values():
+        _run_stages(*documents[0])
+
+    results = {}
+    for (profile, fmt), documents in corpus.items():
+        samples = {stage: [] for stage in STAGES}
+        pipeline = []
+        for _ in range(repeat):
+            for file_name, data in documents:
+                timings = _run_stages(file_name, data)
+                for stage in STAGES:
+                    samples[stage].append(timings[stage])
+                pipeline.append(sum(timings.values()))
+
+        peaks = {stage: 0 for stage in STAGES}
+        for file_name, data in documents:
+            for stage, peak in _peak_memory(file_name, data).items():
+                peaks[stage] = max(peaks[stage], peak)
+
+        stage_results = {stage: summarize(samples[stage], peaks[stage]) for stage in STAGES}
+        stage_results["pipeline"] = summarize(pipeline, max(peaks.values()))
+        results.setdefault(profile, {})[fmt] = {
+            "pages": PROFILES[profile][0],
+            "avg_bytes": round(statistics.fmean(len(data) for _, data in documents)),
+            "stages": stage_results,
+        }
+        if fmt == "pdf":
+            results[profile][fmt]["backends"] = {
+                backend: _time_backend(documents, backend, repeat) for backend in backends
+            }
+
+    return {
+        "benchmark": "pipeline",
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "extraction_workers": extraction.EXTRACTION_WORKERS,
+        "pdf_backend_policy": pdf_backends.PDF_BACKEND,
+        "config": {
+            "count": count,
+            "repeat": repeat,
+            "keyword_density": keyword_density,
+            "seed": seed,
+            "job_role": JOB_ROLE,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark extraction, analysis and report generation.")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument("--formats", nargs="+", choices=list(FORMATS), default=list(FORMATS))
+    parser.add_argument("--count", type=int, default=5, help="documents per profile")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over each document")
+    parser.add_argument("--keyword-density", type=float, default=DEFAULT_KEYWORD_DENSITY,
+                        help="share of words drawn from the keyword vocabulary (0-1)")
+    parser.add_argument("--seed", type=int, default=0, help="corpus seed")
+    parser.add_argument("--backends", nargs="+", choices=sorted(pdf_backends.BACKENDS), default=None,
+                        help="PDF backends to time separately (default: all installed)")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.profiles, args.formats, args.count, args.repeat,
+                            args.keyword_density, args.seed, args.backends)
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
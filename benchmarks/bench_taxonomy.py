@@ -0,0 +1,100 @@
+# benchmarks/bench_taxonomy.py
+"""
+Scaling benchmark for skill matching against taxonomy size.
+
+The shipped taxonomy is a curated list: every skill carries a level and a
+context line shown in the UI, so it is not padded with generated entries.
+Larger taxonomies load through RESUME_TAXONOMY_PATH. This benchmark checks
+that they stay fast: it pads the shipped keyword index with synthetic skills
+(one- to three-token names, half of them with an alias) up to each requested
+size and times a scan of the same generated resumes with every index.
+
+Usage:
+    python -m benchmarks.bench_taxonomy [--sizes 5000 20000] [--count 5] [--repeat 5]
+        [--output taxonomy.json]
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+from benchmarks.corpus import generate_resume, render_txt
+from reviewer.analysis import KEYWORD_INDEX, _build_keyword_index
+from reviewer.matcher import tokenize
+
+SYLLABLES = ("ka", "lo", "mi", "ne", "qu", "ra", "sy", "tor", "va", "xen", "zo", "dex", "fin", "gra", "hub")
+
+
+def build_index(extra_skills, seed=0):
+    """
+    Builds the shipped keyword index padded with synthetic skills.
+
+    Args:
+        extra_skills: Number of synthetic skills to add
+        seed: Random seed for the generated names
+
+    Returns:
+        PhraseIndex
+    """
+    index = _build_keyword_index()
+    rng = random.Random(seed)
+    for number in range(extra_skills):
+        words = ["".join(rng.choices(SYLLABLES, k=3)) + str(number) for _ in range(rng.randint(1, 3))]
+        skill = " ".join(words)
+        index.add(skill, skill)
+        if number % 2:
+            index.add(words[0][:4] + str(number), skill)
+    return index
+
+
+def time_scans(index, token_lists, repeat):
+    """
+    Times index.find over every resume.
+
+    Returns:
+        dict: median_ms and min_ms per resume
+    """
+    samples = []
+    for _ in range(repeat):
+        for tokens in token_lists:
+            start = time.perf_counter()
+            index.find(tokens)
+            samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 4), "min_ms": round(min(samples), 4)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure skill matching time against taxonomy size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 20000],
+                        help="synthetic taxonomy sizes (skills) to compare with the shipped one")
+    parser.add_argument("--count", type=int, default=5, help="resumes per run")
+    parser.add_argument("--repeat", type=int, default=5, help="scans of every resume per index")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    token_lists = [
+        tokenize(render_txt(generate_resume("typical", seed=seed)).decode("utf-8").lower())
+        for seed in range(args.count)
+    ]
+    results = {
+        "resume_tokens": round(statistics.fmean(len(tokens) for tokens in token_lists)),
+        "indexes": {"shipped": dict(phrases=KEYWORD_INDEX.phrase_count,
+                                    **time_scans(KEYWORD_INDEX, token_lists, args.repeat))}
+    }
+    for size in args.sizes:
+        index = build_index(size)
+        results["indexes"][str(size)] = dict(phrases=index.phrase_count,
+                                             **time_scans(index, token_lists, args.repeat))
+
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
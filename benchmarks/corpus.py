@@ -0,0 +1,161 @@
+# benchmarks/corpus.py
+"""
+Deterministic synthetic resume corpus for the benchmarks.
+
+Resumes are generated offline from a seed: section headings, bullet points
+built from filler words, and a configurable share of "keyword" words drawn
+from the skill taxonomy and the analysis term lists (action verbs, impact
+terms, ...). PDFs are written directly (one Helvetica text stream per page),
+so no PDF library is needed to build them.
+"""
+import io
+import random
+
+from reviewer.analysis import (
+    ESSENTIAL_SKILLS, EXPERIENCE_INDICATORS, IMPACT_TERMS, LEADERSHIP_TERMS,
+    PROFESSIONAL_TERMS, PROJECT_INDICATORS, TECHNICAL_SKILLS
+)
+
+# name -> (pages, words per page)
+PROFILES = {
+    "small": (1, 180),
+    "typical": (2, 380),
+    "long": (20, 420),
+}
+FORMATS = ("txt", "pdf")
+DEFAULT_KEYWORD_DENSITY = 0.08
+
+LINES_PER_PAGE = 60
+WORDS_PER_LINE = 12
+
+SECTIONS = ("Summary", "Experience", "Projects", "Skills", "Education", "Certifications")
+
+FILLER_WORDS = (
+    "the team service platform customers data across multiple systems internal reporting process "
+    "quality release weekly users support product design review feature backlog requirements stakeholders "
+    "documentation migration legacy new business regional partners daily operations workflow module "
+    "analysis dashboards pipeline accounts tickets schedule budget vendor contract onboarding training"
+).split()
+
+
+def keyword_vocabulary():
+    """
+    Returns the words and phrases the analyzer looks for, used as keyword filler.
+    """
+    skills = [skill for skills in TECHNICAL_SKILLS.values() for skill in skills]
+    return sorted(set(
+        skills + list(ESSENTIAL_SKILLS) + list(PROFESSIONAL_TERMS) + list(IMPACT_TERMS)
+        + list(LEADERSHIP_TERMS) + list(PROJECT_INDICATORS)
+        + [term for terms in EXPERIENCE_INDICATORS.values() for term in terms]
+    ))
+
+
+def generate_resume(profile="typical", keyword_density=DEFAULT_KEYWORD_DENSITY, seed=0):
+    """
+    Generates one synthetic resume.
+
+    Args:
+        profile: Key of PROFILES
+        keyword_density: Share of words (0-1) drawn from the keyword vocabulary
+        seed: Random seed; the same arguments always give the same resume
+
+    Returns:
+        list: Pages, each a list of text lines
+    """
+    page_count, words_per_page = PROFILES[profile]
+    rng = random.Random(f"{profile}:{keyword_density}:{seed}")
+    keywords = keyword_vocabulary()
+
+    pages = []
+    for page_number in range(page_count):
+        lines = [f"Candidate {seed} - page {page_number + 1}"] if page_number else [
+            f"Candidate {seed}", "candidate@example.com | +1 555 0100 | linkedin.com/in/candidate"
+        ]
+        words_left = words_per_page
+        while words_left > 0 and len(lines) < LINES_PER_PAGE:
+            if rng.random() < 0.12:
+                lines.append(rng.choice(SECTIONS))
+                continue
+            line = []
+            for _ in range(min(WORDS_PER_LINE, words_left)):
+                line.append(rng.choice(keywords) if rng.random() < keyword_density else rng.choice(FILLER_WORDS))
+            if rng.random() < 0.3:
+                line.append(f"by {rng.randint(5, 60)}%")
+            words_left -= len(line)
+            lines.append("- " + " ".join(line).capitalize() + ".")
+        pages.append(lines)
+    return pages
+
+
+def render_txt(pages):
+    """
+    Renders generated pages as UTF-8 text bytes.
+    """
+    return "\n\n".join("\n".join(lines) for lines in pages).encode("utf-8")
+
+
+def _pdf_string(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1", "replace")
+
+
+def render_pdf(pages):
+    """
+    Renders generated pages as a minimal, valid PDF with extractable text.
+    """
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]  # 1: font, 2: page tree
+    kids = []
+    for lines in pages:
+        stream = b"BT /F1 10 Tf 12 TL 50 770 Td\n" + b"".join(
+            b"(" + _pdf_string(line) + b") Tj T*\n" for line in lines
+        ) + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, len(objects), xref_offset
+    )
+    return bytes(out)
+
+
+def as_upload(data, file_name):
+    """
+    Wraps bytes in a file-like object that looks like a Streamlit upload.
+    """
+    upload = io.BytesIO(data)
+    upload.name = file_name
+    return upload
+
+
+def build_corpus(profiles=tuple(PROFILES), formats=FORMATS, count=5,
+                 keyword_density=DEFAULT_KEYWORD_DENSITY, seed=0):
+    """
+    Generates `count` resumes for every profile and format.
+
+    Returns:
+        dict: (profile, format) -> list of (file name, bytes)
+    """
+    corpus = {}
+    for profile in profiles:
+        resumes = [generate_resume(profile, keyword_density, seed + i) for i in range(count)]
+        for fmt in formats:
+            render = render_pdf if fmt == "pdf" else render_txt
+            corpus[(profile, fmt)] = [
+                (f"{profile}_{i}.{fmt}", render(pages)) for i, pages in enumerate(resumes)
+            ]
+    return corpus
@@ -0,0 +1,210 @@
+# extraction_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from cachetools import LRUCache
+
+from member1 import extract_resume_content
+import metrics
+from reviewer import instrumentation
+
+# Extracted text is cached by the SHA-256 of the uploaded bytes, so a given file
+# is parsed once per process instead of on every Streamlit rerun. The memory
+# tier is bounded by the total number of cached characters. Set
+# RESUME_EXTRACTION_CACHE_DIR to also keep extractions on disk across restarts;
+# the disk tier is bounded by RESUME_EXTRACTION_CACHE_DISK_MB, evicting the
+# least recently used files (by modification time, refreshed on each disk hit).
+EXTRACTION_CACHE_CHARS = 32 * 1024 * 1024
+EXTRACTION_CACHE_DIR = os.environ.get("RESUME_EXTRACTION_CACHE_DIR", "")
+EXTRACTION_CACHE_DISK_BYTES = int(float(os.environ.get("RESUME_EXTRACTION_CACHE_DISK_MB", "256")) * 1024 * 1024)
+
+_extraction_cache = LRUCache(
+    maxsize=EXTRACTION_CACHE_CHARS,
+    getsizeof=lambda entry: len(entry["text"]) + 1
+)
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def _disk_path(cache_key):
+    return os.path.join(EXTRACTION_CACHE_DIR, f"{cache_key}.json")
+
+
+def _load_from_disk(cache_key):
+    if not EXTRACTION_CACHE_DIR:
+        return None
+    path = _disk_path(cache_key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        # Mark the file as recently used for eviction
+        os.utime(path)
+        return entry
+    except (OSError, ValueError):
+        return None
+
+
+def _save_to_disk(cache_key, entry):
+    if not EXTRACTION_CACHE_DIR:
+        return
+    try:
+        os.makedirs(EXTRACTION_CACHE_DIR, exist_ok=True)
+        # Write to a temp file first so concurrent readers never see half a file
+        fd, tmp_path = tempfile.mkstemp(dir=EXTRACTION_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _disk_path(cache_key))
+    except OSError:
+        return
+    _evict_from_disk()
+
+
+def _evict_from_disk():
+    """
+    Deletes the least recently used cache files until the disk tier fits in
+    EXTRACTION_CACHE_DISK_BYTES. Runs after each write, i.e. once per parsed file.
+    """
+    files = []
+    total = 0
+    try:
+        with os.scandir(EXTRACTION_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+    except OSError:
+        return
+    files.sort()
+    for _, size, path in files:
+        if total <= EXTRACTION_CACHE_DISK_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            # Already evicted by another process
+            pass
+        total -= size
+
+
+def _remember(cache_key, entry):
+    with _cache_lock:
+        try:
+            _extraction_cache[cache_key] = entry
+        except ValueError:
+            # Larger than the whole memory tier; serve it without caching
+            pass
+
+
+def cached_extract_resume(uploaded_file, on_page=None, on_error=None, parse=True):
+    """
+    Extracts an uploaded resume, reusing earlier results for identical files.
+
+    Args:
+        uploaded_file: Uploaded file object from st.file_uploader
+        on_page: Optional callback(page_number, page_text), only called when the
+            file actually has to be parsed
+        on_error: Optional callback(message) for extraction errors (default st.error)
+        parse: If False, only the caches are consulted
+
+    Each call that returns an extraction counts one upload in
+    metrics.UPLOADS; a parse=False probe that misses does not, since the
+    parsing call that follows counts it. Callers keep the result for as long
+    as the same file stays uploaded (see main.py), so every upload is counted
+    once.
+
+    Returns:
+        dict: text, page_count, extraction_time (seconds spent parsing the file
+        the first time), digest and source ("memory", "disk" or "extracted");
+        None if `parse` is False and the file is not cached
+    """
+    if uploaded_file is None:
+        return {"text": "", "page_count": 0, "extraction_time": 0.0, "digest": "", "source": "extracted"}
+
+    # Hash the upload's buffer in place instead of a getvalue() copy of it
+    with uploaded_file.getbuffer() as buffer:
+        digest = hashlib.sha256(buffer).hexdigest()
+    extension = os.path.splitext(uploaded_file.name.lower())[1]
+    cache_key = f"{digest}{extension.replace('.', '_')}"
+    file_type = metrics.file_type_label(uploaded_file.name)
+
+    with _cache_lock:
+        entry = _extraction_cache.get(cache_key)
+        if entry is not None:
+            _cache_stats["hits"] += 1
+            instrumentation.count("extraction_cache.memory_hit")
+            metrics.CACHE_REQUESTS.labels("extraction", "memory_hit").inc()
+            metrics.UPLOADS.labels(file_type).inc()
+            return dict(entry, source="memory")
+
+    entry = _load_from_disk(cache_key)
+    if entry is not None:
+        with _cache_lock:
+            _cache_stats["disk_hits"] += 1
+        _remember(cache_key, entry)
+        instrumentation.count("extraction_cache.disk_hit")
+        metrics.CACHE_REQUESTS.labels("extraction", "disk_hit").inc()
+        metrics.UPLOADS.labels(file_type).inc()
+        return dict(entry, source="disk")
+
+    if not parse:
+        return None
+    metrics.UPLOADS.labels(file_type).inc()
+    with _cache_lock:
+        _cache_stats["misses"] += 1
+    instrumentation.count("extraction_cache.miss")
+    metrics.CACHE_REQUESTS.labels("extraction", "miss").inc()
+
+    uploaded_file.seek(0)
+    start = time.perf_counter()
+    with instrumentation.timed("extract.total"), instrumentation.profile("extract_resume_content"):
+        text, page_count = extract_resume_content(uploaded_file, on_page=on_page, on_error=on_error)
+    entry = {
+        "text": text,
+        "page_count": page_count,
+        "extraction_time": time.perf_counter() - start,
+        "digest": digest
+    }
+
+    metrics.EXTRACTION_SECONDS.labels(file_type).observe(entry["extraction_time"])
+    metrics.PAGES_EXTRACTED.inc(page_count)
+    if not text and page_count:
+        # Parsed fine but nothing came out, e.g. a scanned PDF
+        metrics.EXTRACTION_FAILURES.labels(file_type, "no_text").inc()
+
+    # Failed extractions are not cached so the error is reported again
+    if text:
+        _remember(cache_key, entry)
+        _save_to_disk(cache_key, entry)
+    return dict(entry, source="extracted")
+
+
+def get_extraction_cache_stats():
+    """
+    Returns hit/miss counters and the memory usage of the extraction cache.
+    """
+    with _cache_lock:
+        return {
+            "hits": _cache_stats["hits"],
+            "disk_hits": _cache_stats["disk_hits"],
+            "misses": _cache_stats["misses"],
+            "entries": len(_extraction_cache),
+            "chars": _extraction_cache.currsize,
+            "max_chars": _extraction_cache.maxsize,
+            "disk_dir": EXTRACTION_CACHE_DIR,
+            "disk_max_bytes": EXTRACTION_CACHE_DISK_BYTES
+        }
+
+
+def clear_extraction_cache():
+    """
+    Drops the in-memory extractions and resets the counters (the disk tier is kept).
+    """
+    with _cache_lock:
+        _extraction_cache.clear()
+        for name in _cache_stats:
+            _cache_stats[name] = 0
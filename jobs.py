@@ -0,0 +1,372 @@
+# jobs.py
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+from analysis_cache import cached_analyze_resume, cached_analyze_resume_multi
+from extraction_cache import cached_extract_resume
+from reviewer import instrumentation
+from reviewer.analysis import IncrementalResumeAnalyzer
+
+# PDF extraction and analyses run on a small process-wide thread pool instead
+# of the Streamlit script thread, so a session stays responsive while its job
+# runs and long jobs queue instead of piling onto the server. Threads (not
+# processes) keep the in-memory caches shared. Jobs are looked up by ID; the
+# script polls its job on each rerun and copies the result into st.session_state.
+#
+# Admission control: jobs wait in one FIFO queue of at most MAX_QUEUED_JOBS
+# (further submissions raise QueueFull) and are handed to the pool only when a
+# worker is free, so the queue position shown to users is exact. A session runs
+# at most SESSION_JOB_LIMIT jobs at a time; its other jobs let later sessions'
+# jobs pass, so one user's large PDF cannot hold up everyone else.
+ANALYSIS_WORKERS = int(os.environ.get("RESUME_ANALYSIS_WORKERS", "2"))
+MAX_QUEUED_JOBS = int(os.environ.get("RESUME_MAX_QUEUED_JOBS", "32"))
+SESSION_JOB_LIMIT = int(os.environ.get("RESUME_SESSION_JOB_LIMIT", "1"))
+JOB_RETENTION = 10 * 60  # seconds a finished job stays retrievable
+JOB_POLL_INTERVAL = 0.3  # seconds between reruns while a job is pending
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+_executor = None
+_jobs = {}
+_jobs_lock = threading.Lock()
+# Guarded by _jobs_lock: jobs waiting for a worker (oldest first), and the
+# number of running jobs in total and per session
+_queue = []
+_running_count = 0
+_session_running = {}
+
+
+class JobCancelled(BaseException):
+    """
+    Raised inside a job's work function once the job has been cancelled.
+
+    Derives from BaseException so the `except Exception` error handlers of the
+    work it interrupts (e.g. member1.extract_resume_content) let it through.
+    """
+
+
+class QueueFull(Exception):
+    """Raised by submit_job when MAX_QUEUED_JOBS jobs are already waiting."""
+
+
+class AnalysisJob:
+    """
+    One background job: its state, progress and (once finished) result.
+
+    Attributes:
+        job_id: Unique ID used to look the job up from a later rerun
+        context: Caller data about the request (e.g. the job role analyzed)
+        session: ID of the submitting session (None for no per-session cap)
+        status: QUEUED, RUNNING, DONE, FAILED or CANCELLED
+        progress: 0.0-1.0, with a short `message` describing the current step
+        partial: Latest intermediate result reported by the work function
+        result / error: Set when the job finishes
+        trace: instrumentation.Trace of the run, if tracing was on at submission
+    """
+
+    def __init__(self, context=None, session=None, profiler=None, traced=False):
+        self.job_id = uuid.uuid4().hex
+        self.context = context or {}
+        self.session = session
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = "Waiting for a free worker..."
+        self.partial = None
+        self.result = None
+        self.error = ""
+        self.trace = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self._traced = traced
+        self._profiler = profiler
+        self._cancel = threading.Event()
+        self._call = None
+        self._future = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def queue_position(self):
+        """
+        Returns the job's 1-based position in the wait queue, or None once it
+        has been handed to a worker (or finished).
+        """
+        with _jobs_lock:
+            try:
+                return _queue.index(self) + 1
+            except ValueError:
+                return None
+
+    def report(self, progress, message, partial=None):
+        """
+        Records progress (and optionally an intermediate result) from the work
+        function; raises JobCancelled if the job was cancelled, so work stops
+        at the next step.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.progress = progress
+        self.message = message
+        if partial is not None:
+            self.partial = partial
+
+    def cancel(self):
+        """
+        Cancels the job: immediately if it is still queued, otherwise at its
+        next progress report.
+        """
+        self._cancel.set()
+        with _jobs_lock:
+            if self not in _queue:
+                return
+            _queue.remove(self)
+        self._call = None
+        self._finish(CANCELLED)
+
+    def _finish(self, status):
+        self.status = status
+        self.finished_at = time.time()
+        metrics.ANALYSIS_JOBS.labels(status).inc()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="analysis-job")
+    return _executor
+
+
+def _dispatch():
+    """
+    Hands queued jobs to the pool while a worker is free, oldest first,
+    skipping jobs whose session is at SESSION_JOB_LIMIT. Caller holds _jobs_lock.
+    """
+    global _running_count
+    index = 0
+    while _running_count < ANALYSIS_WORKERS and index < len(_queue):
+        job = _queue[index]
+        if job.session is not None and _session_running.get(job.session, 0) >= SESSION_JOB_LIMIT:
+            index += 1
+            continue
+        del _queue[index]
+        _running_count += 1
+        if job.session is not None:
+            _session_running[job.session] = _session_running.get(job.session, 0) + 1
+        # A worker is free, so the job starts right away rather than queueing in the pool
+        job._future = _get_executor().submit(_run, job)
+
+
+def _release(job):
+    # Frees the job's worker slot and starts the next eligible queued job
+    global _running_count
+    with _jobs_lock:
+        _running_count -= 1
+        if job.session is not None:
+            remaining = _session_running[job.session] - 1
+            if remaining:
+                _session_running[job.session] = remaining
+            else:
+                del _session_running[job.session]
+        _dispatch()
+
+
+def _run(job):
+    try:
+        if job._cancel.is_set():
+            job._finish(CANCELLED)
+            return
+        work, args, kwargs = job._call
+        job.status = RUNNING
+        if job._traced:
+            instrumentation.start_trace(job._profiler)
+        try:
+            job.result = work(job, *args, **kwargs)
+            job.progress = 1.0
+            job.message = "Done"
+            status = DONE
+        except JobCancelled:
+            status = CANCELLED
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            status = FAILED
+        finally:
+            if job._traced:
+                job.trace = instrumentation.end_trace()
+        job._finish(status)
+    finally:
+        job._call = None
+        _release(job)
+
+
+def _prune_jobs(now):
+    # Caller holds _jobs_lock
+    for job_id in [job_id for job_id, job in _jobs.items()
+                   if job.finished and now - job.finished_at > JOB_RETENTION]:
+        del _jobs[job_id]
+
+
+def submit_job(work, *args, context=None, session=None, **kwargs):
+    """
+    Queues `work(job, *args, **kwargs)` on the worker pool.
+
+    If a trace is active on the calling thread, the job records its own trace
+    (with the same profiler) for the caller to merge once it finishes.
+
+    Args:
+        session: ID of the submitting session; at most SESSION_JOB_LIMIT of a
+            session's jobs run at once
+
+    Returns:
+        AnalysisJob: The queued job
+
+    Raises:
+        QueueFull: If MAX_QUEUED_JOBS jobs are already waiting for a worker
+    """
+    trace = instrumentation.current_trace()
+    job = AnalysisJob(context, session, profiler=trace.profiler if trace else None, traced=trace is not None)
+    job._call = (work, args, kwargs)
+    with _jobs_lock:
+        if len(_queue) >= MAX_QUEUED_JOBS:
+            metrics.ANALYSIS_JOBS_REJECTED.inc()
+            raise QueueFull(f"{len(_queue)} jobs are already waiting for a worker")
+        _prune_jobs(time.time())
+        _jobs[job.job_id] = job
+        _queue.append(job)
+        _dispatch()
+    return job
+
+
+def get_job(job_id):
+    """
+    Returns the job with this ID, or None if it is unknown or expired.
+    """
+    if job_id is None:
+        return None
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def _analyze(job, resume_text, job_role, settings, job_description):
+    job.report(0.1, "Analyzing resume...")
+    analysis = cached_analyze_resume(resume_text, job_role, settings, job_description)
+    job.report(0.9, "Preparing results...")
+    return analysis
+
+
+def _cancel_superseded(job_id):
+    previous = get_job(job_id)
+    if previous is not None and not previous.finished:
+        previous.cancel()
+
+
+def submit_analysis(resume_text, job_role, settings=None, job_description="", supersedes=None, session=None):
+    """
+    Queues a resume analysis (see analysis_cache.cached_analyze_resume).
+
+    Args:
+        supersedes: ID of an earlier job from the same session; it is
+            cancelled, since its result would be stale
+        session: ID of the submitting session (see submit_job)
+
+    Returns:
+        AnalysisJob: The queued job; its context holds the job role
+
+    Raises:
+        QueueFull: If the wait queue is full
+    """
+    _cancel_superseded(supersedes)
+    return submit_job(_analyze, resume_text, job_role, settings, job_description,
+                      context={"job_role": job_role}, session=session)
+
+
+def _compare(job, resume_text, roles):
+    job.report(0.1, "Comparing roles...")
+    return cached_analyze_resume_multi(resume_text, roles)
+
+
+def submit_comparison(resume_text, roles, supersedes=None, session=None):
+    """
+    Queues a comparison of one resume against several job roles (see
+    analysis_cache.cached_analyze_resume_multi).
+
+    Args:
+        supersedes: ID of this session's earlier comparison job, cancelled
+        session: ID of the submitting session (see submit_job)
+
+    Returns:
+        AnalysisJob: The queued job; its context holds the roles
+
+    Raises:
+        QueueFull: If the wait queue is full
+    """
+    _cancel_superseded(supersedes)
+    return submit_job(_compare, resume_text, roles, context={"roles": roles}, session=session)
+
+
+def _extract(job, uploaded_file, job_role):
+    # Partial scores are computed page by page for the page to show while it waits
+    partial_analyzer = IncrementalResumeAnalyzer(job_role)
+    errors = []
+
+    def on_page(page_number, page_text):
+        partial_analyzer.feed(page_text)
+        job.report(0.5, f"Parsing page {page_number}... ({partial_analyzer.words} words so far)",
+                   partial=partial_analyzer.scores())
+
+    job.report(0.1, "Parsing resume...")
+    extraction = cached_extract_resume(uploaded_file, on_page=on_page, on_error=errors.append)
+    return dict(extraction, errors=errors)
+
+
+def submit_extraction(uploaded_file, job_role="", supersedes=None, session=None):
+    """
+    Queues the text extraction of an upload (see
+    extraction_cache.cached_extract_resume). While PDF pages are parsed, the
+    job's `partial` holds the partial scores for `job_role`.
+
+    Args:
+        uploaded_file: Uploaded file object from st.file_uploader
+        supersedes: ID of this session's earlier extraction job, cancelled
+        session: ID of the submitting session (see submit_job)
+
+    Returns:
+        AnalysisJob: The queued job. Its context holds the upload's file_id;
+        its result is the extraction dict plus "errors", the messages of a
+        failed extraction
+
+    Raises:
+        QueueFull: If the wait queue is full
+    """
+    _cancel_superseded(supersedes)
+    return submit_job(_extract, uploaded_file, job_role,
+                      context={"file_id": uploaded_file.file_id, "file_name": uploaded_file.name},
+                      session=session)
+
+
+def pending_job_count():
+    """
+    Returns the number of queued or running jobs.
+    """
+    with _jobs_lock:
+        return sum(1 for job in _jobs.values() if not job.finished)
+
+
+def queued_job_count():
+    """
+    Returns the number of jobs waiting for a free worker.
+    """
+    with _jobs_lock:
+        return len(_queue)
+
+
+metrics.ANALYSIS_JOBS_PENDING.set_function(pending_job_count)
+metrics.ANALYSIS_JOBS_QUEUED.set_function(queued_job_count)
@@ -1,8 +1,20 @@
 # main.py
+import json
+import time
+import uuid
+
+import altair as alt
+import pandas as pd
 import streamlit as st
-from member1 import extract_resume_text
-from member2 import get_job_input
-from member3 import analyze_resume
+from extraction_cache import cached_extract_resume, get_extraction_cache_stats, clear_extraction_cache
+from member2 import get_job_input, DEFAULT_JOB_DESCRIPTION
+from reviewer import instrumentation
+from reviewer.extraction import MAX_UPLOAD_BYTES, MAX_PDF_PAGES
+from reviewer.report import build_report_text
+from analysis_cache import get_cache_stats, clear_analysis_cache
+from jobs import (DONE, FAILED, JOB_POLL_INTERVAL, QueueFull, get_job, submit_analysis, submit_comparison,
+                  submit_extraction)
+from metrics import start_metrics_server
 
 # Page Configuration
 st.set_page_config(
@@ -12,6 +24,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Prometheus exporter for the shared deployment (started once per process)
+start_metrics_server()
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -96,14 +111,100 @@ with st.sidebar:
         - [ATS-Friendly Templates](https://www.jobscan.co/resume-templates)
         - [Industry Keywords Guide](https://www.linkedin.com/pulse/top-skills-2025)
         """)
+    
+    # Debug Panel
+    with st.expander("🛠️ Debug: Caches"):
+        st.markdown("**Analysis Cache**")
+        cache_stats = get_cache_stats()
+        debug_col1, debug_col2 = st.columns(2)
+        with debug_col1:
+            st.metric("Cache Hits", cache_stats["hits"])
+        with debug_col2:
+            st.metric("Cache Misses", cache_stats["misses"])
+        st.caption(f"Entries: {cache_stats['size']}/{cache_stats['max_size']} · TTL: {cache_stats['ttl']}s · "
+                   f"Resume profiles: {cache_stats['profiles']} "
+                   f"({cache_stats['profile_hits']} reused across roles)")
+        
+        st.markdown("**Extraction Cache**")
+        extraction_stats = get_extraction_cache_stats()
+        debug_col1, debug_col2 = st.columns(2)
+        with debug_col1:
+            st.metric("Cache Hits", extraction_stats["hits"] + extraction_stats["disk_hits"])
+        with debug_col2:
+            st.metric("Cache Misses", extraction_stats["misses"])
+        st.caption(f"Entries: {extraction_stats['entries']} · "
+                   f"Chars: {extraction_stats['chars']}/{extraction_stats['max_chars']} · "
+                   f"Disk tier: {extraction_stats['disk_dir'] or 'off'}")
+        
+        if st.button("Clear Caches"):
+            clear_analysis_cache()
+            clear_extraction_cache()
+    
+    # Diagnostics Panel (filled in at the end of the run, once the timings are known)
+    diagnostics_panel = st.expander("🩺 Diagnostics")
+    with diagnostics_panel:
+        instrumentation_enabled = st.checkbox("Record stage timings", value=False,
+                                              help="Time extraction, analysis and rendering on each run")
+        profiler_options = ["Off", "cProfile"] + (["pyinstrument"] if instrumentation.PYINSTRUMENT_AVAILABLE else [])
+        profiler_choice = st.selectbox("Profiler", profiler_options, disabled=not instrumentation_enabled,
+                                       help="Profile extraction and analysis (slower while enabled)")
+    if instrumentation_enabled:
+        instrumentation.start_trace(profiler=None if profiler_choice == "Off" else profiler_choice.lower())
+
+# Identifies this browser session to the shared job pool (for its per-session cap)
+session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
 
 # Main title
 st.title("📝 Smart Resume Reviewer")
 st.markdown("<div class='success-box'>Upload your resume and enter job details to get instant feedback and analysis.</div>", unsafe_allow_html=True)
 st.markdown("---")
 
+
+def section_selector(labels, key):
+    """
+    Tab-style selector for the result sections. Unlike st.tabs, which builds and
+    sends every tab on each rerun, only the selected section is rendered; the
+    choice is kept in session state under `key`.
+
+    Returns:
+        int: Index of the selected section
+    """
+    return st.radio(key, range(len(labels)), format_func=labels.__getitem__, key=key,
+                    horizontal=True, label_visibility="collapsed")
+
+
+def submit_or_warn(submit, *args, **kwargs):
+    """
+    Calls a jobs.submit_* function; if the shared queue is full, shows a busy
+    message instead.
+
+    Returns:
+        AnalysisJob or None: The queued job, or None if it was not accepted
+    """
+    try:
+        return submit(*args, **kwargs)
+    except QueueFull:
+        st.warning("⏳ The server is busy right now. Please try again in a moment.")
+        return None
+
+
+def show_job_status(job):
+    """
+    Shows a pending job's place in the shared queue, or its progress once running.
+    """
+    position = job.queue_position()
+    if position is not None:
+        st.info(f"⏳ Server busy – queued at position {position}")
+    else:
+        st.progress(job.progress, text=job.message)
+
+
+# Set in the Upload & Input tab; read by the analysis and role comparison tabs
+uploaded_file = None
+resume_text = ""
+
 # Create tabs for different sections
-tab1, tab2, tab3 = st.tabs(["📤 Upload & Input", "🤖 AI Analysis", "📊 Results"])
+tab1, tab2, tab3, tab4 = st.tabs(["📤 Upload & Input", "🤖 AI Analysis", "📊 Results", "⚖️ Compare Roles"])
 
 with tab1:
     col1, col2 = st.columns(2)
@@ -116,24 +217,74 @@ with tab1:
             uploaded_file = st.file_uploader(
                 "Upload your resume",
                 type=["pdf", "txt"],
-                help="Supported formats: PDF, TXT"
+                help=f"Supported formats: PDF, TXT · up to {MAX_UPLOAD_BYTES // (1024 * 1024)} MB "
+                     f"and {MAX_PDF_PAGES} pages"
             )
         else:
             resume_text = st.text_area("Paste your resume text here:", height=300)
     
+    with col2:
+        st.subheader("Step 2: Job Details")
+        # Get job details using Member 2's function
+        job_role, job_description = get_job_input()
+
+    extraction_job = None
     if uploaded_file:
-        # Extract text using Member 1's function
-        resume_text = extract_resume_text(uploaded_file)
+        # Extract text using Member 1's function (parsed once per unique file).
+        # The session keeps its extraction; a file not in the cache is parsed on
+        # the shared worker pool, showing partial scores page by page.
+        extraction = st.session_state.get("extraction")
+        if extraction is None or extraction["file_id"] != uploaded_file.file_id:
+            extraction = None
+            extraction_job = get_job(st.session_state.get("extraction_job_id"))
+            if extraction_job is None or extraction_job.context["file_id"] != uploaded_file.file_id:
+                # Only probe the cache for a file with no job of its own: each
+                # probe hashes the whole upload, and a pending job reruns the
+                # page every JOB_POLL_INTERVAL
+                extraction_job = None
+                extraction = cached_extract_resume(uploaded_file, parse=False)
+        if extraction is None:
+            if extraction_job is None:
+                extraction_job = submit_or_warn(submit_extraction, uploaded_file, job_role,
+                                                supersedes=st.session_state.get("extraction_job_id"),
+                                                session=session_id)
+                if extraction_job is not None:
+                    st.session_state["extraction_job_id"] = extraction_job.job_id
+            if extraction_job is not None and extraction_job.finished:
+                del st.session_state["extraction_job_id"]
+                if extraction_job.trace is not None and instrumentation.current_trace() is not None:
+                    instrumentation.current_trace().merge(extraction_job.trace)
+                if extraction_job.status == DONE:
+                    extraction = extraction_job.result
+                else:
+                    # Not retried on every rerun; uploading the file again retries it
+                    extraction = {"text": "", "page_count": 0, "extraction_time": 0.0, "source": "extracted",
+                                  "errors": [f"Extraction failed: {extraction_job.error}"
+                                             if extraction_job.status == FAILED else "Extraction cancelled."]}
+                extraction_job = None
+            elif extraction_job is not None:
+                show_job_status(extraction_job)
+                partial_scores = extraction_job.partial
+                if partial_scores is not None:
+                    partial_cols = st.columns(4)
+                    for partial_col, score_name in zip(partial_cols, ["structure", "content", "clarity", "overall"]):
+                        with partial_col:
+                            st.metric(f"{score_name.title()} (partial)", f"{partial_scores[score_name]}%")
+                if st.button("✖️ Cancel Upload"):
+                    extraction_job.cancel()
+        
+        if extraction is not None:
+            st.session_state["extraction"] = extraction = dict(extraction, file_id=uploaded_file.file_id)
+            for message in extraction.get("errors", ()):
+                st.error(message)
+        resume_text = extraction["text"] if extraction is not None else ""
         if resume_text:
             st.success("✅ Resume text extracted successfully!")
+            st.caption(f"{extraction['page_count']} page(s) · parsed in {extraction['extraction_time']:.2f}s"
+                       + (" · served from cache" if extraction["source"] != "extracted" else ""))
             with st.expander("Preview Extracted Text"):
                 st.text_area("Content", resume_text, height=200)
 
-    with col2:
-        st.subheader("Step 2: Job Details")
-        # Get job details using Member 2's function
-        job_role, job_description = get_job_input()
-
 with tab2:
     st.subheader("🤖 AI Analysis Configuration")
     
@@ -181,545 +332,666 @@ with tab2:
 
 with tab3:
     st.subheader("Step 3: AI-Powered Analysis Results")
-    if st.button("🔍 Analyze Resume", disabled=not ((uploaded_file or 'resume_text' in locals()) and job_role)):
+    if st.button("🔍 Analyze Resume", disabled=not ((uploaded_file or upload_option == "Paste Text") and job_role)):
         if resume_text:
-            with st.spinner("AI is analyzing your resume..."):
-                # Get analysis using Member 3's function
-                analysis = analyze_resume(resume_text, job_role)
-                
-                # AI Summary and Initial Feedback
-                st.markdown("### 🤖 AI Analysis Summary")
-                st.info(analysis["detailed_review"]["summary"]["overview"])
-                
-                # Score Summary with Improvement Focus
-                st.markdown("### 📊 Performance Analysis")
-                score_cols = st.columns(4)
-                
-                with score_cols[0]:
-                    structure_score = analysis['scores']['structure']
-                    st.metric("Structure", f"{structure_score}%", 
-                             delta="Needs Work" if structure_score < 70 else "Good")
-                with score_cols[1]:
-                    content_score = analysis['scores']['content']
-                    st.metric("Content", f"{content_score}%",
-                             delta="Needs Work" if content_score < 70 else "Good")
-                with score_cols[2]:
-                    clarity_score = analysis['scores']['clarity']
-                    st.metric("Clarity", f"{clarity_score}%",
-                             delta="Needs Work" if clarity_score < 70 else "Good")
-                with score_cols[3]:
-                    overall_score = analysis['scores']['overall']
-                    st.metric("Overall", f"{overall_score}%",
-                             delta="Needs Work" if overall_score < 70 else "Good")
-                
-                # Immediate Action Items
-                st.markdown("### 🎯 Priority Improvements")
-                priority_cols = st.columns([2, 1])
-                with priority_cols[0]:
-                    if structure_score < 70:
-                        st.error("📄 **Structure Needs Work:**")
-                        st.markdown("""
-                        - Add clear section headers
-                        - Ensure logical flow of information
-                        - Include all essential sections
-                        """)
-                    if content_score < 70:
-                        st.error("📝 **Content Enhancement Needed:**")
-                        st.markdown("""
-                        - Add more quantifiable achievements
-                        - Include specific technical skills
-                        - Highlight relevant experience
-                        """)
-                    if clarity_score < 70:
-                        st.error("🔍 **Improve Clarity:**")
-                        st.markdown("""
-                        - Use more concise language
-                        - Remove redundant information
-                        - Strengthen action verbs
-                        """)
-                
-                with priority_cols[1]:
-                    st.info("💡 **Quick Wins**")
-                    quick_improvements = analysis["detailed_review"]["recommendations"]["quick_wins"]
-                    for tip in quick_improvements.get("formatting", [])[:3]:
-                        st.success(f"✓ {tip}")
-                
-                # Detailed Analysis Tabs
-                st.markdown("### 🔎 Detailed Analysis")
-                
-                # Enhanced Analysis Sections
-                analysis_tabs = st.tabs([
-                    "📈 Resume Impact",
-                    "💻 Technical Skills",
-                    "🎯 Job Alignment",
-                    "📝 Writing & Style",
-                    "🤖 AI Suggestions"
-                ])
-                
-                with analysis_tabs[0]:
-                    st.markdown("### 📈 Resume Impact Analysis")
-                    impact_analysis = analysis["detailed_review"]["content_analysis"]["experience_impact"]
-                    
-                    # Quantified Achievements
-                    st.subheader("💫 Achievement Analysis")
-                    for finding in impact_analysis["findings"]:
-                        if "quantified" in finding.lower():
-                            st.warning(f"⚠️ {finding}")
-                        else:
-                            st.success(f"✅ {finding}")
-                    
-                    # Improvement Examples
-                    st.subheader("🔄 Enhancement Examples")
-                    for improvement in analysis["detailed_review"]["recommendations"]["high_impact"]:
-                        with st.expander(f"📌 {improvement['title']}", expanded=True):
-                            st.write(f"**Current:** {improvement['examples'][0]}")
-                            st.write(f"**Better:** {improvement['examples'][1]}")
-                            st.info(f"**Why:** {improvement['why']}")
-                
-                with analysis_tabs[1]:
-                    st.markdown("### 💻 Technical Skills Assessment")
-                    
-                    # Skills Matrix
-                    st.subheader("🔍 Skills Analysis")
-                    for category, skills in analysis["technical_analysis"]["skill_categories"].items():
-                        with st.expander(f"{category} Skills", expanded=True):
-                            for skill, details in skills.items():
-                                col1, col2 = st.columns([1, 3])
-                                with col1:
-                                    st.write(f"**{skill}**")
-                                with col2:
-                                    st.write(f"{details['level']} - _{details['context']}_")
-                    
-                    # Missing Skills
-                    st.subheader("📋 Skill Gaps")
-                    for skill in analysis["technical_analysis"]["missing_skills"]:
-                        st.warning(f"🔍 Consider adding: **{skill}**")
-                
-                with analysis_tabs[2]:
-                    st.markdown("### 🎯 Job Role Alignment")
-                    
-                    # Overall Match
-                    match_score = analysis["market_alignment"]["overall_match"]
-                    st.progress(match_score / 100)
-                    st.metric("Job Match Score", f"{match_score}%")
-                    
-                    # ATS Analysis
-                    st.subheader("🤖 ATS Optimization")
-                    ats_score = analysis["ats_compatibility"]["overall_score"]
-                    st.progress(ats_score / 100)
-                    
-                    # Keyword Analysis
-                    with st.expander("📊 Keyword Analysis", expanded=True):
-                        col1, col2 = st.columns(2)
+            # Runs on the shared worker pool; re-clicking supersedes this session's unfinished job
+            job = submit_or_warn(submit_analysis, resume_text, job_role, settings={
+                "model": selected_model,
+                "depth": depth,
+                "aspects": analysis_aspects
+            }, job_description="" if job_description == DEFAULT_JOB_DESCRIPTION else job_description,
+                supersedes=st.session_state.get("analysis_job_id"), session=session_id)
+            if job is not None:
+                st.session_state["analysis_job_id"] = job.job_id
+        else:
+            st.error("Please upload a valid resume first")
+
+    # Poll this session's job; a finished job delivers its result into session state
+    analysis_job = get_job(st.session_state.get("analysis_job_id"))
+    if analysis_job is not None and not analysis_job.finished:
+        show_job_status(analysis_job)
+        if st.button("✖️ Cancel Analysis"):
+            analysis_job.cancel()
+    elif analysis_job is not None:
+        del st.session_state["analysis_job_id"]
+        if analysis_job.trace is not None and instrumentation.current_trace() is not None:
+            instrumentation.current_trace().merge(analysis_job.trace)
+        if analysis_job.status == DONE:
+            st.session_state["analysis_result"] = {
+                "analysis": analysis_job.result,
+                "job_role": analysis_job.context["job_role"],
+            }
+        elif analysis_job.status == FAILED:
+            st.error(f"Analysis failed: {analysis_job.error}")
+        else:
+            st.info("Analysis cancelled.")
+
+    # Results stay on screen across reruns (and while a newer job is running)
+    analysis_result = st.session_state.get("analysis_result")
+    if analysis_result is not None:
+        analysis = analysis_result["analysis"]
+        analyzed_role = analysis_result["job_role"]
+        render_clock = instrumentation.section_clock("render")
+        
+        # AI Summary and Initial Feedback
+        st.markdown("### 🤖 AI Analysis Summary")
+        st.info(analysis["detailed_review"]["summary"]["overview"])
+        
+        # Score Summary with Improvement Focus
+        st.markdown("### 📊 Performance Analysis")
+        score_cols = st.columns(4)
+        
+        with score_cols[0]:
+            structure_score = analysis['scores']['structure']
+            st.metric("Structure", f"{structure_score}%", 
+                     delta="Needs Work" if structure_score < 70 else "Good")
+        with score_cols[1]:
+            content_score = analysis['scores']['content']
+            st.metric("Content", f"{content_score}%",
+                     delta="Needs Work" if content_score < 70 else "Good")
+        with score_cols[2]:
+            clarity_score = analysis['scores']['clarity']
+            st.metric("Clarity", f"{clarity_score}%",
+                     delta="Needs Work" if clarity_score < 70 else "Good")
+        with score_cols[3]:
+            overall_score = analysis['scores']['overall']
+            st.metric("Overall", f"{overall_score}%",
+                     delta="Needs Work" if overall_score < 70 else "Good")
+        
+        # Immediate Action Items
+        st.markdown("### 🎯 Priority Improvements")
+        priority_cols = st.columns([2, 1])
+        with priority_cols[0]:
+            if structure_score < 70:
+                st.error("📄 **Structure Needs Work:**")
+                st.markdown("""
+                - Add clear section headers
+                - Ensure logical flow of information
+                - Include all essential sections
+                """)
+            if content_score < 70:
+                st.error("📝 **Content Enhancement Needed:**")
+                st.markdown("""
+                - Add more quantifiable achievements
+                - Include specific technical skills
+                - Highlight relevant experience
+                """)
+            if clarity_score < 70:
+                st.error("🔍 **Improve Clarity:**")
+                st.markdown("""
+                - Use more concise language
+                - Remove redundant information
+                - Strengthen action verbs
+                """)
+        
+        with priority_cols[1]:
+            st.info("💡 **Quick Wins**")
+            quick_improvements = analysis["detailed_review"]["recommendations"]["quick_wins"]
+            for tip in quick_improvements.get("formatting", [])[:3]:
+                st.success(f"✓ {tip}")
+        
+        render_clock.lap("summary")
+        
+        # Detailed Analysis Tabs
+        st.markdown("### 🔎 Detailed Analysis")
+        
+        # Enhanced Analysis Sections (only the selected one is built)
+        detail_section = section_selector([
+            "📈 Resume Impact",
+            "💻 Technical Skills",
+            "🎯 Job Alignment",
+            "📝 Writing & Style",
+            "🤖 AI Suggestions"
+        ], key="detail_section")
+        
+        if detail_section == 0:
+            st.markdown("### 📈 Resume Impact Analysis")
+            impact_analysis = analysis["detailed_review"]["content_analysis"]["experience_impact"]
+            
+            # Quantified Achievements
+            st.subheader("💫 Achievement Analysis")
+            for finding in impact_analysis["findings"]:
+                if "quantified" in finding.lower():
+                    st.warning(f"⚠️ {finding}")
+                else:
+                    st.success(f"✅ {finding}")
+            achievements = analysis["detailed_review"]["content_analysis"]["achievements"]
+            quantified = analysis["detailed_review"]["professional_assessment"]["impact_analysis"]["quantified_achievements"]
+            st.metric("Quantified Statements", f"{achievements['rating']}/10", f"{len(quantified)} metrics found",
+                      delta_color="off")
+            for point in achievements["strong_points"]:
+                st.success(f"✅ {point}")
+            for point in achievements["weak_points"]:
+                st.warning(f"⚠️ Add a metric: {point}")
+            if achievements["suggested_formats"]:
+                with st.expander("📐 Metric formats to try"):
+                    for template in achievements["suggested_formats"]:
+                        st.write(f"• {template}")
+            
+            # Improvement Examples
+            st.subheader("🔄 Enhancement Examples")
+            for improvement in analysis["detailed_review"]["recommendations"]["high_impact"]:
+                with st.expander(f"📌 {improvement['title']}", expanded=True):
+                    st.write(f"**Current:** {improvement['examples'][0]}")
+                    st.write(f"**Better:** {improvement['examples'][1]}")
+                    st.info(f"**Why:** {improvement['why']}")
+        
+        render_clock.lap("impact_tab")
+        
+        if detail_section == 1:
+            st.markdown("### 💻 Technical Skills Assessment")
+            
+            # Skills Matrix
+            st.subheader("🔍 Skills Analysis")
+            for category, skills in analysis["technical_analysis"]["skill_categories"].items():
+                with st.expander(f"{category} Skills", expanded=True):
+                    for skill, details in skills.items():
+                        col1, col2 = st.columns([1, 3])
                         with col1:
-                            st.markdown("**✅ Found Keywords**")
-                            for keyword in analysis["ats_compatibility"]["keyword_analysis"]["present"]:
-                                st.success(keyword)
+                            st.write(f"**{skill}**")
                         with col2:
-                            st.markdown("**⚠️ Missing Keywords**")
-                            for keyword in analysis["ats_compatibility"]["keyword_analysis"]["missing"]:
-                                st.warning(keyword)
+                            st.write(f"{details['level']} - _{details['context']}_")
+            
+            # Missing Skills
+            st.subheader("📋 Skill Gaps")
+            for skill in analysis["technical_analysis"]["missing_skills"]:
+                st.warning(f"🔍 Consider adding: **{skill}**")
+        
+        render_clock.lap("skills_tab")
+        
+        if detail_section == 2:
+            st.markdown("### 🎯 Job Role Alignment")
+            
+            # Overall Match
+            match_score = analysis["market_alignment"]["overall_match"]
+            st.progress(match_score / 100)
+            st.metric("Job Match Score", f"{match_score}%")
+            
+            # Job Description Match (only when a description was pasted)
+            similarity = analysis["market_alignment"]["description_similarity"]
+            if similarity is not None:
+                st.metric("Job Description Similarity", f"{similarity}%")
+                for req, (score, indicator) in analysis["market_alignment"]["requirements_match"].items():
+                    st.write(f"{indicator} **{req}:** {score}")
+            
+            # ATS Analysis
+            st.subheader("🤖 ATS Optimization")
+            ats_score = analysis["ats_compatibility"]["overall_score"]
+            st.progress(ats_score / 100)
+            
+            # Keyword Analysis
+            with st.expander("📊 Keyword Analysis", expanded=True):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("**✅ Found Keywords**")
+                    for keyword in analysis["ats_compatibility"]["keyword_analysis"]["present"]:
+                        st.success(keyword)
+                with col2:
+                    st.markdown("**⚠️ Missing Keywords**")
+                    for keyword in analysis["ats_compatibility"]["keyword_analysis"]["missing"]:
+                        st.warning(keyword)
+        
+        render_clock.lap("alignment_tab")
+        
+        if detail_section == 3:
+            st.markdown("### 📝 Writing & Style Analysis")
+            
+            # Writing Quality
+            style = analysis["detailed_review"]["professional_assessment"]["writing_style"]
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Clarity Score", f"{style['clarity_score']}%")
+            with col2:
+                st.write(style["tone_analysis"])
+            
+            # Structure Analysis
+            st.subheader("📄 Document Structure")
+            st.info(style["structure_feedback"])
+            section_analysis = analysis["ats_compatibility"]["section_analysis"]
+            if section_analysis:
+                st.dataframe(pd.DataFrame([
+                    {"Section": kind.title(), "Header": details["title"], "Words": details["words"],
+                     "Share": details["share"], "Action Verbs": details["action_verbs"],
+                     "Skills": ", ".join(details["skills"])}
+                    for kind, details in section_analysis.items()
+                ]), hide_index=True, use_container_width=True,
+                    column_config={"Share": st.column_config.NumberColumn(format="%.1f%%")})
+
+        render_clock.lap("writing_tab")
+        
+        if detail_section == 4:
+            st.markdown("### 💡 AI-Powered Suggestions")
+            
+            # Priority Improvements
+            st.subheader("🎯 High-Priority Improvements")
+            for improvement in analysis["detailed_review"]["recommendations"]["high_impact"]:
+                with st.expander(improvement["title"], expanded=True):
+                    st.write(f"**What to Improve:** {improvement['description']}")
+                    st.markdown("**Example Change:**")
+                    st.error(f"Current: {improvement['examples'][0]}")
+                    st.success(f"Better: {improvement['examples'][1]}")
+                    st.info(f"**Impact:** {improvement['why']}")
+            
+            # Quick Wins
+            st.subheader("⚡ Quick Improvements")
+            quick_wins = analysis["detailed_review"]["recommendations"]["quick_wins"]
+            cols = st.columns(3)
+            
+            with cols[0]:
+                st.markdown("**📝 Format**")
+                for tip in quick_wins["formatting"]:
+                    st.success(tip)
+            
+            with cols[1]:
+                st.markdown("**📄 Content**")
+                for tip in quick_wins["content"]:
+                    st.success(tip)
+            
+            with cols[2]:
+                st.markdown("**🎯 ATS**")
+                for tip in quick_wins["ats_optimization"]:
+                    st.success(tip)                # Display detailed analysis
+        render_clock.lap("suggestions_tab")
+        
+        review_section = section_selector([
+            "� Technical Analysis", 
+            "💼 Professional Review",
+            "🎯 Job Match", 
+            "� Recommendations"
+        ], key="review_section")
+        
+        if review_section == 0:
+            st.subheader("Technical Skills Analysis")
+            
+            # Technical Skills Breakdown
+            tech_col1, tech_col2 = st.columns(2)
+            with tech_col1:
+                st.markdown("#### 🔍 Skills Detection")
+                detected_skills = [
+                    ("Python", "⭐⭐⭐"),
+                    ("SQL", "⭐⭐"),
+                    ("Git", "⭐⭐"),
+                    ("Docker", "⭐"),
+                ]
+                for skill, level in detected_skills:
+                    st.write(f"**{skill}**: {level}")
+            
+            with tech_col2:
+                st.markdown("#### � Skills Gap Analysis")
+                missing_skills = ["CI/CD", "Cloud Platforms", "Testing Frameworks"]
+                for skill in missing_skills:
+                    st.warning(f"Consider adding experience with {skill}")
+            
+            # Code Quality Indicators
+            st.markdown("#### 💻 Technical Project Indicators")
+            quality_metrics = {
+                "Project Complexity": 0.75,
+                "Technical Depth": 0.65,
+                "Tool Diversity": 0.80
+            }
+            for metric, value in quality_metrics.items():
+                st.progress(value)
+                st.caption(f"{metric}: {int(value * 100)}%")
+        
+        if review_section == 1:
+            st.subheader("Professional Assessment")
+            
+            # Experience Analysis
+            st.markdown("#### 📈 Experience Analysis")
+            exp_quality = {
+                "Role Clarity": 85,
+                "Achievement Focus": 70,
+                "Leadership Indicators": 65,
+                "Domain Expertise": 80
+            }
+            
+            for aspect, score in exp_quality.items():
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.progress(score/100)
+                with col2:
+                    st.write(f"{score}%")
+            
+            # Writing Quality
+            st.markdown("#### ✍️ Writing Quality")
+            writing_metrics = {
+                "Clarity": ("Strong", "Clear and concise language"),
+                "Impact": ("Medium", "Could use more quantifiable achievements"),
+                "Professionalism": ("High", "Maintains professional tone")
+            }
+            
+            for metric, (level, desc) in writing_metrics.items():
+                st.write(f"**{metric}**: {level}")
+                st.caption(desc)
+        
+        if review_section == 2:
+            st.subheader("Job Role Alignment")
+            
+            # Job Match Score
+            match_score = 75
+            st.markdown(f"#### 🎯 Overall Match Score: {match_score}%")
+            st.progress(match_score/100)
+            
+            # Keyword Analysis
+            st.markdown("#### 🔑 Key Requirements Match")
+            requirements = {
+                "Required Skills": ("8/10", "🟢"),
+                "Experience Level": ("7/10", "🟡"),
+                "Domain Knowledge": ("6/10", "🟡"),
+                "Leadership": ("8/10", "🟢")
+            }
+            
+            for req, (score, indicator) in requirements.items():
+                st.write(f"{indicator} **{req}**: {score}")
+            
+            # ATS Optimization
+            st.markdown("#### 🤖 ATS Optimization Tips")
+            ats_tips = [
+                "Include more industry-standard keywords",
+                "Use conventional section headers",
+                "Ensure proper formatting for ATS parsing"
+            ]
+            for tip in ats_tips:
+                st.info(tip)
+        
+        if review_section == 3:
+            st.markdown("### 🤖 AI-Powered Resume Analysis")
+            
+            # Overall Summary
+            st.markdown("#### 📋 Executive Summary")
+            st.info(analysis["detailed_review"]["summary"]["overview"])
+            
+            # Detailed Content Analysis
+            st.markdown("#### 📊 Detailed Content Analysis")
+            
+            # Experience Impact
+            with st.expander("💼 Experience & Impact Analysis", expanded=True):
+                exp_impact = analysis["detailed_review"]["content_analysis"]["experience_impact"]
+                st.markdown(f"**Impact Score**: {exp_impact['rating']}/100")
                 
-                with analysis_tabs[3]:
-                    st.markdown("### 📝 Writing & Style Analysis")
-                    
-                    # Writing Quality
-                    style = analysis["detailed_review"]["professional_assessment"]["writing_style"]
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Clarity Score", f"{style['clarity_score']}%")
-                    with col2:
-                        st.write(style["tone_analysis"])
-                    
-                    # Structure Analysis
-                    st.subheader("📄 Document Structure")
-                    st.info(style["structure_feedback"])
+                st.markdown("**📈 Key Findings:**")
+                for finding in exp_impact["findings"]:
+                    if "No quantified" in finding:
+                        st.warning(finding)
+                    else:
+                        st.success(finding)
+                        
+                st.markdown("**🎯 Suggested Improvements:**")
+                for improvement in exp_impact["improvements"]:
+                    st.info(f"• {improvement}")
+            
+            # Technical Analysis
+            with st.expander("💻 Technical Expertise Assessment", expanded=True):
+                tech_analysis = analysis["technical_analysis"]["technical_projects"]
                 
-                with analysis_tabs[4]:
-                    st.markdown("### 💡 AI-Powered Suggestions")
-                    
-                    # Priority Improvements
-                    st.subheader("🎯 High-Priority Improvements")
-                    for improvement in analysis["detailed_review"]["recommendations"]["high_impact"]:
-                        with st.expander(improvement["title"], expanded=True):
-                            st.write(f"**What to Improve:** {improvement['description']}")
-                            st.markdown("**Example Change:**")
-                            st.error(f"Current: {improvement['examples'][0]}")
-                            st.success(f"Better: {improvement['examples'][1]}")
-                            st.info(f"**Impact:** {improvement['why']}")
-                    
-                    # Quick Wins
-                    st.subheader("⚡ Quick Improvements")
-                    quick_wins = analysis["detailed_review"]["recommendations"]["quick_wins"]
-                    cols = st.columns(3)
-                    
-                    with cols[0]:
-                        st.markdown("**📝 Format**")
-                        for tip in quick_wins["formatting"]:
-                            st.success(tip)
-                    
-                    with cols[1]:
-                        st.markdown("**📄 Content**")
-                        for tip in quick_wins["content"]:
-                            st.success(tip)
-                    
-                    with cols[2]:
-                        st.markdown("**🎯 ATS**")
-                        for tip in quick_wins["ats_optimization"]:
-                            st.success(tip)                # Display detailed analysis
-                analysis_tabs = st.tabs([
-                    "� Technical Analysis", 
-                    "💼 Professional Review",
-                    "🎯 Job Match", 
-                    "� Recommendations"
-                ])
+                st.markdown("**🔍 Project Complexity Analysis:**")
+                for complexity in tech_analysis["complexity_analysis"]:
+                    st.write(f"• {complexity}")
                 
-                with analysis_tabs[0]:
-                    st.subheader("Technical Skills Analysis")
-                    
-                    # Technical Skills Breakdown
-                    tech_col1, tech_col2 = st.columns(2)
-                    with tech_col1:
-                        st.markdown("#### 🔍 Skills Detection")
-                        detected_skills = [
-                            ("Python", "⭐⭐⭐"),
-                            ("SQL", "⭐⭐"),
-                            ("Git", "⭐⭐"),
-                            ("Docker", "⭐"),
-                        ]
-                        for skill, level in detected_skills:
-                            st.write(f"**{skill}**: {level}")
-                    
-                    with tech_col2:
-                        st.markdown("#### � Skills Gap Analysis")
-                        missing_skills = ["CI/CD", "Cloud Platforms", "Testing Frameworks"]
-                        for skill in missing_skills:
-                            st.warning(f"Consider adding experience with {skill}")
-                    
-                    # Code Quality Indicators
-                    st.markdown("#### 💻 Technical Project Indicators")
-                    quality_metrics = {
-                        "Project Complexity": 0.75,
-                        "Technical Depth": 0.65,
-                        "Tool Diversity": 0.80
-                    }
-                    for metric, value in quality_metrics.items():
-                        st.progress(value)
-                        st.caption(f"{metric}: {int(value * 100)}%")
+                st.markdown("**🛠️ Technical Stack Review:**")
+                for review in tech_analysis["tech_stack_review"]:
+                    st.write(f"• {review}")
                 
-                with analysis_tabs[1]:
-                    st.subheader("Professional Assessment")
-                    
-                    # Experience Analysis
-                    st.markdown("#### 📈 Experience Analysis")
-                    exp_quality = {
-                        "Role Clarity": 85,
-                        "Achievement Focus": 70,
-                        "Leadership Indicators": 65,
-                        "Domain Expertise": 80
-                    }
-                    
-                    for aspect, score in exp_quality.items():
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.progress(score/100)
-                        with col2:
-                            st.write(f"{score}%")
-                    
-                    # Writing Quality
-                    st.markdown("#### ✍️ Writing Quality")
-                    writing_metrics = {
-                        "Clarity": ("Strong", "Clear and concise language"),
-                        "Impact": ("Medium", "Could use more quantifiable achievements"),
-                        "Professionalism": ("High", "Maintains professional tone")
-                    }
-                    
-                    for metric, (level, desc) in writing_metrics.items():
-                        st.write(f"**{metric}**: {level}")
+                st.markdown("**📐 Architecture & System Design:**")
+                for insight in tech_analysis["architecture_insights"]:
+                    st.write(f"• {insight}")
+            
+            # Writing Style Analysis
+            with st.expander("✍️ Professional Writing Assessment", expanded=True):
+                writing_style = analysis["detailed_review"]["professional_assessment"]["writing_style"]
+                
+                # Experience Scores
+                if "experience_scores" in analysis["detailed_review"]["professional_assessment"]:
+                    exp_scores = analysis["detailed_review"]["professional_assessment"]["experience_scores"]
+                    for aspect, score in exp_scores.items():
+                        st.metric(aspect, f"{score}%")
+                
+                # Writing Quality
+                writing_quality = analysis["detailed_review"]["professional_assessment"]["writing_quality"]
+                if writing_quality:
+                    for metric, (level, desc) in writing_quality.items():
+                        st.markdown(f"**{metric}**: {level}")
                         st.caption(desc)
                 
-                with analysis_tabs[2]:
-                    st.subheader("Job Role Alignment")
-                    
-                    # Job Match Score
-                    match_score = 75
-                    st.markdown(f"#### 🎯 Overall Match Score: {match_score}%")
-                    st.progress(match_score/100)
-                    
-                    # Keyword Analysis
-                    st.markdown("#### 🔑 Key Requirements Match")
-                    requirements = {
-                        "Required Skills": ("8/10", "🟢"),
-                        "Experience Level": ("7/10", "🟡"),
-                        "Domain Knowledge": ("6/10", "🟡"),
-                        "Leadership": ("8/10", "🟢")
-                    }
-                    
-                    for req, (score, indicator) in requirements.items():
-                        st.write(f"{indicator} **{req}**: {score}")
-                    
-                    # ATS Optimization
-                    st.markdown("#### 🤖 ATS Optimization Tips")
-                    ats_tips = [
-                        "Include more industry-standard keywords",
-                        "Use conventional section headers",
-                        "Ensure proper formatting for ATS parsing"
-                    ]
-                    for tip in ats_tips:
-                        st.info(tip)
+                st.markdown("**📝 Structure Feedback:**")
+                st.info(writing_style["structure_feedback"])
                 
-                with analysis_tabs[3]:
-                    st.markdown("### 🤖 AI-Powered Resume Analysis")
-                    
-                    # Overall Summary
-                    st.markdown("#### 📋 Executive Summary")
-                    st.info(analysis["detailed_review"]["summary"]["overview"])
-                    
-                    # Detailed Content Analysis
-                    st.markdown("#### 📊 Detailed Content Analysis")
-                    
-                    # Experience Impact
-                    with st.expander("💼 Experience & Impact Analysis", expanded=True):
-                        exp_impact = analysis["detailed_review"]["content_analysis"]["experience_impact"]
-                        st.markdown(f"**Impact Score**: {exp_impact['rating']}/100")
-                        
-                        st.markdown("**📈 Key Findings:**")
-                        for finding in exp_impact["findings"]:
-                            if "No quantified" in finding:
-                                st.warning(finding)
-                            else:
-                                st.success(finding)
-                                
-                        st.markdown("**🎯 Suggested Improvements:**")
-                        for improvement in exp_impact["improvements"]:
-                            st.info(f"• {improvement}")
-                    
-                    # Technical Analysis
-                    with st.expander("💻 Technical Expertise Assessment", expanded=True):
-                        tech_analysis = analysis["technical_analysis"]["technical_projects"]
-                        
-                        st.markdown("**🔍 Project Complexity Analysis:**")
-                        for complexity in tech_analysis["complexity_analysis"]:
-                            st.write(f"• {complexity}")
-                        
-                        st.markdown("**🛠️ Technical Stack Review:**")
-                        for review in tech_analysis["tech_stack_review"]:
-                            st.write(f"• {review}")
-                        
-                        st.markdown("**📐 Architecture & System Design:**")
-                        for insight in tech_analysis["architecture_insights"]:
-                            st.write(f"• {insight}")
-                    
-                    # Writing Style Analysis
-                    with st.expander("✍️ Professional Writing Assessment", expanded=True):
-                        writing_style = analysis["detailed_review"]["professional_assessment"]["writing_style"]
-                        
-                        # Experience Scores
-                        if "experience_scores" in analysis["detailed_review"]["professional_assessment"]:
-                            exp_scores = analysis["detailed_review"]["professional_assessment"]["experience_scores"]
-                            for aspect, score in exp_scores.items():
-                                st.metric(aspect, f"{score}%")
-                        
-                        # Writing Quality
-                        writing_quality = analysis["detailed_review"]["professional_assessment"]["writing_quality"]
-                        if writing_quality:
-                            for metric, (level, desc) in writing_quality.items():
-                                st.markdown(f"**{metric}**: {level}")
-                                st.caption(desc)
-                        
-                        st.markdown("**📝 Structure Feedback:**")
-                        st.info(writing_style["structure_feedback"])
-                        
-                    # Market Alignment
-                    if "market_alignment" in analysis:
-                        with st.expander("🎯 Market & Role Alignment", expanded=True):
-                            st.markdown("**Industry Alignment:**")
-                            for trend in analysis["market_alignment"]["industry_trends"]:
-                                st.write(f"• {trend}")
-                            
-                            st.markdown("**Role-Specific Feedback:**")
-                            for feedback in analysis["market_alignment"]["role_specific_feedback"]:
-                                st.write(f"• {feedback}")
-                    
-                    st.markdown("---")
-                    st.markdown("### 💡 Comprehensive Improvement Suggestions")
-                    
-                    # High Impact Improvements
-                    st.subheader("🚀 High-Impact Improvements")
-                    for improvement in analysis["detailed_review"]["recommendations"]["high_impact"]:
-                        with st.expander(improvement["title"], expanded=True):
-                            st.markdown(f"**{improvement['description']}**")
-                            st.markdown("#### Examples:")
-                            for i in range(0, len(improvement["examples"]), 2):
-                                st.error(improvement["examples"][i])  # Before
-                                st.success(improvement["examples"][i+1])  # After
-                            st.info(f"**Why This Matters**: {improvement['why']}")
-                    
-                    # Skills Optimization
-                    st.subheader("💪 Skills Optimization")
-                    
-                    # Technical Skills
-                    tech_skills = analysis["detailed_review"]["recommendations"]["skill_optimization"]["technical_skills"]
-                    with st.expander(tech_skills["title"], expanded=True):
-                        for suggestion in tech_skills["suggestions"]:
-                            st.markdown(f"• {suggestion}")
-                        st.code(tech_skills["example"], language="markdown")
-                        
-                    # Soft Skills
-                    soft_skills = analysis["detailed_review"]["recommendations"]["skill_optimization"]["soft_skills"]
-                    with st.expander(soft_skills["title"], expanded=True):
-                        for suggestion in soft_skills["suggestions"]:
-                            st.markdown(f"• {suggestion}")
-                        st.code(soft_skills["example"], language="markdown")
-                    
-                    # Quick Wins
-                    st.subheader("⚡ Quick Improvements")
-                    quick_wins = analysis["detailed_review"]["recommendations"]["quick_wins"]
-                    
-                    quick_wins_tabs = st.tabs(["📝 Formatting", "📄 Content", "🎯 ATS Optimization"])
-                    
-                    with quick_wins_tabs[0]:
-                        for tip in quick_wins["formatting"]:
-                            st.success(tip)
-                    
-                    with quick_wins_tabs[1]:
-                        for tip in quick_wins["content"]:
-                            st.success(tip)
-                    
-                    with quick_wins_tabs[2]:
-                        for tip in quick_wins["ats_optimization"]:
-                            st.success(tip)
-                    
-                    # ATS Compatibility Section
-                    st.subheader("🤖 ATS Compatibility Analysis")
-                    
-                    ats_col1, ats_col2 = st.columns([2, 1])
-                    with ats_col1:
-                        ats_score = analysis["ats_compatibility"]["overall_score"]
-                        st.progress(ats_score / 100)
-                        st.caption(f"ATS Compatibility Score: {ats_score}%")
-                    
-                    with ats_col2:
-                        if ats_score >= 80:
-                            st.success("✅ ATS Friendly")
-                        elif ats_score >= 60:
-                            st.warning("⚠️ Some Improvements Needed")
-                        else:
-                            st.error("❌ Major Revisions Needed")
-                    
-                    # Keyword Analysis
-                    with st.expander("🔍 ATS Keyword Analysis", expanded=True):
-                        for suggestion in analysis["ats_compatibility"]["keyword_analysis"]["suggestions"]:
-                            st.info(suggestion)
-                    
-                    # Download Options
-                    st.markdown("---")
-                    st.subheader("📥 Download Analysis")
-                    
-                    # Generate detailed report text
-                    report_text = f"""
-Resume Analysis Report for {job_role} Position
-============================================
-
-Overall Scores
--------------
-Structure: {analysis['scores']['structure']}%
-Content: {analysis['scores']['content']}%
-Clarity: {analysis['scores']['clarity']}%
-Overall: {analysis['scores']['overall']}%
-
-High-Impact Recommendations
--------------------------
-"""
-                    # Add high-impact recommendations
-                    for imp in analysis["detailed_review"]["recommendations"]["high_impact"]:
-                        report_text += f"\n{imp['title']}\n"
-                        report_text += f"{'-' * len(imp['title'])}\n"
-                        report_text += f"{imp['description']}\n\n"
-                        report_text += "Examples:\n"
-                        for i in range(0, len(imp["examples"]), 2):
-                            report_text += f"Before: {imp['examples'][i]}\n"
-                            report_text += f"After:  {imp['examples'][i+1]}\n\n"
-                    
-                    # Add skills optimization
-                    report_text += "\nSkills Optimization\n==================\n"
-                    report_text += "\nTechnical Skills Suggestions:\n"
-                    for sugg in analysis["detailed_review"]["recommendations"]["skill_optimization"]["technical_skills"]["suggestions"]:
-                        report_text += f"• {sugg}\n"
-                    
-                    report_text += "\nExample Technical Skills Format:\n"
-                    report_text += analysis["detailed_review"]["recommendations"]["skill_optimization"]["technical_skills"]["example"]
-                    
-                    # Add quick wins
-                    report_text += "\n\nQuick Improvements\n=================\n"
-                    for category, tips in analysis["detailed_review"]["recommendations"]["quick_wins"].items():
-                        report_text += f"\n{category.title()}:\n"
-                        for tip in tips:
-                            report_text += f"• {tip}\n"
-                    
-                    # Download options
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.download_button(
-                            label="📄 Download as Text",
-                            data=report_text,
-                            file_name="resume_analysis_report.txt",
-                            mime="text/plain"
-                        )
-                    
-                    with col2:
-                        st.markdown("""
-                        <style>
-                        .copy-box {
-                            background-color: #f0f2f6;
-                            border-radius: 5px;
-                            padding: 10px;
-                            margin: 10px 0;
-                        }
-                        </style>
-                        """, unsafe_allow_html=True)
-                        
-                        with st.expander("📋 Copy Report Text", expanded=False):
-                            st.markdown('<div class="copy-box">', unsafe_allow_html=True)
-                            st.code(report_text, language="markdown")
-                            st.markdown('</div>', unsafe_allow_html=True)
+            # Market Alignment
+            if "market_alignment" in analysis:
+                with st.expander("🎯 Market & Role Alignment", expanded=True):
+                    st.markdown("**Industry Alignment:**")
+                    for trend in analysis["market_alignment"]["industry_trends"]:
+                        st.write(f"• {trend}")
+                    
+                    st.markdown("**Role-Specific Feedback:**")
+                    for feedback in analysis["market_alignment"]["role_specific_feedback"]:
+                        st.write(f"• {feedback}")
+            
+            st.markdown("---")
+            st.markdown("### 💡 Comprehensive Improvement Suggestions")
+            
+            # High Impact Improvements
+            st.subheader("🚀 High-Impact Improvements")
+            for improvement in analysis["detailed_review"]["recommendations"]["high_impact"]:
+                with st.expander(improvement["title"], expanded=True):
+                    st.markdown(f"**{improvement['description']}**")
+                    st.markdown("#### Examples:")
+                    for i in range(0, len(improvement["examples"]), 2):
+                        st.error(improvement["examples"][i])  # Before
+                        st.success(improvement["examples"][i+1])  # After
+                    st.info(f"**Why This Matters**: {improvement['why']}")
+            
+            # Skills Optimization
+            st.subheader("💪 Skills Optimization")
+            
+            # Technical Skills
+            tech_skills = analysis["detailed_review"]["recommendations"]["skill_optimization"]["technical_skills"]
+            with st.expander(tech_skills["title"], expanded=True):
+                for suggestion in tech_skills["suggestions"]:
+                    st.markdown(f"• {suggestion}")
+                st.code(tech_skills["example"], language="markdown")
                 
-                with analysis_tabs[3]:
-                    st.markdown("### 🤖 AI Analysis Feedback")
-                    
-                    if selected_model != "Basic Analysis":
-                        with st.spinner(f"Generating {selected_model} analysis..."):
-                            # Here you would integrate with the actual AI model APIs
-                            # For now, showing a placeholder for the integrated AI analysis
-                            st.write(f"💫 **{selected_model} Analysis**")
-                            
-                            analysis_sections = {
-                                "Skills Analysis": "Detailed review of technical and soft skills based on job requirements",
-                                "Experience Match": "Assessment of experience relevance and achievements",
-                                "Format & Structure": "Evaluation of resume organization and clarity",
-                                "Improvement Suggestions": "Specific recommendations for enhancement"
-                            }
-                            
-                            for section, content in analysis_sections.items():
-                                with st.expander(section, expanded=True):
-                                    st.write(content)
-                                    if section == "Improvement Suggestions":
-                                        st.warning("● Add more quantifiable achievements")
-                                        st.warning("● Enhance technical skills section")
-                                        st.warning("● Improve role descriptions")
-                            
-                            # Custom feedback based on model
-                            if selected_model == "GPT-4":
-                                st.info("🔍 Advanced language model providing comprehensive analysis")
-                            elif selected_model == "Claude":
-                                st.info("� Anthropic's AI offering detailed technical insights")
-                            
-                # Download Report Option
+            # Soft Skills
+            soft_skills = analysis["detailed_review"]["recommendations"]["skill_optimization"]["soft_skills"]
+            with st.expander(soft_skills["title"], expanded=True):
+                for suggestion in soft_skills["suggestions"]:
+                    st.markdown(f"• {suggestion}")
+                st.code(soft_skills["example"], language="markdown")
+            
+            # Quick Wins
+            st.subheader("⚡ Quick Improvements")
+            quick_wins = analysis["detailed_review"]["recommendations"]["quick_wins"]
+            
+            quick_wins_section = section_selector(["📝 Formatting", "📄 Content", "🎯 ATS Optimization"],
+                                                  key="quick_wins_section")
+            
+            if quick_wins_section == 0:
+                for tip in quick_wins["formatting"]:
+                    st.success(tip)
+            
+            if quick_wins_section == 1:
+                for tip in quick_wins["content"]:
+                    st.success(tip)
+            
+            if quick_wins_section == 2:
+                for tip in quick_wins["ats_optimization"]:
+                    st.success(tip)
+            
+            # ATS Compatibility Section
+            st.subheader("🤖 ATS Compatibility Analysis")
+            
+            ats_col1, ats_col2 = st.columns([2, 1])
+            with ats_col1:
+                ats_score = analysis["ats_compatibility"]["overall_score"]
+                st.progress(ats_score / 100)
+                st.caption(f"ATS Compatibility Score: {ats_score}%")
+            
+            with ats_col2:
+                if ats_score >= 80:
+                    st.success("✅ ATS Friendly")
+                elif ats_score >= 60:
+                    st.warning("⚠️ Some Improvements Needed")
+                else:
+                    st.error("❌ Major Revisions Needed")
+            
+            # Keyword Analysis
+            with st.expander("🔍 ATS Keyword Analysis", expanded=True):
+                for suggestion in analysis["ats_compatibility"]["keyword_analysis"]["suggestions"]:
+                    st.info(suggestion)
+            
+            # Download Options
+            st.markdown("---")
+            st.subheader("📥 Download Analysis")
+            
+            # Generate detailed report text
+            report_text = build_report_text(analysis, analyzed_role)
+            
+            # Download options
+            col1, col2 = st.columns(2)
+            with col1:
                 st.download_button(
-                    label="📥 Download Full Analysis Report",
-                    data=f"Resume Analysis Report\n\nJob Role: {job_role}\n\nScores:\n- Structure: {analysis['scores']['structure']}%\n- Content: {analysis['scores']['content']}%\n- Overall: {analysis['scores']['overall']}%",
+                    label="📄 Download as Text",
+                    data=report_text,
                     file_name="resume_analysis_report.txt",
                     mime="text/plain"
                 )
+            
+            with col2:
+                st.markdown("""
+                <style>
+                .copy-box {
+                    background-color: #f0f2f6;
+                    border-radius: 5px;
+                    padding: 10px;
+                    margin: 10px 0;
+                }
+                </style>
+                """, unsafe_allow_html=True)
+                
+                with st.expander("📋 Copy Report Text", expanded=False):
+                    st.markdown('<div class="copy-box">', unsafe_allow_html=True)
+                    st.code(report_text, language="markdown")
+                    st.markdown('</div>', unsafe_allow_html=True)
+        
+        if review_section == 3:
+            st.markdown("### 🤖 AI Analysis Feedback")
+            
+            if selected_model != "Basic Analysis":
+                with st.spinner(f"Generating {selected_model} analysis..."):
+                    # Here you would integrate with the actual AI model APIs
+                    # For now, showing a placeholder for the integrated AI analysis
+                    st.write(f"💫 **{selected_model} Analysis**")
+                    
+                    analysis_sections = {
+                        "Skills Analysis": "Detailed review of technical and soft skills based on job requirements",
+                        "Experience Match": "Assessment of experience relevance and achievements",
+                        "Format & Structure": "Evaluation of resume organization and clarity",
+                        "Improvement Suggestions": "Specific recommendations for enhancement"
+                    }
+                    
+                    for section, content in analysis_sections.items():
+                        with st.expander(section, expanded=True):
+                            st.write(content)
+                            if section == "Improvement Suggestions":
+                                st.warning("● Add more quantifiable achievements")
+                                st.warning("● Enhance technical skills section")
+                                st.warning("● Improve role descriptions")
+                    
+                    # Custom feedback based on model
+                    if selected_model == "GPT-4":
+                        st.info("🔍 Advanced language model providing comprehensive analysis")
+                    elif selected_model == "Claude":
+                        st.info("� Anthropic's AI offering detailed technical insights")
+                    
+        render_clock.lap("detail_tabs")
+        
+        # Download Report Option
+        st.download_button(
+            label="📥 Download Full Analysis Report",
+            data=f"Resume Analysis Report\n\nJob Role: {analyzed_role}\n\nScores:\n- Structure: {analysis['scores']['structure']}%\n- Content: {analysis['scores']['content']}%\n- Overall: {analysis['scores']['overall']}%",
+            file_name="resume_analysis_report.txt",
+            mime="text/plain"
+        )
+        render_clock.lap("download")
+
+with tab4:
+    st.subheader("Compare Job Roles")
+    st.caption("Score your resume against several roles at once to see which one it fits best.")
+    roles_input = st.text_area("Job roles (one per line)", value=job_role,
+                               placeholder="Data Analyst\nData Engineer\nMachine Learning Engineer")
+    if st.button("⚖️ Compare Roles", disabled=not (resume_text and roles_input.strip())):
+        # One profile of the resume, every role ranked in one pass on the shared worker pool
+        job = submit_or_warn(submit_comparison, resume_text, tuple(roles_input.splitlines()),
+                             supersedes=st.session_state.get("comparison_job_id"), session=session_id)
+        if job is not None:
+            st.session_state["comparison_job_id"] = job.job_id
+
+    comparison_job = get_job(st.session_state.get("comparison_job_id"))
+    if comparison_job is not None and not comparison_job.finished:
+        show_job_status(comparison_job)
+        if st.button("✖️ Cancel Comparison"):
+            comparison_job.cancel()
+    elif comparison_job is not None:
+        del st.session_state["comparison_job_id"]
+        if comparison_job.trace is not None and instrumentation.current_trace() is not None:
+            instrumentation.current_trace().merge(comparison_job.trace)
+        if comparison_job.status == DONE:
+            st.session_state["role_comparison"] = comparison_job.result
+        elif comparison_job.status == FAILED:
+            st.error(f"Role comparison failed: {comparison_job.error}")
         else:
-            st.error("Please upload a valid resume first")
+            st.info("Role comparison cancelled.")
+
+    role_ranking = st.session_state.get("role_comparison")
+    if role_ranking:
+        best_fit = role_ranking[0]
+        st.success(f"Best fit: **{best_fit['role']}** ({best_fit['overall']:.0f}% overall, "
+                   f"{best_fit['role_match']:.0f}% role match)")
+
+        ranking_table = pd.DataFrame(role_ranking)
+        ranking_chart = alt.Chart(ranking_table).mark_bar().encode(
+            x=alt.X("overall:Q", title="Overall score (%)", scale=alt.Scale(domain=[0, 100])),
+            y=alt.Y("role:N", title=None, sort=alt.SortField("rank")),
+            color=alt.Color("role_match:Q", title="Role match (%)", scale=alt.Scale(domain=[0, 100], scheme="greens")),
+            tooltip=["rank", "role", "overall", "role_match", "ats_score"]
+        )
+        st.altair_chart(ranking_chart, use_container_width=True)
+
+        ranking_table["present"] = ranking_table["present"].str.join(", ")
+        ranking_table["missing"] = ranking_table["missing"].str.join(", ")
+        st.dataframe(
+            ranking_table[["rank", "role", "overall", "role_match", "ats_score", "structure", "clarity",
+                           "present", "missing"]].round(1),
+            column_config={
+                "rank": "Rank", "role": "Role", "overall": "Overall %", "role_match": "Role Match %",
+                "ats_score": "ATS %", "structure": "Structure %", "clarity": "Clarity %",
+                "present": "Keywords Found", "missing": "Keywords Missing"
+            },
+            hide_index=True, use_container_width=True
+        )
+
+# Diagnostics: keep the last run that recorded anything, so plain reruns don't blank it out
+trace = instrumentation.end_trace()
+if trace is not None and not trace.is_empty:
+    st.session_state["diagnostics"] = trace.to_dict()
+with diagnostics_panel:
+    diagnostics = st.session_state.get("diagnostics") if instrumentation_enabled else None
+    if diagnostics:
+        st.caption(f"Run at {diagnostics['started_at']} · {diagnostics['wall_ms']:.1f} ms wall time")
+        st.dataframe(
+            [{"stage": name, **stage} for name, stage in diagnostics["stages"].items()],
+            hide_index=True, use_container_width=True
+        )
+        if diagnostics["counters"]:
+            st.json(diagnostics["counters"])
+        if diagnostics["profile"]:
+            st.code(diagnostics["profile"], language="text")
+        st.download_button("Export diagnostics (JSON)", data=json.dumps(diagnostics, indent=2),
+                           file_name="resume_reviewer_diagnostics.json", mime="application/json")
+    elif instrumentation_enabled:
+        st.caption("No timings recorded yet – upload or analyze a resume.")
+
+# While one of this session's jobs is pending, rerun shortly to pick up its progress
+if any(job is not None and not job.finished for job in (extraction_job, analysis_job, comparison_job)):
+    time.sleep(JOB_POLL_INTERVAL)
+    st.rerun()
@@ -1,45 +1,62 @@
 # member1.py
 import streamlit as st
-import pdfplumber
 
-def extract_resume_text(uploaded_file):
+import metrics
+
+# Extraction itself lives in the headless `reviewer` package; this module adds
+# Streamlit error reporting on top of it.
+from reviewer.extraction import extract_text, iter_resume_pages, SUPPORTED_EXTENSIONS, UploadRejected
+
+def extract_resume_content(uploaded_file, on_page=None, on_error=None):
     """
-    Extracts text from an uploaded PDF or TXT file in Streamlit.
+    Extracts text and page count from an uploaded PDF or TXT file in Streamlit.
     
     Args:
         uploaded_file: Uploaded file object from st.file_uploader
+        on_page: Optional callback(page_number, page_text) called as each page
+            is extracted, e.g. to show progress or partial scores
+        on_error: Optional callback(message) for errors, e.g. to collect them
+            off the script thread (default st.error)
     
     Returns:
-        str: Extracted text content
+        tuple (text, page_count): Extracted text content and number of pages
+        (text files count as a single page)
     """
     if uploaded_file is None:
-        return ""
+        return "", 0
+    report_error = on_error or st.error
     
     # Get file extension
     file_name = uploaded_file.name.lower()
+    if not file_name.endswith(SUPPORTED_EXTENSIONS):
+        metrics.EXTRACTION_FAILURES.labels(metrics.file_type_label(file_name), "unsupported").inc()
+        report_error("Unsupported file type. Please upload a PDF or TXT file.")
+        return "", 0
     
     try:
-        if file_name.endswith('.pdf'):
-            # Method 1: Using pdfplumber
-            text = ""
-            with pdfplumber.open(uploaded_file) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text.strip()
-            
-        elif file_name.endswith('.txt'):
-            # Read text file directly
-            return uploaded_file.read().decode("utf-8").strip()
-        
-        else:
-            st.error("Unsupported file type. Please upload a PDF or TXT file.")
-            return ""
+        return extract_text(uploaded_file, on_page=on_page)
+    
+    except UploadRejected as e:
+        metrics.EXTRACTION_FAILURES.labels(metrics.file_type_label(file_name), "rejected").inc()
+        report_error(f"Upload rejected: {e}")
+        return "", 0
             
     except Exception as e:
-        st.error(f"Error extracting text: {str(e)}")
-        return ""
+        metrics.EXTRACTION_FAILURES.labels(metrics.file_type_label(file_name), "error").inc()
+        report_error(f"Error extracting text: {str(e)}")
+        return "", 0
+
+def extract_resume_text(uploaded_file):
+    """
+    Extracts text from an uploaded PDF or TXT file in Streamlit.
+    
+    Args:
+        uploaded_file: Uploaded file object from st.file_uploader
+    
+    Returns:
+        str: Extracted text content
+    """
+    return extract_resume_content(uploaded_file)[0]
 
 # Example usage inside Streamlit
 if __name__ == "__main__":
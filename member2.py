@@ -2,6 +2,13 @@
 import streamlit as st
 import textwrap
 
+# Shown in place of an empty job description; callers compare against it to
+# tell a real description from the placeholder
+DEFAULT_JOB_DESCRIPTION = textwrap.dedent("""
+    [No description provided]
+    You can paste a full job listing here to improve feedback.
+""").strip()
+
 def get_job_input():
     """
     Captures target job role and optional job description from the user via Streamlit UI.
@@ -16,10 +23,7 @@ def get_job_input():
     job_desc = st.text_area("Paste Job Description (optional)", placeholder="Paste the full job listing here...")
 
     if not job_desc.strip():
-        job_desc = textwrap.dedent("""
-            [No description provided]
-            You can paste a full job listing here to improve feedback.
-        """).strip()
+        job_desc = DEFAULT_JOB_DESCRIPTION
 
     return job_role, job_desc
 
@@ -0,0 +1,115 @@
+# metrics.py
+import logging
+import os
+import threading
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, start_http_server
+
+# Process-wide Prometheus metrics for the shared reviewer service. main.py calls
+# start_metrics_server() on every rerun; the exporter is only started once per
+# process, on RESUME_METRICS_ADDR:RESUME_METRICS_PORT (set the port to 0 to
+# disable it). Scrape http://127.0.0.1:9108/metrics by default.
+METRICS_PORT = int(os.environ.get("RESUME_METRICS_PORT", "9108"))
+METRICS_ADDR = os.environ.get("RESUME_METRICS_ADDR", "127.0.0.1")
+
+logger = logging.getLogger(__name__)
+
+# A dedicated registry keeps the exporter to our metrics (no default process
+# collectors that would be registered twice if the module is ever reloaded)
+REGISTRY = CollectorRegistry()
+
+EXTRACTION_SECONDS = Histogram(
+    "resume_extraction_seconds", "Time to extract text from an uploaded resume",
+    ["file_type"], registry=REGISTRY,
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+ANALYSIS_SECONDS = Histogram(
+    "resume_analysis_seconds", "Time spent in analyze_resume (cache misses only)",
+    registry=REGISTRY,
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+)
+UPLOADS = Counter(
+    "resume_uploads_total", "Resumes submitted for extraction, by file type",
+    ["file_type"], registry=REGISTRY
+)
+EXTRACTION_FAILURES = Counter(
+    "resume_extraction_failures_total", "Extractions that produced no text, by file type and reason",
+    ["file_type", "reason"], registry=REGISTRY
+)
+PAGES_EXTRACTED = Counter(
+    "resume_pages_extracted_total", "Pages extracted from uploaded resumes",
+    registry=REGISTRY
+)
+CACHE_REQUESTS = Counter(
+    "resume_cache_requests_total", "Extraction and analysis cache lookups, by cache and result",
+    ["cache", "result"], registry=REGISTRY
+)
+ACTIVE_SESSIONS = Gauge(
+    "resume_active_sessions", "Browser sessions currently connected to the app",
+    registry=REGISTRY
+)
+ANALYSIS_JOBS = Counter(
+    "resume_analysis_jobs_total", "Background analysis jobs finished, by outcome",
+    ["status"], registry=REGISTRY
+)
+ANALYSIS_JOBS_PENDING = Gauge(
+    "resume_analysis_jobs_pending", "Background analysis jobs queued or running",
+    registry=REGISTRY
+)
+ANALYSIS_JOBS_QUEUED = Gauge(
+    "resume_analysis_jobs_queued", "Background jobs waiting for a free worker",
+    registry=REGISTRY
+)
+ANALYSIS_JOBS_REJECTED = Counter(
+    "resume_analysis_jobs_rejected_total", "Background jobs refused because the wait queue was full",
+    registry=REGISTRY
+)
+
+_server_lock = threading.Lock()
+_server_attempted = False
+_server_started = False
+
+
+def file_type_label(file_name):
+    """
+    Maps an upload name to a bounded label value ("pdf", "txt" or "other").
+    """
+    extension = os.path.splitext(file_name.lower())[1].lstrip(".")
+    return extension if extension in ("pdf", "txt") else "other"
+
+
+def _active_sessions():
+    # Streamlit has no public API for this; fall back to 0 outside a running server
+    try:
+        from streamlit.runtime import Runtime
+
+        if not Runtime.exists():
+            return 0
+        return Runtime.instance()._session_mgr.num_active_sessions()
+    except Exception:
+        return 0
+
+
+ACTIVE_SESSIONS.set_function(_active_sessions)
+
+
+def start_metrics_server(port=METRICS_PORT, addr=METRICS_ADDR):
+    """
+    Starts the Prometheus HTTP exporter once per process.
+
+    Returns:
+        bool: True if the exporter is running (started now or earlier)
+    """
+    global _server_attempted, _server_started
+    if not port:
+        return False
+    with _server_lock:
+        if not _server_attempted:
+            _server_attempted = True
+            try:
+                start_http_server(port, addr=addr, registry=REGISTRY)
+                _server_started = True
+            except OSError as e:
+                # e.g. a second app process on the same host; keep serving the UI
+                logger.warning("Metrics exporter not started on %s:%s: %s", addr, port, e)
+        return _server_started
@@ -0,0 +1,33 @@
+# reviewer/__init__.py
+"""
+Headless resume extraction and scoring core.
+
+Nothing in this package imports Streamlit; main.py and the member modules are
+the UI layer on top of it.
+"""
+from reviewer.analysis import (
+    analyze_resume, build_resume_profile, match_resume_profile, ResumeProfile,
+    analyze_resume_multi, match_roles,
+    IncrementalResumeAnalyzer, scan_keywords
+)
+from reviewer.extraction import extract_text, iter_resume_pages, UnsupportedFileType, UploadRejected
+from reviewer.report import build_report_text
+from reviewer.results import AnalysisResult, Scores
+
+__all__ = [
+    "analyze_resume",
+    "build_resume_profile",
+    "match_resume_profile",
+    "ResumeProfile",
+    "analyze_resume_multi",
+    "match_roles",
+    "IncrementalResumeAnalyzer",
+    "scan_keywords",
+    "extract_text",
+    "iter_resume_pages",
+    "UnsupportedFileType",
+    "UploadRejected",
+    "build_report_text",
+    "AnalysisResult",
+    "Scores",
+]
@@ -0,0 +1,225 @@
+# reviewer/achievements.py
+"""
+Finds quantified achievements: the numbers that back up a resume's claims.
+
+One precompiled pattern recognises five kinds of metric, with their positions:
+
+    delta        "from 40 min to 5 min", "$2M → $3.5M"
+    team         "team of 8", "managed 12 engineers", "5-person team"
+    time         "saved 10 hours a week", "3 days per release"
+    currency     "$1.2M", "€300k", "500k USD"
+    percentage   "40%", "12.5 percent"
+
+Alternatives are tried longest first, so "from 40% to 10%" is one delta rather
+than two percentages (and "reduced load time from 8s to 2s" is a delta, not a
+time saving). Every quantifier in the pattern is bounded or consumes
+characters, and the pattern is only tried next to numbers (see find_metrics),
+so a scan is linear in the length of the text. Resume lines are then split
+into statements that carry a metric (strong points) and statements that make
+a claim without one (weak points).
+"""
+import re
+
+from reviewer.sections import segment
+
+METRIC_KINDS = ("delta", "team", "time", "currency", "percentage")
+
+# Statements credited or flagged in the achievements rating come from these
+# sections (or from every section but "contact" when none of them is present)
+ACHIEVEMENT_SECTIONS = ("experience", "projects", "summary", "awards", "volunteering")
+
+# A statement is a line of at least this many words
+MIN_STATEMENT_WORDS = 5
+
+# Strong/weak points reported, and the longest statement shown
+MAX_POINTS = 5
+MAX_POINT_CHARS = 160
+
+# Achievements kept for display (the rating counts all of them)
+MAX_ACHIEVEMENTS = 100
+
+# A number starts a digit run: scanning never restarts inside one, which keeps
+# long digit strings linear
+_NUMBER = r"(?<!\d)(?<!\d[.,])\d+(?:[.,]\d+)*"
+_SCALE = r"(?:k|m|mm|b|bn|thousand|million|billion)\b"
+_CURRENCY_SYMBOLS = "$€£¥₹"
+_CURRENCY_SYMBOL = f"[{_CURRENCY_SYMBOLS}]"
+_TIME_UNIT = r"(?:hours?|hrs?|days?|weeks?|months?|minutes?|mins?|seconds?|secs?|s|ms)\b"
+_PERIOD = r"(?:per|a|an|each|every)\s(?:day|week|month|quarter|year|sprint|release|run|build)\b"
+_TEAM_MEMBERS = (r"(?:engineers|developers|people|members|staff|employees|analysts|designers|reports|"
+                 r"interns|scientists|consultants|contractors|testers|agents|volunteers|students)\b")
+_AMOUNT = rf"{_CURRENCY_SYMBOL}?\s?{_NUMBER}\s?(?:%|{_SCALE}|{_TIME_UNIT})?"
+
+# Verbs that introduce a team size ("managed 12 engineers") or a time saving
+# ("saved the team 10 hours")
+_TEAM_VERBS = ("led", "managed", "mentored", "supervised", "hired", "coached", "directed", "onboarded", "trained")
+_SAVING_VERBS = ("saved", "saving", "cut", "cutting", "reduced", "reducing", "shortened", "shortening", "freed")
+
+METRIC_PATTERN = re.compile(
+    rf"""
+    (?P<delta>
+        \bfrom\s{_AMOUNT}\s(?:to|->|→)\s{_AMOUNT}
+      | {_CURRENCY_SYMBOL}?{_NUMBER}\s?(?:%|{_SCALE}|{_TIME_UNIT})?\s?(?:->|→)\s?{_AMOUNT}
+    )
+  | (?P<team>
+        \bteams?\sof\s(?:over\s|up\sto\s)?\d+
+      | \b\d+[-\s](?:person|member|people)\steams?\b
+      | \b(?:{"|".join(_TEAM_VERBS)})\s
+        (?:a\steam\sof\s|over\s|up\sto\s)?\d+\+?\s(?:[a-z]{{1,20}}\s){{0,2}}?{_TEAM_MEMBERS}
+    )
+  | (?P<time>
+        \b(?:{"|".join(_SAVING_VERBS)})\s
+        (?:(?!from\b)[^\s\d]{{1,20}}\s){{0,4}}?{_NUMBER}\+?\s?{_TIME_UNIT}
+      | \b{_NUMBER}\+?\s?{_TIME_UNIT}\s{_PERIOD}
+    )
+  | (?P<currency>
+        {_CURRENCY_SYMBOL}\s?{_NUMBER}(?:\s?{_SCALE})?
+      | \b{_NUMBER}\s?(?:{_SCALE}\s?)?(?:usd|eur|gbp|dollars|euros)\b
+    )
+  | (?P<percentage>
+        \b{_NUMBER}\s?(?:%|percent\b|pct\b)
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+_YEAR = re.compile(r"(?:19|20)\d\d")
+
+# Every metric contains a number, so the pattern is only tried around digit
+# runs: at the number itself (or a currency symbol just before it) and at those
+# of the METRIC_CONTEXT_WORDS words before it on its line that can open a
+# metric, enough for "supervised a team of 12" or "saved" plus four words.
+# Trying a handful of fixed positions is far cheaper than letting the pattern
+# search every offset.
+# (_DIGITS finds the first digit of each run; a pattern starting with a plain
+# character class is scanned for in C, where "[0-9]+" is tried at every offset)
+_DIGITS = re.compile(r"[0-9](?<![0-9]{2})")
+_LEAD_WORDS = ("from", "team") + _TEAM_VERBS + _SAVING_VERBS
+_LEAD_CHARS = max(map(len, _LEAD_WORDS))
+METRIC_CONTEXT_WORDS = 5
+METRIC_CONTEXT_CHARS = 120
+
+
+def find_metrics(text):
+    """
+    Scans text for quantified achievements.
+
+    Metrics never span lines. Text between numbers is skipped at C speed and
+    each number is tried at a bounded number of positions, so the scan is
+    linear in the length of the text.
+
+    Args:
+        text: Resume text (any case)
+
+    Returns:
+        list: (kind, start, end) tuples in document order; kind is one of
+        METRIC_KINDS, start/end are character offsets into `text`
+    """
+    metrics = []
+    match_at = METRIC_PATTERN.match
+    scanned = 0  # metrics never overlap, so nothing before this offset is tried again
+    line_start = line_end = -1
+    for digit in _DIGITS.finditer(text):
+        anchor = digit.start()
+        if anchor < scanned:
+            continue
+        # Line bounds are only looked up past the previous line, so each
+        # character is searched once however long the line is
+        if anchor > line_end:
+            line_start = text.rfind("\n", line_end + 1, anchor) + 1 or line_end + 1
+            line_end = text.find("\n", anchor)
+            if line_end == -1:
+                line_end = len(text)
+
+        # Candidate starts, leftmost first, as a full search would try them
+        context_start = max(scanned, line_start, anchor - METRIC_CONTEXT_CHARS)
+        starts = []
+        word_end = anchor
+        for _ in range(METRIC_CONTEXT_WORDS):
+            if word_end <= context_start:
+                break
+            word_start = text.rfind(" ", context_start, word_end - 1) + 1 or context_start
+            if text[word_start:word_start + _LEAD_CHARS].lower().startswith(_LEAD_WORDS):
+                starts.append(word_start)
+            word_end = word_start
+        starts.reverse()
+        for symbol_start in (anchor - 2, anchor - 1):
+            if symbol_start >= context_start and text[symbol_start] in _CURRENCY_SYMBOLS:
+                starts.append(symbol_start)
+        starts.append(anchor)
+
+        for start in starts:
+            match = match_at(text, start, line_end)
+            if match is not None:
+                break
+        else:
+            continue
+        scanned = match.end()
+        value = match.group()
+        # "from 2019 to 2023" is a date range, not an improvement
+        if not (match.lastgroup == "delta" and len(_YEAR.findall(value)) == 2
+                and not any(char in value for char in _CURRENCY_SYMBOLS + "%")):
+            metrics.append((match.lastgroup, match.start(), scanned))
+    return metrics
+
+
+def _statement_spans(text, sections):
+    """
+    Yields (start, end) of every statement line inside the achievement
+    sections, in document order.
+    """
+    spans = [(section.start, section.end) for section in sections if section.kind in ACHIEVEMENT_SECTIONS]
+    if not spans:
+        spans = [(section.start, section.end) for section in sections if section.kind != "contact"]
+    for span_start, span_end in spans:
+        offset = span_start
+        for line in text[span_start:span_end].split("\n"):
+            if len(line.split(None, MIN_STATEMENT_WORDS - 1)) == MIN_STATEMENT_WORDS:
+                yield offset, offset + len(line)
+            offset += len(line) + 1
+
+
+def _point(text, start, end):
+    statement = text[start:end].strip().lstrip("-•*·▪– ").strip()
+    return statement if len(statement) <= MAX_POINT_CHARS else statement[:MAX_POINT_CHARS - 1].rstrip() + "…"
+
+
+def analyze_achievements(text, sections=None):
+    """
+    Extracts the quantified achievements of a resume and rates them.
+
+    Args:
+        text: Resume text
+        sections: reviewer.sections.segment(text), if already computed
+
+    Returns:
+        tuple (achievements, rating, strong_points, weak_points):
+            achievements: (kind, metric text, start, end) for the first
+                MAX_ACHIEVEMENTS metrics, in document order (see find_metrics)
+            rating: 0-10, the share of statements carrying a metric (half of
+                them quantified rates 10)
+            strong_points: Up to MAX_POINTS quantified statements
+            weak_points: Up to MAX_POINTS statements without a number
+    """
+    metrics = find_metrics(text)
+    if sections is None:
+        sections = segment(text)
+
+    statements = quantified = 0
+    strong_points, weak_points = [], []
+    # Both lists are in document order, so one merge pass assigns metrics to lines
+    metric_index = 0
+    for start, end in _statement_spans(text, sections):
+        while metric_index < len(metrics) and metrics[metric_index][2] <= start:
+            metric_index += 1
+        statements += 1
+        if metric_index < len(metrics) and metrics[metric_index][1] < end:
+            quantified += 1
+            if len(strong_points) < MAX_POINTS:
+                strong_points.append(_point(text, start, end))
+        elif len(weak_points) < MAX_POINTS:
+            weak_points.append(_point(text, start, end))
+
+    rating = min(10, round(quantified / statements * 20)) if statements else 0
+    achievements = tuple((kind, text[start:end], start, end) for kind, start, end in metrics[:MAX_ACHIEVEMENTS])
+    return achievements, rating, tuple(strong_points), tuple(weak_points)
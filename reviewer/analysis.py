@@ -0,0 +1,515 @@
+# reviewer/analysis.py
+"""
+Rule-based resume scoring engine. Has no UI dependencies.
+"""
+import re
+
+from reviewer import instrumentation, sections
+from reviewer.matcher import PhraseIndex, tokenize
+from reviewer.results import AnalysisResult, Scores, SKILL_DETAILS
+from reviewer.taxonomy import TAXONOMY
+
+# Keyword vocabularies used by analyze_resume, loaded once from the taxonomy file
+PROFESSIONAL_TERMS = TAXONOMY["professional_terms"]
+VAGUE_TERMS = TAXONOMY["vague_terms"]
+SECTION_TERMS = TAXONOMY["section_terms"]
+TECHNICAL_SKILLS = TAXONOMY["technical_skills"]
+ESSENTIAL_SKILLS = TAXONOMY["essential_skills"]
+PROJECT_INDICATORS = TAXONOMY["project_indicators"]
+COMPLEXITY_INDICATORS = TAXONOMY["complexity_indicators"]
+EXPERIENCE_INDICATORS = TAXONOMY["experience_indicators"]
+IMPACT_TERMS = TAXONOMY["impact_terms"]
+CASUAL_TERMS = TAXONOMY["casual_terms"]
+LEADERSHIP_TERMS = TAXONOMY["leadership_terms"]
+
+# Verbs counted per section in the section analysis
+ACTION_TERMS = tuple(dict.fromkeys(PROFESSIONAL_TERMS + IMPACT_TERMS))
+_ACTION_TERM_SET = frozenset(ACTION_TERMS)
+
+
+def _indicator_variants(term):
+    """
+    Spellings of an indicator word that count as the word itself, so that
+    token-boundary matching still accepts "teams" for "team" or "experts" for
+    "expert".
+    """
+    if " " in term:
+        return (term,)
+    return (term, term + "s", term + "d" if term.endswith("e") else term + "ed")
+
+
+def _build_keyword_index():
+    """
+    Indexes every vocabulary of the taxonomy under its canonical term.
+    
+    Skills are indexed by name and by each alias ("k8s" -> kubernetes); indicator
+    words are indexed with their simple inflections. Section terms are not
+    indexed: they come from section headers (see scan_sections).
+    """
+    index = PhraseIndex()
+    for skills in TECHNICAL_SKILLS.values():
+        for skill, info in skills.items():
+            for phrase in (skill,) + info.get("aliases", ()):
+                index.add(phrase, skill)
+    for skill in ESSENTIAL_SKILLS:
+        index.add(skill, skill)
+    indicators = (
+        PROFESSIONAL_TERMS + VAGUE_TERMS + PROJECT_INDICATORS + COMPLEXITY_INDICATORS
+        + tuple(ind for terms in EXPERIENCE_INDICATORS.values() for ind in terms)
+        + IMPACT_TERMS + CASUAL_TERMS + LEADERSHIP_TERMS
+    )
+    for term in indicators:
+        for variant in _indicator_variants(term):
+            index.add(variant, term)
+    return index
+
+
+KEYWORD_INDEX = _build_keyword_index()
+
+# Every canonical term scan_keywords() can report
+KEYWORD_TERMS = KEYWORD_INDEX.keys() + SECTION_TERMS
+
+
+def _section_terms(kinds):
+    # Section terms ("experience", "education", "skills") hit by section headers
+    return {kind for kind in kinds if kind in SECTION_TERMS}
+
+
+def scan_sections(text_lower):
+    """
+    Segments an already-lowercased resume and scans it for keywords section
+    by section.
+    
+    The text is still tokenized and scanned once. Each hit is credited to the
+    section where the phrase starts, so together the sections report exactly
+    the terms of a whole-text scan.
+    
+    Returns:
+        list: (Section, set of canonical terms in it) pairs in document order
+    """
+    resume_sections = sections.segment(text_lower)
+    # Sections start at line starts, which never split a token
+    section_hits = KEYWORD_INDEX.find_grouped(
+        [tokenize(text_lower[section.start:section.end]) for section in resume_sections]
+    )
+    return list(zip(resume_sections, section_hits))
+
+
+def _merge_section_hits(section_hits):
+    # Whole-resume hits: the union of every section's hits plus its header terms
+    hits = _section_terms(section.kind for section, _ in section_hits)
+    for _, terms in section_hits:
+        hits |= terms
+    return hits
+
+
+def scan_keywords(text_lower):
+    """
+    Builds the keyword hit table for an already-lowercased resume.
+    
+    Every taxonomy term is matched on token boundaries ("java" does not match
+    "javascript", "led" does not match "called"), and aliases resolve to their
+    canonical skill name. Section terms count only when a section header
+    names them, not whenever "experience" appears in a sentence. The cost
+    grows with the resume length, not with the size of the taxonomy.
+    
+    Args:
+        text_lower: Resume text, lowercased once by the caller
+    
+    Returns:
+        set: Canonical terms that occur in the text; equal to the combined
+        hits of scan_sections()
+    """
+    hits = KEYWORD_INDEX.find_in_text(text_lower)
+    hits |= _section_terms(section.kind for section in sections.segment(text_lower))
+    return hits
+
+
+def _role_match_score(role_keywords, role_keywords_found):
+    return min((role_keywords_found / len(role_keywords)) * 100, 100) if role_keywords else 50
+
+
+def _overall_scores(hits, words, match_score):
+    """
+    Computes the headline scores from the keyword hits, word count and role match.
+    """
+    scores = {
+        "structure": min(len([w for w in SECTION_TERMS if w in hits]) * 30, 100),
+        "content": min(match_score, 100),
+        "clarity": min(100, max(20, min(words // 10, 100)))
+    }
+    scores["overall"] = (scores["structure"] + scores["content"] + scores["clarity"]) // 3
+    return scores
+
+
+class IncrementalResumeAnalyzer:
+    """
+    Scores a resume chunk by chunk, e.g. page by page while a PDF is still parsing.
+    
+    Only keyword hits and counters are kept, never the text itself, so memory is
+    bounded by the largest chunk. After every page has been fed, scores() equals
+    analyze_resume(...)["scores"] for the pages joined with newlines.
+    """
+    
+    def __init__(self, job_role=""):
+        self.role_keywords = job_role.lower().split()
+        self.hits = set()
+        self.role_hits = set()
+        self.words = 0
+        self.sentence_breaks = 0
+        self.chunks = 0
+        # Last tokens of the previous chunk, so phrases split across a page break still match
+        self._tail_tokens = []
+        self._section_kind = sections.CONTACT
+    
+    def feed(self, chunk):
+        """
+        Adds one chunk (page) of resume text to the running analysis.
+        """
+        chunk_lower = chunk.lower()
+        tokens = self._tail_tokens + tokenize(chunk_lower)
+        self.hits |= KEYWORD_INDEX.find(tokens)
+        # Pages join on line breaks, so every header line lies within one chunk;
+        # the section a page ends in carries over, as in the joined text
+        chunk_sections = sections.segment(chunk_lower, self._section_kind)
+        self.hits |= _section_terms(section.kind for section in chunk_sections)
+        self._section_kind = chunk_sections[-1].kind
+        self._tail_tokens = tokens[len(tokens) - KEYWORD_INDEX.max_phrase_tokens + 1:]
+        self.role_hits.update(word for word in self.role_keywords if word in chunk_lower)
+        self.words += len(chunk.split())
+        self.sentence_breaks += len(re.findall(r'[.!?]+', chunk))
+        self.chunks += 1
+    
+    @property
+    def sentences(self):
+        return self.sentence_breaks + 1
+    
+    def match_score(self):
+        found = sum([1 for word in self.role_keywords if word in self.role_hits])
+        return _role_match_score(self.role_keywords, found)
+    
+    def scores(self):
+        """
+        Returns the structure/content/clarity/overall scores for the text seen so far.
+        """
+        return _overall_scores(self.hits, self.words, self.match_score())
+
+
+def _rating_indicator(ratio):
+    return "🟢" if ratio >= 0.7 else "🟡" if ratio >= 0.4 else "🔴"
+
+
+class ResumeProfile:
+    """
+    Everything analyze_resume() derives from the resume alone: keyword hits,
+    word and sentence counts, writing style, detected skills, quality metrics,
+    per-section metrics and quantified achievements. It is built once per
+    resume (see build_resume_profile) and then matched against any number of
+    job roles and descriptions, which only costs the role/description-dependent
+    step (see match_resume_profile).
+    
+    Profiles are shared between analyses and must not be modified.
+    """
+    
+    __slots__ = ("text_lower", "hits", "words", "sentences", "clarity_score", "professional_tone",
+                 "has_sections", "skills", "languages", "missing_skills", "quality_metrics",
+                 "experience_score", "concise", "impact_high", "impact_verbs", "professional",
+                 "leadership", "sections", "achievements", "achievement_rating", "strong_points",
+                 "weak_points", "_description_terms", "_years")
+    
+    def __init__(self, text_lower, hits, words, sentences):
+        self.text_lower = text_lower
+        self.hits = hits
+        self.words = words
+        self.sentences = sentences
+        self._description_terms = None
+        self._years = None
+    
+    def description_terms(self):
+        """
+        Returns the resume's TF-IDF term list and "N years" figure for
+        job-description matching, computed on first use.
+        
+        Returns:
+            tuple: (terms list, years)
+        """
+        if self._description_terms is None:
+            # Imported here so NumPy is only loaded once a description is compared
+            from reviewer.jd_match import extract_terms, years_mentioned
+            
+            self._years = years_mentioned(self.text_lower)
+            self._description_terms = extract_terms(self.text_lower)
+        return self._description_terms, self._years
+
+
+def build_resume_profile(resume_text):
+    """
+    Runs the role-independent part of the analysis.
+    
+    Args:
+        resume_text: Resume text
+    
+    Returns:
+        ResumeProfile: The resume's profile
+    """
+    clock = instrumentation.section_clock("analyze")
+    
+    # Basic text analysis, section by section
+    text_lower = resume_text.lower()
+    section_hits = scan_sections(text_lower)
+    section_words = [len(text_lower[section.start:section.end].split()) for section, _ in section_hits]
+    profile = ResumeProfile(
+        text_lower,
+        hits=_merge_section_hits(section_hits),
+        # Sections split on line breaks, so their word counts add up to the resume's
+        words=sum(section_words),
+        sentences=len(re.split(r'[.!?]+', resume_text))
+    )
+    hits, words, sentences = profile.hits, profile.words, profile.sentences
+    clock.lap("scan")
+    
+    # Analyze text quality and professional tone
+    prof_term_count = sum(1 for term in PROFESSIONAL_TERMS if term in hits)
+    vague_term_count = sum(1 for term in VAGUE_TERMS if term in hits)
+    
+    profile.clarity_score = min((prof_term_count * 10) + (100 - vague_term_count * 20), 100)
+    profile.professional_tone = prof_term_count > vague_term_count
+    profile.has_sections = any(section in hits for section in SECTION_TERMS)
+    clock.lap("writing_style")
+    
+    # Detect skills (their categories and details are looked up when displayed)
+    profile.skills = tuple(dict.fromkeys(
+        skill for skills in SKILL_DETAILS.values() for skill in skills if skill in hits
+    ))
+    detected_count = sum(1 for skills in SKILL_DETAILS.values() for skill in skills if skill in hits)
+    profile.languages = sum(1 for skill in SKILL_DETAILS.get("Languages", ()) if skill in hits)
+    
+    # Identify missing critical skills
+    profile.missing_skills = tuple(skill for skill in ESSENTIAL_SKILLS if skill not in hits)
+    
+    # Calculate quality metrics: project complexity, technical depth, tool diversity
+    profile.quality_metrics = (
+        min(len([w for w in COMPLEXITY_INDICATORS if w in hits]) * 0.25, 1.0),
+        min(detected_count * 0.1, 1.0),
+        min(len([w for w in PROJECT_INDICATORS if w in hits]) * 0.2, 1.0)
+    )
+    clock.lap("skills")
+    
+    # Calculate experience scores (only the last aspect is reported)
+    profile.experience_score = None
+    for aspect, indicators in EXPERIENCE_INDICATORS.items():
+        score = min(sum([10 for ind in indicators if ind in hits]), 100)
+        profile.experience_score = (aspect, score)
+    
+    # Writing Quality Assessment
+    profile.concise = sentences/words < 0.1
+    profile.impact_high = len([w for w in IMPACT_TERMS if w in hits]) > 3
+    profile.impact_verbs = len([w for w in IMPACT_TERMS[:2] if w in hits]) > 3
+    profile.professional = not any(casual in hits for casual in CASUAL_TERMS)
+    profile.leadership = any(term in hits for term in LEADERSHIP_TERMS)
+    clock.lap("experience")
+    
+    # Per-section metrics: (kind, title, start, end, words, skills, action verbs)
+    skill_order = {skill: position for position, skill in enumerate(profile.skills)}
+    profile.sections = tuple(
+        (section.kind, section.title, section.start, section.end, words,
+         tuple(sorted(terms & skill_order.keys(), key=skill_order.__getitem__)),
+         len(terms & _ACTION_TERM_SET))
+        for (section, terms), words in zip(section_hits, section_words)
+    )
+    clock.lap("sections")
+    
+    # Quantified achievements, with snippets from the original text when its
+    # offsets match the lowercased one (they only differ for rare characters)
+    # Imported here so the metric pattern (~7 ms to compile) is not part of the headless import
+    from reviewer.achievements import analyze_achievements
+    
+    achievement_text = resume_text if len(resume_text) == len(text_lower) else text_lower
+    (profile.achievements, profile.achievement_rating,
+     profile.strong_points, profile.weak_points) = analyze_achievements(
+        achievement_text, [section for section, _ in section_hits]
+    )
+    clock.lap("achievements")
+    return profile
+
+
+def match_resume_profile(profile, job_role, job_description=""):
+    """
+    Completes the analysis of a profiled resume for one job role (and
+    optionally a job description).
+    
+    Args:
+        profile: build_resume_profile() output
+        job_role: Target job role
+        job_description: Optional job description text
+    
+    Returns:
+        AnalysisResult: Same result as analyze_resume()
+    """
+    clock = instrumentation.section_clock("analyze")
+    text_lower = profile.text_lower
+    
+    # Job Match Analysis
+    keywords = job_role.lower().split()
+    role_keywords_found = sum([1 for word in keywords if word in text_lower])
+    match_score = _role_match_score(keywords, role_keywords_found)
+    
+    requirements = {
+        "Required Skills": (f"{profile.languages}/10", "🟢" if profile.languages > 5 else "🟡"),
+        "Experience Level": ("7/10", "🟡"),
+        "Domain Knowledge": ("6/10", "🟡"),
+        "Leadership": ("8/10", "🟢" if profile.leadership else "🟡")
+    }
+    
+    # Keyword Analysis: against the job description when there is one, else the role
+    description_similarity = None
+    if job_description.strip():
+        # Imported here so NumPy is only loaded once a description is compared
+        from reviewer.jd_match import match_resume_terms
+        
+        resume_terms, resume_years = profile.description_terms()
+        jd_match = match_resume_terms(resume_terms, resume_years, job_description)
+        keywords_present = tuple(jd_match["present"])
+        keywords_missing = tuple(jd_match["missing"])
+        description_similarity = round(jd_match["similarity"] * 100, 1)
+        
+        required_skills = jd_match["required_skills"]
+        if required_skills:
+            skill_ratio = len(jd_match["matched_skills"]) / len(required_skills)
+            requirements["Required Skills"] = (f"{len(jd_match['matched_skills'])}/{len(required_skills)}",
+                                               _rating_indicator(skill_ratio))
+        if jd_match["required_years"]:
+            years_ratio = min(jd_match["resume_years"] / jd_match["required_years"], 1.0)
+            requirements["Experience Level"] = (f"{jd_match['resume_years']}/{jd_match['required_years']} years",
+                                                _rating_indicator(years_ratio))
+        requirements["Domain Knowledge"] = (f"{round(jd_match['similarity'] * 10)}/10",
+                                            _rating_indicator(jd_match["similarity"] * 2))
+        keywords_checked = len(keywords_present) + len(keywords_missing)
+        if keywords_checked:
+            requirements["Keyword Coverage"] = (f"{len(keywords_present)}/{keywords_checked}",
+                                                _rating_indicator(len(keywords_present) / keywords_checked))
+    else:
+        keywords_present = tuple(word for word in keywords if word in text_lower)
+        keywords_missing = tuple(word for word in keywords if word not in text_lower)
+    clock.lap("job_match")
+    
+    # Calculate overall scores
+    result = AnalysisResult(
+        job_role=job_role,
+        words=profile.words,
+        sentences=profile.sentences,
+        scores=Scores(**_overall_scores(profile.hits, profile.words, match_score)),
+        clarity_score=profile.clarity_score,
+        professional_tone=profile.professional_tone,
+        has_sections=profile.has_sections,
+        skills=profile.skills,
+        missing_skills=profile.missing_skills,
+        quality_metrics=profile.quality_metrics,
+        experience_score=profile.experience_score,
+        concise=profile.concise,
+        impact_high=profile.impact_high,
+        impact_verbs=profile.impact_verbs,
+        professional=profile.professional,
+        role_match=match_score,
+        requirements=tuple((name, value, indicator) for name, (value, indicator) in requirements.items()),
+        keywords_present=keywords_present,
+        keywords_missing=keywords_missing,
+        description_similarity=description_similarity,
+        sections=profile.sections,
+        achievements=profile.achievements,
+        achievement_rating=profile.achievement_rating,
+        strong_points=profile.strong_points,
+        weak_points=profile.weak_points
+    )
+    clock.lap("scores")
+    
+    return result
+
+
+def analyze_resume(resume_text, job_role, job_description=""):
+    """
+    Advanced Resume Analysis Engine
+    Provides comprehensive AI-like analysis and detailed feedback
+    
+    When a job description is given, the resume is also compared with it
+    (TF-IDF cosine similarity, present/missing keywords, required skills and
+    years of experience); otherwise keywords are taken from the job role.
+    
+    Equivalent to match_resume_profile(build_resume_profile(resume_text), ...);
+    callers comparing one resume with several roles should build the profile
+    once and match it per role.
+    
+    Returns:
+        AnalysisResult: Typed result; it also reads like the legacy nested
+        dict (result["scores"]["overall"], ...), see reviewer.results
+    """
+    return match_resume_profile(build_resume_profile(resume_text), job_role, job_description)
+
+
+def match_roles(profile, roles):
+    """
+    Scores a profiled resume against several job roles in one pass.
+    
+    Every distinct role word is looked up in the resume once and the per-role
+    counts come from a single role-by-word matrix product, so an extra role
+    costs one matrix row rather than a full analysis. Each role's scores equal
+    those of match_resume_profile(profile, role).
+    
+    Args:
+        profile: build_resume_profile() output
+        roles: Job role names; blanks and repeats are skipped
+    
+    Returns:
+        list: One dict per role, best fit first (by overall score, then role
+        match): "rank", "role", "overall", "structure", "content", "clarity",
+        "role_match", "ats_score", "present" and "missing" role keywords
+    """
+    roles = list(dict.fromkeys(role.strip() for role in roles if role.strip()))
+    if not roles:
+        return []
+    # Imported here so NumPy is only loaded once roles are compared
+    import numpy as np
+    
+    role_keywords = [role.lower().split() for role in roles]
+    vocabulary = {}
+    for keywords in role_keywords:
+        for word in keywords:
+            vocabulary.setdefault(word, len(vocabulary))
+    
+    # Repeated words count once per occurrence, as in match_resume_profile
+    word_counts = np.zeros((len(roles), len(vocabulary)), dtype=np.int64)
+    for row, keywords in enumerate(role_keywords):
+        np.add.at(word_counts[row], [vocabulary[word] for word in keywords], 1)
+    word_found = np.fromiter((word in profile.text_lower for word in vocabulary), dtype=bool,
+                             count=len(vocabulary))
+    found_per_role = word_counts @ word_found.astype(np.int64)
+    
+    rows = []
+    for role, keywords, found in zip(roles, role_keywords, found_per_role.tolist()):
+        match_score = _role_match_score(keywords, found)
+        scores = _overall_scores(profile.hits, profile.words, match_score)
+        rows.append({
+            "role": role,
+            "overall": scores["overall"],
+            "structure": scores["structure"],
+            "content": scores["content"],
+            "clarity": scores["clarity"],
+            "role_match": match_score,
+            "ats_score": min((match_score + len(SKILL_DETAILS) * 10), 100),
+            "present": [word for word in keywords if word_found[vocabulary[word]]],
+            "missing": [word for word in keywords if not word_found[vocabulary[word]]],
+        })
+    
+    rows.sort(key=lambda row: (-row["overall"], -row["role_match"]))
+    for rank, row in enumerate(rows, 1):
+        row["rank"] = rank
+    return rows
+
+
+def analyze_resume_multi(resume_text, roles):
+    """
+    Ranks how well one resume fits each of several job roles.
+    
+    The resume is scanned and profiled once; see match_roles() for the result.
+    """
+    return match_roles(build_resume_profile(resume_text), roles)
@@ -0,0 +1,245 @@
+# reviewer/batch_scoring.py
+"""
+Vectorized scoring of many resumes against one job role.
+
+Each resume is scanned once into a row of a documents x terms hit matrix
+(every taxonomy term: professional and vague terms, sections, skills and
+indicators) and a documents x role-words matrix. The headline scores, the
+quality metrics, the writing clarity score and the role match are then
+computed for the whole batch as array operations over those matrices, and
+per document they equal what analyze_resume() reports.
+
+    score_resumes(resume_texts, "Data Engineer")
+
+Scanning is the only per-document work; scan_resume() returns a small tuple,
+so it can run in worker processes and be combined with score_scans().
+
+Imports NumPy, so it is not loaded by `import reviewer`.
+"""
+from itertools import chain
+
+import numpy as np
+
+from reviewer.analysis import (
+    COMPLEXITY_INDICATORS, ESSENTIAL_SKILLS, KEYWORD_TERMS, PROFESSIONAL_TERMS, PROJECT_INDICATORS,
+    SECTION_TERMS, VAGUE_TERMS, scan_keywords
+)
+from reviewer.results import SKILL_DETAILS
+
+# Hit-matrix columns: every canonical term the keyword scan can report
+TERMS = KEYWORD_TERMS
+TERM_COLUMNS = {term: column for column, term in enumerate(TERMS)}
+
+# Rows of the hit matrix scored per block, bounding the temporary int64 copy
+BLOCK_ROWS = 4096
+
+
+def _term_weights(terms):
+    # One count per listed occurrence, like the scalar `len([w for w in TERMS if w in hits])`
+    weights = np.zeros(len(TERMS), dtype=np.int64)
+    for term in terms:
+        column = TERM_COLUMNS.get(term)
+        if column is not None:
+            weights[column] += 1
+    return weights
+
+
+# Term groups counted per document, one matrix column each
+_SECTIONS, _PROFESSIONAL, _VAGUE, _COMPLEXITY, _PROJECTS, _SKILLS = range(6)
+_GROUP_WEIGHTS = np.stack([
+    _term_weights(SECTION_TERMS),
+    _term_weights(PROFESSIONAL_TERMS),
+    _term_weights(VAGUE_TERMS),
+    _term_weights(COMPLEXITY_INDICATORS),
+    _term_weights(PROJECT_INDICATORS),
+    _term_weights(skill for skills in SKILL_DETAILS.values() for skill in skills),
+], axis=1)
+
+# (skill, column) in display order: category by category, as in skill_categories
+_SKILL_COLUMNS = [(skill, TERM_COLUMNS[skill]) for skills in SKILL_DETAILS.values() for skill in skills]
+_ESSENTIAL_COLUMNS = [(skill, TERM_COLUMNS.get(skill)) for skill in ESSENTIAL_SKILLS]
+
+
+def role_words(job_role):
+    """
+    Splits a job role into its distinct keywords.
+
+    Returns:
+        tuple (words, counts): Distinct lowercased words and how often each
+        occurs in the role (repeats count towards the role match, as in
+        analyze_resume)
+    """
+    keywords = job_role.lower().split()
+    words = tuple(dict.fromkeys(keywords))
+    return words, np.array([keywords.count(word) for word in words], dtype=np.int64)
+
+
+def scan_resume(resume_text, words):
+    """
+    Scans one resume: the per-document part of batch scoring.
+
+    Args:
+        resume_text: Resume text
+        words: role_words(job_role)[0]
+
+    Returns:
+        tuple: (hit-matrix columns of the terms found, word count, one flag per role word)
+    """
+    text_lower = resume_text.lower()
+    return (
+        tuple(TERM_COLUMNS[term] for term in scan_keywords(text_lower)),
+        len(resume_text.split()),
+        tuple(word in text_lower for word in words)
+    )
+
+
+def hit_matrix(scans, role_word_count):
+    """
+    Assembles scan_resume() results into matrices.
+
+    Returns:
+        tuple (term_hits, role_hits, words): documents x terms and documents x
+        role-words boolean matrices, and the word count of every document
+    """
+    document_count = len(scans)
+    term_hits = np.zeros((document_count, len(TERMS)), dtype=bool)
+    rows = np.repeat(np.arange(document_count), [len(scan[0]) for scan in scans])
+    term_hits[rows, np.fromiter(chain.from_iterable(scan[0] for scan in scans), dtype=np.int64,
+                                count=len(rows))] = True
+    role_hits = np.array([scan[2] for scan in scans], dtype=bool).reshape(document_count, role_word_count)
+    words = np.fromiter((scan[1] for scan in scans), dtype=np.int64, count=document_count)
+    return term_hits, role_hits, words
+
+
+def score_matrix(term_hits, role_hits, words, job_role):
+    """
+    Scores every document of a hit matrix.
+
+    Args:
+        term_hits, role_hits, words: hit_matrix() output
+        job_role: Target job role the role words came from
+
+    Returns:
+        dict: One array per measure, one entry per document: "structure",
+        "content", "clarity", "overall" (scores), "role_match" (overall_match),
+        "ats_score", "clarity_score", "project_complexity", "technical_depth",
+        "tool_diversity" (quality metrics) and "words"
+    """
+    counts = np.empty((len(term_hits), _GROUP_WEIGHTS.shape[1]), dtype=np.int64)
+    for start in range(0, len(term_hits), BLOCK_ROWS):
+        counts[start:start + BLOCK_ROWS] = term_hits[start:start + BLOCK_ROWS] @ _GROUP_WEIGHTS
+
+    keywords = job_role.lower().split()
+    if keywords:
+        found = role_hits.astype(np.int64) @ role_words(job_role)[1]
+        role_match = np.minimum((found / len(keywords)) * 100, 100)
+    else:
+        role_match = np.full(len(term_hits), 50, dtype=np.int64)
+
+    structure = np.minimum(counts[:, _SECTIONS] * 30, 100)
+    content = np.minimum(role_match, 100)
+    clarity = np.minimum(100, np.maximum(20, np.minimum(words // 10, 100)))
+    return {
+        "structure": structure,
+        "content": content,
+        "clarity": clarity,
+        "overall": (structure + content + clarity) // 3,
+        "role_match": role_match,
+        "ats_score": np.minimum(role_match + len(SKILL_DETAILS) * 10, 100),
+        "clarity_score": np.minimum(counts[:, _PROFESSIONAL] * 10 + (100 - counts[:, _VAGUE] * 20), 100),
+        "project_complexity": np.minimum(counts[:, _COMPLEXITY] * 0.25, 1.0),
+        "technical_depth": np.minimum(counts[:, _SKILLS] * 0.1, 1.0),
+        "tool_diversity": np.minimum(counts[:, _PROJECTS] * 0.2, 1.0),
+        "words": words,
+    }
+
+
+def detected_skills(term_hits):
+    """
+    Lists the detected and the missing essential skills of every document.
+
+    Returns:
+        tuple (skills, missing): Per-document lists, in the order of
+        skill_categories / missing_skills
+    """
+    skills = [[] for _ in range(len(term_hits))]
+    skill_names = [skill for skill, _ in _SKILL_COLUMNS]
+    # np.nonzero walks row by row, so each document's skills keep display order
+    for row, position in zip(*np.nonzero(term_hits[:, [column for _, column in _SKILL_COLUMNS]])):
+        skills[row].append(skill_names[position])
+
+    missing = [[] for _ in range(len(term_hits))]
+    for skill, column in _ESSENTIAL_COLUMNS:
+        absent = range(len(term_hits)) if column is None else np.flatnonzero(~term_hits[:, column])
+        for row in absent:
+            missing[row].append(skill)
+    return skills, missing
+
+
+def skill_columns(term_hits):
+    """
+    Lists the detected and the missing essential skills of every document as
+    batch output columns. They do not depend on the role, so callers scoring
+    the same documents again can keep them.
+
+    Returns:
+        list: One {"skills", "missing_skills"} dict (comma-separated names) per document
+    """
+    skills, missing_skills = detected_skills(term_hits)
+    return [{"skills": ", ".join(found), "missing_skills": ", ".join(missing)}
+            for found, missing in zip(skills, missing_skills)]
+
+
+def score_rows(term_hits, role_hits, words, job_role, skills=None):
+    """
+    Scores every document of a hit matrix into batch output columns.
+
+    Args:
+        term_hits, role_hits, words: hit_matrix() output
+        job_role: Target job role the role words came from
+        skills: skill_columns(term_hits), if already known
+
+    Returns:
+        list: One dict per document with structure_score, content_score,
+        clarity_score, overall_score, role_match, ats_score, skills and
+        missing_skills
+    """
+    scores = {name: values.tolist() for name, values in
+              score_matrix(term_hits, role_hits, words, job_role).items()}
+    if skills is None:
+        skills = skill_columns(term_hits)
+    rows = []
+    for index, skill_row in enumerate(skills):
+        row = {
+            "structure_score": scores["structure"][index],
+            "content_score": scores["content"][index],
+            "clarity_score": scores["clarity"][index],
+            "overall_score": scores["overall"][index],
+            "role_match": scores["role_match"][index],
+            "ats_score": scores["ats_score"][index],
+        }
+        row.update(skill_row)
+        rows.append(row)
+    return rows
+
+
+def score_scans(scans, job_role):
+    """
+    Scores scan_resume() results (scanned with role_words(job_role)[0]).
+
+    Returns:
+        dict: See score_matrix()
+    """
+    term_hits, role_hits, words = hit_matrix(scans, len(role_words(job_role)[0]))
+    return score_matrix(term_hits, role_hits, words, job_role)
+
+
+def score_resumes(resume_texts, job_role):
+    """
+    Scores many resumes against one job role in one vectorized pass.
+
+    Returns:
+        dict: See score_matrix()
+    """
+    words = role_words(job_role)[0]
+    return score_scans([scan_resume(resume_text, words) for resume_text in resume_texts], job_role)
@@ -0,0 +1,295 @@
+# reviewer/extraction.py
+"""
+Resume text extraction for PDF and TXT files. Has no UI dependencies, and
+the PDF libraries are only imported once a PDF actually has to be parsed.
+Which library parses a given PDF is decided per document by pdf_backends.
+
+Uploads are checked against a size cap before anything is read, and PDFs
+against a page cap before any page is parsed. PDFs above the spool threshold
+are copied to a temporary file that the backends read from disk (pdfplumber
+through a read-only memory map; worker processes open the same file instead
+of receiving a copy), so the memory a session holds stays close to the
+upload itself.
+"""
+import io
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager
+
+from reviewer import instrumentation, pdf_backends
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.txt')
+
+# PDFs with fewer pages than this are parsed in-process; below it the cost of
+# shipping the file to worker processes outweighs the parallel speed-up.
+# Only the layout-aware backend is split across processes, and under the
+# default "auto" policy it only parses single-page PDFs (see
+# pdf_backends.select_backend). The pool therefore serves layout=True callers,
+# RESUME_PDF_BACKEND=pdfplumber and installs without pypdfium2.
+PARALLEL_MIN_PAGES = 8
+EXTRACTION_WORKERS = int(os.environ.get("RESUME_EXTRACTION_WORKERS", os.cpu_count() or 1))
+
+# Keep RESUME_MAX_UPLOAD_MB in line with server.maxUploadSize in .streamlit/config.toml
+MAX_UPLOAD_BYTES = int(float(os.environ.get("RESUME_MAX_UPLOAD_MB", "10")) * 1024 * 1024)
+MAX_PDF_PAGES = int(os.environ.get("RESUME_MAX_PDF_PAGES", "50"))
+SPOOL_THRESHOLD_BYTES = int(float(os.environ.get("RESUME_SPOOL_THRESHOLD_MB", "2")) * 1024 * 1024)
+SPOOL_CHUNK_BYTES = 1024 * 1024
+
+_page_pool = None
+
+
+class UnsupportedFileType(ValueError):
+    """Raised for uploads that are neither PDF nor TXT."""
+
+
+class UploadRejected(ValueError):
+    """Raised for uploads over the size or page limits, before they are parsed."""
+
+
+def upload_size(uploaded_file):
+    """
+    Returns the size of an upload in bytes without reading it.
+    """
+    size = getattr(uploaded_file, "size", None)  # set on Streamlit's UploadedFile
+    if size is None:
+        position = uploaded_file.tell()
+        size = uploaded_file.seek(0, io.SEEK_END)
+        uploaded_file.seek(position)
+    return size
+
+
+def check_size(size, max_bytes=None):
+    """
+    Raises UploadRejected if `size` (bytes) is over `max_bytes` (default MAX_UPLOAD_BYTES).
+    """
+    max_bytes = MAX_UPLOAD_BYTES if max_bytes is None else max_bytes
+    if size > max_bytes:
+        raise UploadRejected(
+            f"File is {size / (1024 * 1024):.1f} MB; the limit is {max_bytes / (1024 * 1024):.1f} MB."
+        )
+
+
+def check_upload_size(uploaded_file, max_bytes=None):
+    """
+    Raises UploadRejected if the upload is larger than `max_bytes`
+    (default MAX_UPLOAD_BYTES), without reading it.
+    """
+    check_size(upload_size(uploaded_file), max_bytes)
+
+
+def _get_page_pool():
+    """
+    Returns the process pool shared by all parallel extractions, creating it on first use.
+    """
+    global _page_pool
+    if _page_pool is None:
+        # Spawned (not forked) workers, since the Streamlit server is multi-threaded
+        _page_pool = ProcessPoolExecutor(
+            max_workers=EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _page_pool
+
+
+@contextmanager
+def _spooled_pdf(uploaded_file):
+    """
+    Yields a PDF source for the backends: the bytes of small uploads, or the
+    path of a temporary copy for uploads above SPOOL_THRESHOLD_BYTES (removed
+    afterwards).
+    """
+    if upload_size(uploaded_file) <= SPOOL_THRESHOLD_BYTES:
+        yield uploaded_file.getvalue()
+        return
+
+    import shutil
+    import tempfile
+
+    fd, path = tempfile.mkstemp(prefix="resume-", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            uploaded_file.seek(0)
+            shutil.copyfileobj(uploaded_file, spool, SPOOL_CHUNK_BYTES)
+        yield path
+    finally:
+        os.unlink(path)
+
+
+def _check_page_count(page_count):
+    if page_count > MAX_PDF_PAGES:
+        raise UploadRejected(f"PDF has {page_count} pages; the limit is {MAX_PDF_PAGES}.")
+
+
+def _capped_pages(page_texts):
+    """
+    Passes page texts through, raising UploadRejected at the first page past
+    MAX_PDF_PAGES. The page cap is checked against the count a PDF declares
+    (pdfplumber trusts the page tree's /Count), so a PDF that understates it
+    is stopped here instead.
+    """
+    for page_number, page_text in enumerate(page_texts, 1):
+        if page_number > MAX_PDF_PAGES:
+            raise UploadRejected(f"PDF has more than {MAX_PDF_PAGES} pages; the limit is {MAX_PDF_PAGES}.")
+        yield page_text
+
+
+def _extract_pages(backend_name, source, start=0, stop=None):
+    """
+    Yields the text of pages [start, stop) of a PDF (bytes or spooled file
+    path) with the named backend.
+
+    Pages for which a text-only backend finds nothing are re-read with the
+    layout-aware backend before giving up on them.
+    """
+    backend = pdf_backends.get_backend(backend_name)
+    with ExitStack() as stack:
+        document = stack.enter_context(backend.open(source))
+        fallback = fallback_document = None
+        for page_number, page_text in enumerate(backend.page_texts(document, start, stop), start):
+            if not backend.layout_aware and not (page_text and page_text.strip()):
+                if fallback_document is None:
+                    fallback = pdf_backends.get_backend(pdf_backends.LAYOUT_BACKEND)
+                    fallback_document = stack.enter_context(fallback.open(source))
+                page_text = next(fallback.page_texts(fallback_document, page_number, page_number + 1), None)
+                instrumentation.count("extract.fallback_pages")
+            yield page_text
+
+
+def _extract_page_range(backend_name, source, start, stop):
+    """
+    Extracts the text of pages [start, stop) of a PDF. Runs inside a worker process.
+    """
+    return list(_extract_pages(backend_name, source, start, stop))
+
+
+def _iter_pdf_pages(source, size, backend=None, layout=False):
+    """
+    Yields the text of every page of a PDF, in page order.
+
+    The page count is read first (with the cheapest backend) and checked
+    against MAX_PDF_PAGES; then the extraction backend is chosen for the
+    document (see pdf_backends.select_backend) unless one is forced. Long
+    documents on a slow backend are split into one contiguous page range per
+    worker and parsed in parallel, yielding each range as soon as it (and
+    every range before it) is done. Everything else, or any pool failure,
+    uses a serial pass. Under the default policy long documents go to the
+    fast text-only backend, which is not split (see PARALLEL_MIN_PAGES).
+
+    No more than MAX_PDF_PAGES + 1 pages are read whatever the declared count:
+    the extra page proves the count was short, and the PDF is rejected.
+
+    Yields:
+        str or None: Page text (None for pages without text)
+
+    Raises:
+        UploadRejected: If the PDF has more than MAX_PDF_PAGES pages
+    """
+    counter = pdf_backends.page_count_backend()
+    with counter.open(source) as document:
+        page_count = counter.page_count(document)
+    _check_page_count(page_count)
+
+    selected = pdf_backends.get_backend(backend) if backend else \
+        pdf_backends.select_backend(size, page_count, layout=layout)
+    instrumentation.count(f"extract.backend.{selected.name}")
+    yield from _capped_pages(_read_pdf_pages(selected, source, page_count))
+
+
+def _read_pdf_pages(selected, source, page_count):
+    # See _iter_pdf_pages; reads pages [0, MAX_PDF_PAGES + 1)
+    page_limit = MAX_PDF_PAGES + 1
+    if not selected.parallel or page_count < PARALLEL_MIN_PAGES or EXTRACTION_WORKERS < 2:
+        yield from _extract_pages(selected.name, source, 0, page_limit)
+        return
+
+    pages_per_task = math.ceil(page_count / EXTRACTION_WORKERS)
+    pages_done = 0
+    try:
+        pool = _get_page_pool()
+        # The last range runs to the page limit, in case the declared count was short
+        futures = [
+            pool.submit(_extract_page_range, selected.name, source, start,
+                        start + pages_per_task if start + pages_per_task < page_count else page_limit)
+            for start in range(0, page_count, pages_per_task)
+        ]
+        for future in futures:
+            for page_text in future.result():
+                yield page_text
+                pages_done += 1
+    except BrokenProcessPool:
+        global _page_pool
+        _page_pool = None
+        yield from _extract_pages(selected.name, source, pages_done, page_limit)
+
+
+def iter_resume_pages(uploaded_file, backend=None, layout=False):
+    """
+    Yields the text of a PDF or TXT resume one page at a time, as soon as each
+    page has been extracted.
+
+    Args:
+        uploaded_file: File-like object with a `name` (e.g. from st.file_uploader)
+        backend: Optional PDF backend name to force (see pdf_backends.BACKENDS)
+        layout: Whether PDF text must come from the layout-aware backend
+
+    Yields:
+        str: Page text ("" for pages without text; a TXT file is a single page)
+
+    Raises:
+        UnsupportedFileType: If the file is neither a PDF nor a TXT file
+        UploadRejected: If the file is over MAX_UPLOAD_BYTES, or a PDF over MAX_PDF_PAGES
+    """
+    file_name = uploaded_file.name.lower()
+
+    if file_name.endswith('.pdf'):
+        check_upload_size(uploaded_file)
+        with _spooled_pdf(uploaded_file) as source:
+            for page_text in _iter_pdf_pages(source, upload_size(uploaded_file), backend, layout):
+                yield page_text or ""
+    elif file_name.endswith('.txt'):
+        check_upload_size(uploaded_file)
+        if hasattr(uploaded_file, "getbuffer"):
+            # Decode straight from the upload's buffer rather than a copy of it
+            with uploaded_file.getbuffer() as buffer:
+                text = str(buffer, "utf-8")
+            yield text
+        else:
+            yield uploaded_file.read().decode("utf-8")
+    else:
+        raise UnsupportedFileType("Unsupported file type. Please upload a PDF or TXT file.")
+
+
+def extract_text(uploaded_file, on_page=None, backend=None, layout=False):
+    """
+    Extracts the full text of a PDF or TXT resume.
+
+    Args:
+        uploaded_file: File-like object with a `name` (e.g. from st.file_uploader)
+        on_page: Optional callback(page_number, page_text) called as each page
+            is extracted, e.g. to show progress or partial scores
+        backend: Optional PDF backend name to force (default: chosen per document)
+        layout: Whether PDF text must come from the layout-aware backend
+
+    Returns:
+        tuple (text, page_count): Extracted text content and number of pages
+        (text files count as a single page)
+
+    Raises:
+        UnsupportedFileType: If the file is neither a PDF nor a TXT file
+        UploadRejected: If the file is over the size or page limits
+        Exception: Whatever the PDF parser or UTF-8 decoder raises for a broken file
+    """
+    clock = instrumentation.section_clock("extract")
+    page_texts = []
+    for page_text in iter_resume_pages(uploaded_file, backend, layout):
+        clock.lap("page")
+        page_texts.append(page_text)
+        if on_page is not None:
+            on_page(len(page_texts), page_text)
+            clock.lap("on_page")
+    instrumentation.count("extract.pages", len(page_texts))
+    text = "\n".join(page_text for page_text in page_texts if page_text)
+    return text.strip(), len(page_texts)
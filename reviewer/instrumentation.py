@@ -0,0 +1,264 @@
+# reviewer/instrumentation.py
+"""
+Lightweight per-run timing, counters and optional profiling.
+
+A trace is started for the current thread (Streamlit runs each session's
+script on its own thread, so sessions never share one) and every timer or
+counter in the code records into it. When no trace is active, timed() and
+section_clock() hand back shared no-op objects, so instrumented code pays a
+thread-local lookup and nothing else.
+
+    trace = start_trace(profiler="cprofile")
+    with timed("analyze.total"), profile():
+        ...
+    end_trace().to_json()
+"""
+import importlib.util
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+PROFILERS = ("cprofile", "pyinstrument")
+PYINSTRUMENT_AVAILABLE = importlib.util.find_spec("pyinstrument") is not None
+PROFILE_TOP_FUNCTIONS = 30
+
+_local = threading.local()
+_NULL_TIMER = nullcontext()
+
+
+class Trace:
+    """
+    Timings and counters collected during one run (e.g. one Streamlit rerun).
+
+    Stages are keyed by dotted names ("extract.page", "analyze.skills") and
+    keep a count, total and maximum, so per-page timers aggregate naturally.
+    """
+
+    def __init__(self, profiler=None):
+        if profiler is not None and profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler {profiler!r}; expected one of {PROFILERS}")
+        self.profiler = profiler
+        self.started_at = time.time()
+        self.wall_time = None
+        self.stages = {}
+        self.counters = {}
+        self.profile_text = ""
+        self._start = time.perf_counter()
+
+    def record(self, name, seconds):
+        """
+        Adds one timing sample to stage `name`.
+        """
+        stage = self.stages.get(name)
+        if stage is None:
+            self.stages[name] = [1, seconds, seconds]
+        else:
+            stage[0] += 1
+            stage[1] += seconds
+            if seconds > stage[2]:
+                stage[2] = seconds
+
+    def count(self, name, amount=1):
+        """
+        Increments counter `name`.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other):
+        """
+        Adds the stages, counters and profile of `other` (e.g. a trace recorded
+        on a worker thread) into this trace.
+        """
+        for name, (count, total, longest) in other.stages.items():
+            stage = self.stages.get(name)
+            if stage is None:
+                self.stages[name] = [count, total, longest]
+            else:
+                stage[0] += count
+                stage[1] += total
+                if longest > stage[2]:
+                    stage[2] = longest
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+        self.profile_text += other.profile_text
+
+    @property
+    def is_empty(self):
+        return not self.stages and not self.counters and not self.profile_text
+
+    def finish(self):
+        self.wall_time = time.perf_counter() - self._start
+        return self
+
+    def to_dict(self):
+        """
+        Returns the trace as plain data (milliseconds), ready for json.dumps.
+        """
+        return {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "wall_ms": round(self.wall_time * 1000, 3) if self.wall_time is not None else None,
+            "stages": {
+                name: {
+                    "count": count,
+                    "total_ms": round(total * 1000, 3),
+                    "mean_ms": round(total * 1000 / count, 3),
+                    "max_ms": round(longest * 1000, 3),
+                }
+                for name, (count, total, longest) in self.stages.items()
+            },
+            "counters": dict(self.counters),
+            "profiler": self.profiler,
+            "profile": self.profile_text,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class _Timer:
+    __slots__ = ("_trace", "_name", "_start")
+
+    def __init__(self, trace, name):
+        self._trace = trace
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._trace.record(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class SectionClock:
+    """
+    Times consecutive sections of a long function without re-indenting it:
+    each lap(name) records the time since the previous lap (or since the
+    clock was created) as stage "<prefix>.<name>".
+    """
+
+    __slots__ = ("_trace", "_prefix", "_last")
+
+    def __init__(self, trace, prefix):
+        self._trace = trace
+        self._prefix = prefix
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        now = time.perf_counter()
+        self._trace.record(f"{self._prefix}.{name}", now - self._last)
+        self._last = now
+
+
+class _NullClock:
+    __slots__ = ()
+
+    def lap(self, name):
+        pass
+
+
+_NULL_CLOCK = _NullClock()
+
+
+def start_trace(profiler=None):
+    """
+    Starts collecting into a new trace on the current thread, replacing any active one.
+
+    Args:
+        profiler: None, "cprofile" or "pyinstrument"; used by profile() blocks
+
+    Returns:
+        Trace: The new trace
+    """
+    _local.trace = Trace(profiler)
+    return _local.trace
+
+
+def end_trace():
+    """
+    Stops collecting on the current thread.
+
+    Returns:
+        Trace or None: The finished trace, if one was active
+    """
+    trace = getattr(_local, "trace", None)
+    _local.trace = None
+    return trace.finish() if trace is not None else None
+
+
+def current_trace():
+    """
+    Returns the trace active on the current thread, or None.
+    """
+    return getattr(_local, "trace", None)
+
+
+def timed(name):
+    """
+    Context manager recording the duration of its block as stage `name`.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _NULL_TIMER
+    return _Timer(trace, name)
+
+
+def section_clock(prefix):
+    """
+    Returns a SectionClock for stages "<prefix>.*" (a no-op clock when no trace is active).
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _NULL_CLOCK
+    return SectionClock(trace, prefix)
+
+
+def count(name, amount=1):
+    """
+    Increments counter `name` on the active trace, if any.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.count(name, amount)
+
+
+@contextmanager
+def profile(label="profile"):
+    """
+    Profiles the block with the active trace's profiler and appends the report
+    to trace.profile_text. Does nothing when there is no trace or it has no
+    profiler.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None or trace.profiler is None:
+        yield
+        return
+
+    if trace.profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            report = profiler.output_text(unicode=True)
+            trace.profile_text += f"== {label} (pyinstrument) ==\n{report}\n"
+        return
+
+    import cProfile
+    import io
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        trace.profile_text += f"== {label} (cProfile) ==\n{output.getvalue()}\n"
@@ -0,0 +1,238 @@
+# reviewer/jd_match.py
+"""
+Job-description matching with sparse TF-IDF vectors.
+
+Resumes and the job description are turned into term lists (skills are folded
+to their canonical taxonomy name, so "k8s" and "Kubernetes" count as the same
+term), weighted with sublinear TF and smoothed IDF, and compared by cosine
+similarity. Vectors are stored CSR-style in NumPy arrays, so scoring one job
+description against many resumes is a handful of array operations.
+"""
+import re
+from collections import Counter
+
+import numpy as np
+
+from reviewer.analysis import KEYWORD_INDEX, TECHNICAL_SKILLS
+from reviewer.matcher import tokenize
+
+STOPWORDS = frozenset("""
+a about above after all also am an and any are as at be been being below both but by can could did do
+does doing down during each etc few for from further had has have having he her here hers him his how i
+if in into is it its itself just me more most my no nor not now of off on once only or other our ours
+out over own per plus same she should so some such than that the their theirs them then there these
+they this those through to too under until up us very via was we were what when where which while who
+whom why will with within without would you your yours
+ability able across candidate candidates company etc including job looking must new position preferred
+required requirements responsibilities role strong using work working year years yrs
+""".split())
+
+SKILL_NAMES = frozenset(skill for skills in TECHNICAL_SKILLS.values() for skill in skills)
+
+# Single-token skill spellings ("java", "k8s", "postgres"); these are replaced by
+# the canonical skill term instead of being counted twice
+_SKILL_TOKENS = frozenset(
+    tokens[0]
+    for skills in TECHNICAL_SKILLS.values()
+    for skill, info in skills.items()
+    for tokens in (tokenize(phrase.lower()) for phrase in (skill,) + info.get("aliases", ()))
+    if len(tokens) == 1
+)
+
+_YEARS_PATTERN = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b")
+
+
+def extract_terms(text_lower):
+    """
+    Turns already-lowercased text into the term list used for TF-IDF.
+
+    Returns:
+        list: Content tokens (stopwords and numbers such as "5+" dropped) plus one
+        canonical name per detected skill
+    """
+    tokens = tokenize(text_lower)
+    terms = [
+        token for token in tokens
+        if len(token) > 1 and token not in STOPWORDS and token not in _SKILL_TOKENS and not token[0].isdigit()
+    ]
+    terms.extend(KEYWORD_INDEX.find(tokens) & SKILL_NAMES)
+    return terms
+
+
+def years_mentioned(text_lower):
+    """
+    Returns the largest "N years" figure in the text, or 0 if there is none.
+    """
+    return max((int(years) for years in _YEARS_PATTERN.findall(text_lower)), default=0)
+
+
+def count_terms(term_lists, vocabulary):
+    """
+    Counts the terms of each list into CSR-style arrays.
+
+    Args:
+        term_lists: extract_terms() lists, one per row
+        vocabulary: {term: column} dict; new terms are added to it
+
+    Returns:
+        tuple (row_ids, indices, counts): one entry per non-zero cell, in
+        first-occurrence order within each row
+    """
+    row_ids, indices, counts = [], [], []
+    for row, terms in enumerate(term_lists):
+        for term, count in Counter(terms).items():
+            row_ids.append(row)
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            counts.append(count)
+    return (np.asarray(row_ids, dtype=np.int64), np.asarray(indices, dtype=np.int64),
+            np.asarray(counts, dtype=np.int64))
+
+
+def _tfidf_weights(row_ids, indices, counts, doc_count, vocabulary_size):
+    """
+    Returns the L2-normalized TF-IDF weight of every cell of count_terms() output.
+    """
+    doc_freq = np.bincount(indices, minlength=vocabulary_size)
+    idf = np.log((1 + doc_count) / (1 + doc_freq)) + 1
+    weights = (1 + np.log(counts.astype(np.float64))) * idf[indices]
+
+    norms = np.sqrt(np.bincount(row_ids, weights=weights ** 2, minlength=doc_count))
+    norms[norms == 0] = 1.0
+    weights /= norms[row_ids]
+    return weights
+
+
+def match_term_lists(resume_term_lists, description_terms, top_n=15):
+    """
+    Scores many resumes against one job description in a single vectorized pass.
+
+    Args:
+        resume_term_lists: One extract_terms() list per resume
+        description_terms: extract_terms() of the job description
+        top_n: Number of highest-weighted job-description terms to report on
+
+    Returns:
+        list: One dict per resume with "similarity" (cosine, 0-1), "present"
+        and "missing" (top job-description terms, by weight, then alphabetically), "required_skills"
+        and "matched_skills"
+    """
+    vocabulary = {}
+    row_ids, indices, counts = count_terms(resume_term_lists, vocabulary)
+    return match_term_counts(vocabulary, row_ids, indices, counts, len(resume_term_lists),
+                             description_terms, top_n)
+
+
+def match_term_counts(vocabulary, row_ids, indices, counts, resume_count, description_terms, top_n=15):
+    """
+    Like match_term_lists(), for resumes already counted with count_terms()
+    (e.g. kept by a resume index), so only the job description is tokenized.
+
+    Args:
+        vocabulary, row_ids, indices, counts: count_terms() output; left unchanged
+        resume_count: Number of resume rows
+        description_terms: extract_terms() of the job description
+        top_n: Number of highest-weighted job-description terms to report on
+
+    Returns:
+        list: See match_term_lists()
+    """
+    if not resume_count:
+        return []
+    # Row 0 is the job description, rows 1..N the resumes. Description terms
+    # no resume uses get columns after the vocabulary, for this call only
+    description_counts = Counter(description_terms)
+    new_terms = {}
+    description_indices = []
+    for term in description_counts:
+        column = vocabulary.get(term)
+        if column is None:
+            column = new_terms.setdefault(term, len(vocabulary) + len(new_terms))
+        description_indices.append(column)
+    terms = list(vocabulary) + list(new_terms)
+
+    row_ids = np.concatenate([np.zeros(len(description_counts), dtype=np.int64), row_ids + 1])
+    indices = np.concatenate([np.asarray(description_indices, dtype=np.int64), indices])
+    counts = np.concatenate([np.fromiter(description_counts.values(), dtype=np.int64,
+                                         count=len(description_counts)), counts])
+    doc_count = resume_count + 1
+    weights = _tfidf_weights(row_ids, indices, counts, doc_count, len(terms))
+
+    description_cells = row_ids == 0
+    description_vector = np.zeros(len(terms))
+    description_vector[indices[description_cells]] = weights[description_cells]
+    similarities = np.bincount(row_ids, weights=weights * description_vector[indices], minlength=doc_count)
+
+    # Job-description terms by descending weight, ties broken by the term itself.
+    # Weights are rounded first: the batch and index paths sum in different
+    # orders, and equal weights must not differ in the last bits
+    description_columns = indices[description_cells]
+    description_order = np.lexsort((
+        np.array([terms[column] for column in description_columns]),
+        -np.round(weights[description_cells], 9)
+    ))
+    description_columns = description_columns[description_order]
+
+    # Presence of every job-description term in every resume, as one boolean matrix
+    column_position = np.full(len(terms), -1)
+    column_position[description_columns] = np.arange(len(description_columns))
+    present = np.zeros((doc_count, len(description_columns)), dtype=bool)
+    cell_positions = column_position[indices]
+    in_description = cell_positions >= 0
+    present[row_ids[in_description], cell_positions[in_description]] = True
+
+    top_columns = description_columns[:top_n]
+    skill_positions = [i for i, column in enumerate(description_columns) if terms[column] in SKILL_NAMES]
+    required_skills = [terms[description_columns[i]] for i in skill_positions]
+
+    results = []
+    for row in range(1, doc_count):
+        row_present = present[row]
+        results.append({
+            "similarity": float(similarities[row]),
+            "present": [terms[column] for i, column in enumerate(top_columns) if row_present[i]],
+            "missing": [terms[column] for i, column in enumerate(top_columns) if not row_present[i]],
+            "required_skills": required_skills,
+            "matched_skills": [terms[description_columns[i]] for i in skill_positions if row_present[i]]
+        })
+    return results
+
+
+def match_columns(match):
+    """
+    Flattens one match_term_lists() result into batch output columns.
+
+    Returns:
+        dict: jd_similarity (percent), jd_skills_matched ("matched/required")
+        and jd_missing_terms (comma-separated)
+    """
+    return {
+        "jd_similarity": round(match["similarity"] * 100, 1),
+        "jd_skills_matched": f"{len(match['matched_skills'])}/{len(match['required_skills'])}",
+        "jd_missing_terms": ", ".join(match["missing"]),
+    }
+
+
+def match_resume_terms(resume_terms, resume_years, job_description, top_n=15):
+    """
+    Compares one resume, given as its extract_terms() list and years_mentioned()
+    figure (e.g. precomputed by a ResumeProfile), with a job description.
+
+    Returns:
+        dict: See match_term_lists(), plus "required_years" and "resume_years"
+    """
+    description_lower = job_description.lower()
+    result = match_term_lists([resume_terms], extract_terms(description_lower), top_n)[0]
+    result["required_years"] = years_mentioned(description_lower)
+    result["resume_years"] = resume_years
+    return result
+
+
+def match_job_description(resume_text, job_description, top_n=15):
+    """
+    Compares one resume with a job description.
+
+    Returns:
+        dict: See match_resume_terms()
+    """
+    resume_lower = resume_text.lower()
+    return match_resume_terms(extract_terms(resume_lower), years_mentioned(resume_lower), job_description, top_n)
@@ -0,0 +1,142 @@
+# reviewer/matcher.py
+"""
+Token-boundary phrase matching for large keyword taxonomies.
+
+Text is split into tokens once, and phrases are looked up in an index keyed by
+tokens, so the cost of a scan grows with the length of the resume rather than
+with the number of phrases. Matching respects token boundaries: "java" does not
+fire on "javascript", nor "spring" on "springfield".
+"""
+import re
+
+# Letters/digits, plus the "+" and "#" that end names like c++, c# and f#.
+# Everything else (spaces, punctuation, "/", ".") separates tokens, so
+# "CI/CD" -> ["ci", "cd"] and "Node.js" -> ["node", "js"].
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+_END = None  # trie key marking the end of a phrase; never a token
+
+
+def tokenize(text_lower):
+    """
+    Splits already-lowercased text into matching tokens.
+
+    Returns:
+        list: Tokens in document order
+    """
+    return TOKEN_PATTERN.findall(text_lower)
+
+
+class PhraseIndex:
+    """
+    Maps phrases (one or more tokens) to keys, e.g. aliases to canonical skill names.
+
+    Single-token phrases are resolved with one set intersection against the
+    resume's tokens; multi-token phrases are found by walking a token trie from
+    each position. Neither depends on how many phrases are indexed.
+    """
+
+    def __init__(self, phrases=()):
+        self._single = {}
+        self._trie = {}
+        self._keys = {}
+        self.phrase_count = 0
+        self.max_phrase_tokens = 0
+        for phrase, key in phrases:
+            self.add(phrase, key)
+
+    def add(self, phrase, key):
+        """
+        Indexes `phrase` (any case, any punctuation) so that matches report `key`.
+        """
+        tokens = tokenize(phrase.lower())
+        if not tokens:
+            return
+        self.phrase_count += 1
+        self._keys[key] = None
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(tokens))
+        if len(tokens) == 1:
+            self._single.setdefault(tokens[0], set()).add(key)
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(_END, set()).add(key)
+
+    def keys(self):
+        """
+        Returns every key that can be reported, in the order first indexed.
+        """
+        return tuple(self._keys)
+
+    def find(self, tokens):
+        """
+        Finds every indexed phrase in a token sequence.
+
+        Args:
+            tokens: Output of tokenize()
+
+        Returns:
+            set: Keys of all phrases that occur
+        """
+        keys = set()
+        for token in self._single.keys() & set(tokens):
+            keys |= self._single[token]
+
+        trie = self._trie
+        if trie:
+            token_count = len(tokens)
+            for start, token in enumerate(tokens):
+                node = trie.get(token)
+                position = start + 1
+                while node is not None:
+                    if _END in node:
+                        keys |= node[_END]
+                    if position == token_count:
+                        break
+                    node = node.get(tokens[position])
+                    position += 1
+        return keys
+
+    def find_grouped(self, token_groups):
+        """
+        Finds every indexed phrase in consecutive token lists (e.g. one per
+        resume section), reporting each phrase in the list where it starts.
+        Phrases may run on into the following lists, as if they were joined, so
+        the union of the results equals find() over the joined tokens.
+
+        Args:
+            token_groups: tokenize() outputs of consecutive parts of one text
+
+        Returns:
+            list: One set of keys per group
+        """
+        tokens = [token for group in token_groups for token in group]
+        token_count = len(tokens)
+        trie = self._trie
+        results = []
+        group_start = 0
+        for group in token_groups:
+            keys = set()
+            for token in self._single.keys() & set(group):
+                keys |= self._single[token]
+            if trie:
+                for start, token in enumerate(group, group_start):
+                    node = trie.get(token)
+                    position = start + 1
+                    while node is not None:
+                        if _END in node:
+                            keys |= node[_END]
+                        if position == token_count:
+                            break
+                        node = node.get(tokens[position])
+                        position += 1
+            results.append(keys)
+            group_start += len(group)
+        return results
+
+    def find_in_text(self, text_lower):
+        """
+        Tokenizes already-lowercased text and returns the keys of every phrase in it.
+        """
+        return self.find(tokenize(text_lower))
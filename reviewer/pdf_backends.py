@@ -0,0 +1,209 @@
+# reviewer/pdf_backends.py
+"""
+Pluggable PDF text-extraction backends and the policy that picks one.
+
+- "pdfplumber": layout-aware; builds per-character layout objects, so it is
+  accurate but slow on long documents.
+- "pdfium": text-only via pypdfium2 (already installed with pdfplumber);
+  reads each page's text layer without building layout objects, typically
+  tens of times faster.
+
+A backend opens a source (PDF bytes, or the path of a spooled file), reports
+its page count and yields page texts. Neither library is imported until a
+backend is actually used. Set RESUME_PDF_BACKEND to "pdfplumber" or "pdfium"
+to force one; the default "auto" applies select_backend().
+"""
+import importlib.util
+import io
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+
+PDF_BACKEND = os.environ.get("RESUME_PDF_BACKEND", "auto")
+# Documents at least this long (or large) take the fast path under "auto";
+# a single short page is cheap enough for the layout-aware parser
+FAST_PATH_MIN_PAGES = int(os.environ.get("RESUME_FAST_PATH_MIN_PAGES", "2"))
+FAST_PATH_MIN_BYTES = int(float(os.environ.get("RESUME_FAST_PATH_MIN_MB", "1")) * 1024 * 1024)
+
+
+class PdfBackend:
+    """
+    Interface for a PDF text-extraction engine.
+
+    Attributes:
+        name: Registry key
+        layout_aware: Whether text comes from a character-level layout analysis
+        parallel: Whether long documents are worth splitting across processes
+    """
+    name = None
+    layout_aware = False
+    parallel = False
+
+    def available(self):
+        return True
+
+    def open(self, source):
+        """
+        Context manager yielding an open document for `source` (bytes or file path).
+        """
+        raise NotImplementedError
+
+    def page_count(self, document):
+        raise NotImplementedError
+
+    def page_texts(self, document, start, stop=None):
+        """
+        Yields the text of pages [start, stop) (to the last page when stop is
+        None), None for pages without text.
+        """
+        raise NotImplementedError
+
+
+class PdfplumberBackend(PdfBackend):
+    name = "pdfplumber"
+    layout_aware = True
+    parallel = True
+
+    @contextmanager
+    def open(self, source):
+        import pdfplumber
+
+        if isinstance(source, bytes):
+            with pdfplumber.open(io.BytesIO(source)) as pdf:
+                yield pdf
+            return
+
+        with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with pdfplumber.open(mapped) as pdf:
+                yield pdf
+
+    def page_count(self, document):
+        # The count declared in the page tree, without loading every page object
+        from pdfminer.pdftypes import resolve1
+
+        try:
+            return int(resolve1(resolve1(document.doc.catalog["Pages"])["Count"]))
+        except Exception:
+            return len(document.pages)
+
+    def page_texts(self, document, start, stop=None):
+        for page in document.pages[start:stop]:
+            yield page.extract_text()
+            page.flush_cache()
+
+
+class PdfiumBackend(PdfBackend):
+    name = "pdfium"
+
+    # PDFium is not thread-safe and Streamlit serves sessions from several
+    # threads, so every call into it is serialized (worker processes have their own)
+    _lock = threading.Lock()
+
+    def available(self):
+        return importlib.util.find_spec("pypdfium2") is not None
+
+    @contextmanager
+    def open(self, source):
+        import pypdfium2
+
+        # Paths are read by PDFium itself, so spooled files are never loaded whole
+        with self._lock:
+            pdf = pypdfium2.PdfDocument(source)
+        try:
+            yield pdf
+        finally:
+            with self._lock:
+                pdf.close()
+
+    def page_count(self, document):
+        with self._lock:
+            return len(document)
+
+    def page_texts(self, document, start, stop=None):
+        page_count = self.page_count(document)
+        stop = page_count if stop is None else min(stop, page_count)
+        for index in range(start, stop):
+            with self._lock:
+                page = document[index]
+                text_page = page.get_textpage()
+                text = text_page.get_text_range()
+                text_page.close()
+                page.close()
+            yield text.replace("\r\n", "\n").replace("\r", "\n") or None
+
+
+BACKENDS = {}
+
+
+def register_backend(backend):
+    """
+    Adds a PdfBackend instance to the registry (replacing one with the same name).
+    """
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+register_backend(PdfplumberBackend())
+register_backend(PdfiumBackend())
+
+LAYOUT_BACKEND = "pdfplumber"
+
+
+def available_backends():
+    """
+    Returns the names of the registered backends whose library is installed.
+    """
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_backend(name):
+    """
+    Returns the backend registered as `name`.
+
+    Raises:
+        ValueError: If it is unknown or its library is not installed
+    """
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown PDF backend {name!r}; expected one of {sorted(BACKENDS)}")
+    if not backend.available():
+        raise ValueError(f"PDF backend {name!r} is not installed")
+    return backend
+
+
+def select_backend(size, page_count, layout=False, preferred=None):
+    """
+    Picks the backend for one document.
+
+    Args:
+        size: Document size in bytes
+        page_count: Number of pages
+        layout: Whether the caller needs layout-aware text
+        preferred: "auto" or a backend name (default RESUME_PDF_BACKEND)
+
+    Returns:
+        PdfBackend: The layout-aware backend when layout is needed, a forced
+        backend if one is configured, otherwise the fast text-only backend for
+        long or large documents when it is installed
+    """
+    preferred = preferred or PDF_BACKEND
+    if layout:
+        return get_backend(LAYOUT_BACKEND)
+    if preferred != "auto":
+        return get_backend(preferred)
+    fast = BACKENDS.get("pdfium")
+    if fast is not None and fast.available() and (
+        page_count >= FAST_PATH_MIN_PAGES or size >= FAST_PATH_MIN_BYTES
+    ):
+        return fast
+    return get_backend(LAYOUT_BACKEND)
+
+
+def page_count_backend():
+    """
+    Returns the backend used to count pages before one is selected (the
+    cheapest one installed).
+    """
+    fast = BACKENDS.get("pdfium")
+    return fast if fast is not None and fast.available() else get_backend(LAYOUT_BACKEND)
@@ -0,0 +1,62 @@
+# reviewer/report.py
+"""
+Plain-text report built from an analyze_resume() result (the "Download as
+Text" report in the web app).
+"""
+
+
+def build_report_text(analysis, job_role):
+    """
+    Renders the downloadable analysis report.
+
+    Args:
+        analysis: analyze_resume() output
+        job_role: Target job role shown in the title
+
+    Returns:
+        str: Report text
+    """
+    scores = analysis["scores"]
+    recommendations = analysis["detailed_review"]["recommendations"]
+    parts = [f"""
+Resume Analysis Report for {job_role} Position
+============================================
+
+Overall Scores
+-------------
+Structure: {scores['structure']}%
+Content: {scores['content']}%
+Clarity: {scores['clarity']}%
+Overall: {scores['overall']}%
+
+High-Impact Recommendations
+-------------------------
+"""]
+    # Add high-impact recommendations
+    for imp in recommendations["high_impact"]:
+        parts.append(f"\n{imp['title']}\n")
+        parts.append(f"{'-' * len(imp['title'])}\n")
+        parts.append(f"{imp['description']}\n\n")
+        parts.append("Examples:\n")
+        for i in range(0, len(imp["examples"]), 2):
+            parts.append(f"Before: {imp['examples'][i]}\n")
+            parts.append(f"After:  {imp['examples'][i+1]}\n\n")
+
+    # Add skills optimization
+    technical_skills = recommendations["skill_optimization"]["technical_skills"]
+    parts.append("\nSkills Optimization\n==================\n")
+    parts.append("\nTechnical Skills Suggestions:\n")
+    for sugg in technical_skills["suggestions"]:
+        parts.append(f"• {sugg}\n")
+
+    parts.append("\nExample Technical Skills Format:\n")
+    parts.append(technical_skills["example"])
+
+    # Add quick wins
+    parts.append("\n\nQuick Improvements\n=================\n")
+    for category, tips in recommendations["quick_wins"].items():
+        parts.append(f"\n{category.title()}:\n")
+        for tip in tips:
+            parts.append(f"• {tip}\n")
+
+    return "".join(parts)
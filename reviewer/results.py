@@ -0,0 +1,373 @@
+# reviewer/results.py
+"""
+Compact, typed analysis results.
+
+analyze_resume() returns an AnalysisResult: slotted records holding only what
+varies between analyses (scores, counts, detected skills, keyword lists and a
+few flags). Recommendation text, skill details and feedback sentences are
+shared module-level data, referenced rather than copied, and the always-empty
+placeholder lists of the legacy dict are not stored at all.
+
+AnalysisResult is also a read-only Mapping with the legacy layout, so existing
+accessors such as result["scores"]["overall"] keep working; each top-level
+section is built on first access and reused. to_bytes()/from_bytes() give a
+compact binary form for caches and process pools, and pickling uses it too.
+"""
+import marshal
+from collections.abc import Mapping
+
+from reviewer.taxonomy import TAXONOMY, RECOMMENDATIONS, FrozenDict
+
+# Skill details shown for detected skills (aliases are only needed for matching)
+SKILL_DETAILS = FrozenDict(
+    (category, FrozenDict(
+        (skill, FrozenDict(level=info["level"], context=info["context"])) for skill, info in skills.items()
+    ))
+    for category, skills in TAXONOMY["technical_skills"].items()
+)
+
+# Bumped whenever the binary layout changes, so stale cache entries are rejected
+FORMAT_VERSION = 3
+
+
+class Scores:
+    """
+    Headline scores (0-100).
+    """
+    __slots__ = ("structure", "content", "clarity", "overall")
+
+    def __init__(self, structure, content, clarity, overall):
+        self.structure = structure
+        self.content = content
+        self.clarity = clarity
+        self.overall = overall
+
+    def __eq__(self, other):
+        if not isinstance(other, Scores):
+            return NotImplemented
+        return (self.structure, self.content, self.clarity, self.overall) == \
+            (other.structure, other.content, other.clarity, other.overall)
+
+    def __repr__(self):
+        return (f"Scores(structure={self.structure!r}, content={self.content!r}, "
+                f"clarity={self.clarity!r}, overall={self.overall!r})")
+
+
+class AnalysisResult(Mapping):
+    """
+    The outcome of analyze_resume() for one resume and job role.
+
+    Attributes:
+        job_role: Target job role
+        words / sentences: Word count and number of statements
+        scores: Headline Scores
+        clarity_score: Writing-style clarity score
+        professional_tone / has_sections: Writing-style findings
+        skills: Detected skill names (categories come from SKILL_DETAILS)
+        missing_skills: Essential skills not found
+        quality_metrics: (project complexity, technical depth, tool diversity), each 0-1
+        experience_score: (aspect, score) or None
+        concise / impact_high / impact_verbs / professional: Writing-quality findings
+        role_match: Role match score (0-100)
+        requirements: (name, value, indicator) rows of the requirements match
+        keywords_present / keywords_missing: Job-description (or role) keywords
+        description_similarity: Job-description similarity in percent, or None
+        sections: (kind, title, start, end, words, skills, action verbs) per
+            resume section, in document order (see reviewer.sections)
+        achievements: (kind, metric text, start, end) per quantified
+            achievement, in document order (see reviewer.achievements)
+        achievement_rating: Share of statements backed by a metric (0-10)
+        strong_points / weak_points: Statements with and without a metric
+    """
+    # Hand-written slots rather than a dataclass: importing dataclasses (and
+    # inspect) would add ~10 ms to the headless import
+    FIELDS = ("job_role", "words", "sentences", "scores", "clarity_score", "professional_tone",
+              "has_sections", "skills", "missing_skills", "quality_metrics", "experience_score",
+              "concise", "impact_high", "impact_verbs", "professional", "role_match", "requirements",
+              "keywords_present", "keywords_missing", "description_similarity", "sections",
+              "achievements", "achievement_rating", "strong_points", "weak_points")
+    __slots__ = FIELDS + ("_sections",)
+
+    def __init__(self, job_role, words, sentences, scores, clarity_score, professional_tone,
+                 has_sections, skills, missing_skills, quality_metrics, experience_score, concise,
+                 impact_high, impact_verbs, professional, role_match, requirements, keywords_present,
+                 keywords_missing, description_similarity=None, sections=(), achievements=(),
+                 achievement_rating=0, strong_points=(), weak_points=()):
+        self.job_role = job_role
+        self.words = words
+        self.sentences = sentences
+        self.scores = scores
+        self.clarity_score = clarity_score
+        self.professional_tone = professional_tone
+        self.has_sections = has_sections
+        self.skills = skills
+        self.missing_skills = missing_skills
+        self.quality_metrics = quality_metrics
+        self.experience_score = experience_score
+        self.concise = concise
+        self.impact_high = impact_high
+        self.impact_verbs = impact_verbs
+        self.professional = professional
+        self.role_match = role_match
+        self.requirements = requirements
+        self.keywords_present = keywords_present
+        self.keywords_missing = keywords_missing
+        self.description_similarity = description_similarity
+        self.sections = sections
+        self.achievements = achievements
+        self.achievement_rating = achievement_rating
+        self.strong_points = strong_points
+        self.weak_points = weak_points
+        self._sections = None
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, AnalysisResult):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "AnalysisResult(" + ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS) + ")"
+
+    @property
+    def ats_score(self):
+        return min((self.role_match + len(SKILL_DETAILS) * 10), 100)
+
+    def skill_categories(self):
+        """
+        Returns {category: {skill: details}} for the detected skills.
+        """
+        detected = set(self.skills)
+        return {
+            category: {skill: details for skill, details in skills.items() if skill in detected}
+            for category, skills in SKILL_DETAILS.items()
+        }
+
+    # Legacy mapping view
+
+    def __getitem__(self, key):
+        sections = self._sections
+        if sections is None:
+            sections = self._sections = {}
+        section = sections.get(key)
+        if section is None:
+            builder = _SECTION_BUILDERS.get(key)
+            if builder is None:
+                raise KeyError(key)
+            section = sections[key] = builder(self)
+        return section
+
+    def __iter__(self):
+        return iter(_SECTION_BUILDERS)
+
+    def __len__(self):
+        return len(_SECTION_BUILDERS)
+
+    def to_dict(self):
+        """
+        Returns the full legacy nested dict. Shares its sections with the
+        mapping view, so it must not be modified.
+        """
+        return {key: self[key] for key in _SECTION_BUILDERS}
+
+    # Binary serialization
+
+    def to_bytes(self):
+        """
+        Serializes the result with marshal (fast and compact; readable by the
+        same Python version, which is all caches and worker processes need).
+        """
+        values = list(self._values())
+        scores = self.scores
+        values[3] = (scores.structure, scores.content, scores.clarity, scores.overall)
+        return marshal.dumps((FORMAT_VERSION, *values))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Restores a result written by to_bytes().
+
+        Raises:
+            ValueError: If the data has another format version
+        """
+        version, job_role, words, sentences, scores, *rest = marshal.loads(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported analysis result format {version!r}")
+        return cls(job_role, words, sentences, Scores(*scores), *rest)
+
+    def __reduce__(self):
+        return _result_from_bytes, (self.to_bytes(),)
+
+
+def _result_from_bytes(data):
+    return AnalysisResult.from_bytes(data)
+
+
+def _scores_section(result):
+    scores = result.scores
+    return {
+        "structure": scores.structure,
+        "content": scores.content,
+        "clarity": scores.clarity,
+        "overall": scores.overall
+    }
+
+
+def _detailed_review_section(result):
+    words, sentences = result.words, result.sentences
+    found_kinds = {kind for kind, _, _, _ in result.achievements}
+    concise = result.concise
+    professional_assessment = {
+        "writing_style": {
+            "clarity_score": result.clarity_score,
+            "tone_analysis": "Your resume maintains a professional tone" if result.professional_tone else
+                             "Consider using more professional action verbs",
+            "structure_feedback": "Well-structured with clear sections" if result.has_sections else
+                                  "Important sections may be missing or unclear",
+            "improvement_areas": []
+        },
+        "impact_analysis": {
+            "quantified_achievements": [
+                {"metric": metric, "kind": kind, "start": start, "end": end}
+                for kind, metric, start, end in result.achievements
+            ],
+            "qualitative_strengths": [],
+            "missing_elements": []
+        }
+    }
+    if result.experience_score is not None:
+        aspect, score = result.experience_score
+        professional_assessment["experience_scores"] = {aspect: score}
+    professional_assessment["writing_quality"] = {
+        "Clarity": ("Strong" if concise else "Medium",
+                    "Clear and concise language" if concise else "Could be more concise"),
+        "Impact": ("High" if result.impact_high else "Medium",
+                   "Good use of impact verbs" if result.impact_verbs else "Add more achievement metrics"),
+        "Professionalism": ("High" if result.professional else "Medium", "Maintains professional tone")
+    }
+    detail_level = 'good' if words > 400 else 'moderate' if words > 300 else 'limited'
+    return {
+        "summary": {
+            "overview": (
+                f"Based on a comprehensive analysis of your resume for the {result.job_role} position, \n"
+                f"    I've identified several key areas of strength and opportunities for enhancement. "
+                f"Your resume demonstrates {words} words across {sentences} distinct statements,\n"
+                f"    suggesting {detail_level} detail level."
+            ),
+            "key_findings": [],
+            "main_strengths": [],
+            "priority_improvements": []
+        },
+        "content_analysis": {
+            "experience_impact": {
+                "rating": 0,
+                "findings": [],
+                "examples": [],
+                "improvements": []
+            },
+            "skills_relevance": {
+                "rating": 0,
+                "findings": [],
+                "gaps": [],
+                "recommendations": []
+            },
+            "achievements": {
+                "rating": result.achievement_rating,
+                "strong_points": list(result.strong_points),
+                "weak_points": list(result.weak_points),
+                # Templates for the kinds of metric the resume does not use yet
+                "suggested_formats": [
+                    template for kind, template in RECOMMENDATIONS["achievement_formats"].items()
+                    if kind not in found_kinds
+                ]
+            }
+        },
+        "professional_assessment": professional_assessment,
+        # Static content, shared by every analysis
+        "recommendations": {
+            "high_impact": RECOMMENDATIONS["high_impact"],
+            "quick_wins": RECOMMENDATIONS["quick_wins"],
+            "skill_optimization": RECOMMENDATIONS["skill_optimization"]
+        }
+    }
+
+
+def _technical_analysis_section(result):
+    complexity, depth, diversity = result.quality_metrics
+    return {
+        "detected_skills": {},
+        "missing_skills": list(result.missing_skills),
+        "quality_metrics": {
+            "Project Complexity": complexity,
+            "Technical Depth": depth,
+            "Tool Diversity": diversity
+        },
+        "skill_categories": result.skill_categories(),
+        "technical_projects": {
+            "complexity_analysis": [],
+            "tech_stack_review": [],
+            "architecture_insights": []
+        }
+    }
+
+
+def _market_alignment_section(result):
+    match_score = result.role_match
+    return {
+        "industry_trends": [],
+        "role_specific_feedback": [
+            f"Match Score: {match_score}% alignment with the {result.job_role} role",
+            "Strong technical skill alignment" if match_score > 70 else "Consider adding more role-specific keywords"
+        ],
+        "competitive_analysis": "",
+        "unique_selling_points": [],
+        "overall_match": match_score,
+        "description_similarity": result.description_similarity,
+        "requirements_match": {name: (value, indicator) for name, value, indicator in result.requirements}
+    }
+
+
+def _ats_compatibility_section(result):
+    return {
+        "overall_score": result.ats_score,
+        "format_issues": [],
+        "keyword_analysis": {
+            "present": list(result.keywords_present),
+            "missing": list(result.keywords_missing),
+            "suggestions": RECOMMENDATIONS["ats_suggestions"]
+        },
+        "section_analysis": _section_analysis(result)
+    }
+
+
+def _section_analysis(result):
+    """
+    Per-section metrics keyed by section kind, in document order; repeated
+    sections (e.g. two "Experience" headers) are combined.
+    """
+    total_words = result.words or 1
+    analysis = {}
+    for kind, title, start, end, words, skills, action_verbs in result.sections:
+        entry = analysis.get(kind)
+        if entry is None:
+            entry = analysis[kind] = {"title": title, "words": 0, "share": 0.0, "skills": [],
+                                      "action_verbs": 0, "spans": []}
+        entry["words"] += words
+        entry["share"] = round(entry["words"] / total_words * 100, 1)
+        entry["skills"].extend(skill for skill in skills if skill not in entry["skills"])
+        entry["action_verbs"] += action_verbs
+        entry["spans"].append((start, end))
+    return analysis
+
+
+_SECTION_BUILDERS = {
+    "scores": _scores_section,
+    "detailed_review": _detailed_review_section,
+    "technical_analysis": _technical_analysis_section,
+    "market_alignment": _market_alignment_section,
+    "ats_compatibility": _ats_compatibility_section,
+}
@@ -0,0 +1,406 @@
+# reviewer/resume_index.py
+"""
+Persistent on-disk index of a candidate pool.
+
+Every resume is stored once in a local SQLite database, keyed by the SHA-256
+of its file. The database holds the extracted text, an FTS5 trigram index of
+that text (the postings), and the role-independent analysis: the taxonomy
+terms found by the keyword scan, the word count and the TF-IDF term counts.
+Ranking a new role or job description reads only the index, so no PDF is
+parsed again:
+
+    index = ResumeIndex("candidates.db")
+    index.add_file(resume_file)
+    index.rank("Data Engineer", job_description)
+
+Scores equal those of batch scoring and analyze_resume(). Role words are
+matched as substrings, as analyze_resume() does, and the trigram postings
+answer those lookups. The stored analysis is loaded into memory on the first
+query. Later queries load only rows added since then, including rows added by
+other processes. Each query is then a few array operations over the whole pool.
+If the taxonomy changes, the stored analysis is rebuilt from the stored text
+when the index is opened.
+
+Imports NumPy, so it is not loaded by `import reviewer`.
+"""
+import hashlib
+import json
+import marshal
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from reviewer import batch_scoring, extraction, instrumentation, jd_match
+from reviewer.analysis import build_resume_profile, match_resume_profile, scan_keywords
+from reviewer.taxonomy import TAXONOMY
+
+RESUME_INDEX_PATH = os.environ.get("RESUME_INDEX_PATH", "resume_index.db")
+
+# Bumped whenever the stored analysis changes meaning; together with the
+# taxonomy it decides whether stored rows must be re-analyzed
+INDEX_FORMAT = 2
+ANALYSIS_FINGERPRINT = hashlib.sha256(
+    json.dumps([INDEX_FORMAT, TAXONOMY], sort_keys=True).encode("utf-8")
+).hexdigest()
+
+# Role words whose hit columns are kept between queries
+ROLE_WORD_CACHE_SIZE = 256
+
+# The trigram tokenizer needs three characters; shorter role words ("ai", "qa")
+# are looked up with instr() over the stored text instead
+_TRIGRAM = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    pages INTEGER NOT NULL,
+    words INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    keywords BLOB NOT NULL,
+    terms BLOB NOT NULL,
+    added_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS resume_postings USING fts5(
+    text, content='', tokenize='trigram'
+);
+"""
+
+
+def file_digest(data):
+    """
+    Returns the SHA-256 hex digest identifying a resume file (as the
+    extraction cache does).
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _analyze_text(resume_text):
+    """
+    Computes the stored, role-independent analysis of one resume.
+
+    Returns:
+        tuple (words, keywords, terms): word count, and marshalled blobs of the
+        keyword-scan terms and of the (terms, counts) TF-IDF term counts
+    """
+    text_lower = resume_text.lower()
+    counts = {}
+    for term in jd_match.extract_terms(text_lower):
+        counts[term] = counts.get(term, 0) + 1
+    return (
+        len(resume_text.split()),
+        marshal.dumps(tuple(sorted(scan_keywords(text_lower)))),
+        marshal.dumps((tuple(counts), tuple(counts.values())))
+    )
+
+
+def _phrase(word):
+    # A quoted FTS5 phrase, so query syntax in role words or searches is literal
+    return '"' + word.replace('"', '""') + '"'
+
+
+class ResumeIndex:
+    """
+    SQLite-backed resume store that ranks every stored candidate for a role.
+
+    Safe to share between threads; several processes may also use the same
+    file (the database runs in WAL mode).
+    """
+
+    def __init__(self, path=None):
+        self.path = path or RESUME_INDEX_PATH
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        self._check_fingerprint()
+        self._reset_pool()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_fingerprint(self):
+        row = self._connection.execute(
+            "SELECT value FROM index_info WHERE key = 'fingerprint'"
+        ).fetchone()
+        if row is not None and row[0] == ANALYSIS_FINGERPRINT:
+            return
+        # Stored analyses predate the current taxonomy; re-analyze the stored
+        # text (no file is read again)
+        with self._connection:
+            rows = self._connection.execute("SELECT id, text FROM resumes").fetchall()
+            self._connection.executemany(
+                "UPDATE resumes SET words = ?, keywords = ?, terms = ? WHERE id = ?",
+                [(*_analyze_text(text), resume_id) for resume_id, text in rows]
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO index_info (key, value) VALUES ('fingerprint', ?)",
+                (ANALYSIS_FINGERPRINT,)
+            )
+
+    def _reset_pool(self):
+        # In-memory copy of the stored analysis, one row per loaded resume in id order
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._names = []
+        self._digests = []
+        self._pages = []
+        self._words = np.zeros(0, dtype=np.int64)
+        self._term_hits = np.zeros((0, len(batch_scoring.TERMS)), dtype=bool)
+        self._skills = []
+        self._vocabulary = {}
+        self._term_rows = np.zeros(0, dtype=np.int64)
+        self._term_indices = np.zeros(0, dtype=np.int64)
+        self._term_counts = np.zeros(0, dtype=np.int64)
+        self._role_word_hits = {}
+
+    # Inserts
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def __contains__(self, digest):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT 1 FROM resumes WHERE digest = ?", (digest,)
+            ).fetchone() is not None
+
+    def add(self, digest, name, resume_text, pages=1):
+        """
+        Stores one extracted resume. A resume whose digest is already stored is
+        left as it is.
+
+        Args:
+            digest: file_digest() of the resume file
+            name: File name reported in rankings
+            resume_text: Extracted text
+            pages: Page count
+
+        Returns:
+            bool: True if the resume was added
+        """
+        return self.add_many([(digest, name, resume_text, pages)]) == 1
+
+    def add_many(self, resumes):
+        """
+        Stores many extracted resumes in one transaction (see add()).
+
+        Args:
+            resumes: Iterable of (digest, name, resume_text, pages) tuples
+
+        Returns:
+            int: Number of resumes added
+        """
+        rows = [(digest, name, pages, *_analyze_text(resume_text), resume_text)
+                for digest, name, resume_text, pages in resumes]
+        added = 0
+        with self._lock, self._connection:
+            for digest, name, pages, words, keywords, terms, resume_text in rows:
+                cursor = self._connection.execute(
+                    "INSERT OR IGNORE INTO resumes (digest, name, pages, words, text, keywords, terms, added_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (digest, name, pages, words, resume_text, keywords, terms, time.time())
+                )
+                if cursor.rowcount:
+                    self._connection.execute(
+                        "INSERT INTO resume_postings (rowid, text) VALUES (?, ?)", (cursor.lastrowid, resume_text)
+                    )
+                    added += 1
+        return added
+
+    def add_file(self, resume_file, name=None):
+        """
+        Extracts and stores an uploaded PDF/TXT file, unless a file with the
+        same content is already stored (then nothing is parsed).
+
+        Args:
+            resume_file: Binary file object with a .name, e.g. from st.file_uploader
+            name: Name to store (defaults to the file's name)
+
+        Returns:
+            tuple (digest, added)
+
+        Raises:
+            UnsupportedFileType, UploadRejected, or the backend's error if the
+            file cannot be extracted
+        """
+        resume_file.seek(0)
+        digest = file_digest(resume_file.read())
+        resume_file.seek(0)
+        if digest in self:
+            return digest, False
+        resume_text, page_count = extraction.extract_text(resume_file)
+        return digest, self.add(digest, name or resume_file.name, resume_text, page_count)
+
+    # Queries
+
+    def text(self, digest):
+        """
+        Returns the stored text of a resume, or None if it is not stored.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT text FROM resumes WHERE digest = ?", (digest,)).fetchone()
+        return None if row is None else row[0]
+
+    def analyze(self, digest, job_role, job_description=""):
+        """
+        Runs the full analyze_resume() for one stored resume from its stored text.
+
+        Returns:
+            AnalysisResult, or None if the resume is not stored
+        """
+        resume_text = self.text(digest)
+        if resume_text is None:
+            return None
+        return match_resume_profile(build_resume_profile(resume_text), job_role, job_description)
+
+    def search(self, query, limit=20):
+        """
+        Finds stored resumes containing every word of `query` (case-insensitive
+        substrings of at least three characters), best BM25 match first.
+
+        Returns:
+            list: (digest, name) tuples
+        """
+        words = [word for word in query.split() if len(word) >= _TRIGRAM]
+        if not words:
+            return []
+        with self._lock:
+            return self._connection.execute(
+                "SELECT resumes.digest, resumes.name FROM resume_postings "
+                "JOIN resumes ON resumes.id = resume_postings.rowid "
+                "WHERE resume_postings MATCH ? ORDER BY bm25(resume_postings) LIMIT ?",
+                (" ".join(_phrase(word) for word in words), limit)
+            ).fetchall()
+
+    def _load_new_rows(self):
+        """
+        Appends the rows stored since the last query to the in-memory pool.
+        """
+        last_id = int(self._ids[-1]) if len(self._ids) else 0
+        rows = self._connection.execute(
+            "SELECT id, digest, name, pages, words, keywords, terms FROM resumes WHERE id > ? ORDER BY id",
+            (last_id,)
+        ).fetchall()
+        if not rows:
+            return
+
+        start = len(self._ids)
+        term_hits = np.zeros((len(rows), len(batch_scoring.TERMS)), dtype=bool)
+        term_rows, term_indices, term_counts = [], [], []
+        vocabulary = self._vocabulary
+        for offset, (_, digest, name, pages, _, keywords, terms) in enumerate(rows):
+            self._digests.append(digest)
+            self._names.append(name)
+            self._pages.append(pages)
+            term_hits[offset, [batch_scoring.TERM_COLUMNS[term] for term in marshal.loads(keywords)]] = True
+            names, counts = marshal.loads(terms)
+            term_rows.extend([start + offset] * len(names))
+            term_indices.extend(vocabulary.setdefault(term, len(vocabulary)) for term in names)
+            term_counts.extend(counts)
+
+        self._ids = np.concatenate([self._ids, np.array([row[0] for row in rows], dtype=np.int64)])
+        self._words = np.concatenate([self._words, np.array([row[4] for row in rows], dtype=np.int64)])
+        self._term_hits = np.concatenate([self._term_hits, term_hits])
+        self._skills.extend(batch_scoring.skill_columns(term_hits))
+        self._term_rows = np.concatenate([self._term_rows, np.asarray(term_rows, dtype=np.int64)])
+        self._term_indices = np.concatenate([self._term_indices, np.asarray(term_indices, dtype=np.int64)])
+        self._term_counts = np.concatenate([self._term_counts, np.asarray(term_counts, dtype=np.int64)])
+
+    def _role_word_column(self, word):
+        """
+        Returns a boolean column flagging the loaded resumes whose text
+        contains `word`, querying the postings only for rows not seen before.
+        """
+        column = self._role_word_hits.get(word)
+        if column is not None and len(column) == len(self._ids):
+            return column
+
+        known = 0 if column is None else len(column)
+        after_id = int(self._ids[known - 1]) if known else 0
+        if len(word) >= _TRIGRAM:
+            matches = self._connection.execute(
+                "SELECT rowid FROM resume_postings WHERE resume_postings MATCH ? AND rowid > ?",
+                (_phrase(word), after_id)
+            ).fetchall()
+        else:
+            matches = self._connection.execute(
+                "SELECT id FROM resumes WHERE id > ? AND instr(lower(text), ?) > 0", (after_id, word)
+            ).fetchall()
+
+        new_hits = np.zeros(len(self._ids) - known, dtype=bool)
+        matched_ids = np.fromiter((row[0] for row in matches), dtype=np.int64, count=len(matches))
+        positions = np.searchsorted(self._ids, matched_ids) - known
+        # Rows stored after this query's snapshot of the pool are picked up next time
+        new_hits[positions[positions < len(new_hits)]] = True
+        column = new_hits if column is None else np.concatenate([column, new_hits])
+
+        if len(self._role_word_hits) >= ROLE_WORD_CACHE_SIZE:
+            self._role_word_hits.clear()
+        self._role_word_hits[word] = column
+        return column
+
+    def rank(self, job_role, job_description="", top_n=15):
+        """
+        Scores every stored resume against a role (and job description) and
+        ranks them by job-description similarity (when a description is
+        given), then overall score and role match.
+
+        Args:
+            job_role: Target job role
+            job_description: Optional job description text
+            top_n: Number of job-description terms reported per resume
+
+        Returns:
+            list: One dict per resume, best match first, with file, digest,
+            pages, words, the batch score columns (see
+            batch_scoring.score_rows()) and, with a description, the
+            jd_match.match_columns() columns
+        """
+        with instrumentation.timed("index.rank"), self._lock:
+            self._load_new_rows()
+            if not len(self._ids):
+                return []
+            words = batch_scoring.role_words(job_role)[0]
+            role_hits = np.zeros((len(self._ids), len(words)), dtype=bool)
+            for position, word in enumerate(words):
+                role_hits[:, position] = self._role_word_column(word)
+            score_rows = batch_scoring.score_rows(self._term_hits, role_hits, self._words, job_role,
+                                                  self._skills)
+
+            matches = None
+            if job_description.strip():
+                matches = jd_match.match_term_counts(
+                    self._vocabulary, self._term_rows, self._term_indices, self._term_counts,
+                    len(self._ids), jd_match.extract_terms(job_description.lower()), top_n
+                )
+            rows = []
+            for index, scores in enumerate(score_rows):
+                row = {"file": self._names[index], "digest": self._digests[index],
+                       "pages": self._pages[index], "words": int(self._words[index])}
+                row.update(scores)
+                if matches is not None:
+                    row.update(jd_match.match_columns(matches[index]))
+                rows.append(row)
+
+        # Stable, so ties keep insertion order
+        sort_columns = ("jd_similarity", "overall_score", "role_match") if matches is not None else \
+            ("overall_score", "role_match")
+        rows.sort(key=lambda row: tuple(-row[column] for column in sort_columns))
+        return rows
@@ -0,0 +1,103 @@
+# reviewer/sections.py
+"""
+Splits resume text into typed sections in one pass over its lines.
+
+A header is a short line whose words are one of the taxonomy's section headers
+("WORK EXPERIENCE", "Education:", "• Technical Skills"). Case, punctuation and
+bullets are ignored. A header may also be followed by a colon and content on
+the same line ("Skills: Python, SQL"), unless it names a kind commonly used
+as a label inside the current section: in a skills block, "Languages: Python,
+Java" lists programming languages, and in a summary, "Experience: 5 years ..."
+is a sentence. Such sections end only at a header on a line of its own. A
+section runs from its header line to the next header. Text before the first
+header forms the "contact" section.
+Each line costs one dict lookup at most, so segmenting is cheap next to the
+keyword scan.
+"""
+import re
+
+from reviewer.taxonomy import TAXONOMY
+
+CONTACT = "contact"
+
+# Section kinds in taxonomy order, and {normalized header: kind},
+# e.g. "work history" -> "experience"
+SECTION_KINDS = tuple(TAXONOMY["section_headers"])
+HEADER_KINDS = {header: kind for kind, headers in TAXONOMY["section_headers"].items() for header in headers}
+
+# Longer lines (or "Header:" prefixes) are never headers
+MAX_HEADER_CHARS = 60
+
+# {section kind: kinds whose "Header: content" lines are labels inside its body}
+# (every kind also labels its own lines: "Experience: 5 years ..." inside experience)
+INLINE_LABEL_KINDS = {
+    "summary": ("summary", "experience"),
+    "skills": ("skills", "languages", "certifications"),
+}
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_LEADING_SYMBOLS = re.compile(r"^[^\w]+")
+
+
+def header_kind(line):
+    """
+    Returns the section kind a header line names, or None if it is not a header.
+
+    Args:
+        line: One line of text, stripped
+    """
+    words = _NON_WORD.sub(" ", line.lower().replace("&", " and ")).split()
+    return HEADER_KINDS.get(" ".join(words))
+
+
+class Section:
+    """
+    One section of a resume: its kind, header text and character offsets
+    (start..end covers the header line and the body).
+    """
+    __slots__ = ("kind", "title", "start", "end")
+
+    def __init__(self, kind, title, start, end):
+        self.kind = kind
+        self.title = title
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"Section(kind={self.kind!r}, title={self.title!r}, start={self.start!r}, end={self.end!r})"
+
+
+def segment(text, kind=CONTACT):
+    """
+    Splits resume text into sections.
+
+    Args:
+        text: Resume text (any case)
+        kind: Kind of the section `text` continues, for text segmented page by
+            page; the first section then has this kind and an empty title
+
+    Returns:
+        tuple: Sections in document order. Together they cover the whole
+        text; offsets index into `text`
+    """
+    sections = []
+    title, start = "", 0
+    offset = 0
+    for line in text.split("\n"):
+        line_start = offset
+        offset += len(line) + 1
+        # Most lines are too long to be a header and have no short "Header:" prefix
+        if len(line) > MAX_HEADER_CHARS and ":" not in line[:MAX_HEADER_CHARS + 1]:
+            continue
+        head, _, content = line.partition(":")
+        head = head.strip()
+        found = header_kind(head) if head else None
+        # An inline "Header: content" may be a label of the current section
+        if found is not None and not (content.strip() and found in INLINE_LABEL_KINDS.get(kind, (kind,))):
+            if line_start > start:
+                sections.append(Section(kind, title, start, line_start))
+            kind, title, start = found, _LEADING_SYMBOLS.sub("", head), line_start
+
+    if len(text) > start or not sections:
+        sections.append(Section(kind, title, start, len(text)))
+    return tuple(sections)
@@ -0,0 +1,83 @@
+# reviewer/taxonomy.py
+"""
+Loads the skill taxonomy and the static recommendation content.
+
+Both live in versioned JSON files under reviewer/data/ and are loaded once at
+import time into read-only structures, so every analysis shares them by
+reference instead of rebuilding them. Set RESUME_TAXONOMY_PATH or
+RESUME_RECOMMENDATIONS_PATH to use a different file.
+
+The shipped skill tree is curated (each skill has a level and context shown
+to the user). Skill matching does not slow down with taxonomy size (see
+benchmarks/bench_taxonomy.py), so a larger file can be swapped in through
+RESUME_TAXONOMY_PATH.
+"""
+import json
+import os
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TAXONOMY_PATH = os.environ.get("RESUME_TAXONOMY_PATH", os.path.join(DATA_DIR, "taxonomy.json"))
+RECOMMENDATIONS_PATH = os.environ.get(
+    "RESUME_RECOMMENDATIONS_PATH", os.path.join(DATA_DIR, "recommendations.json")
+)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict for shared taxonomy data.
+
+    Subclassing dict (rather than using MappingProxyType) keeps analyses that
+    embed it JSON-serializable and picklable.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("taxonomy data is shared and read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value):
+    """
+    Recursively converts JSON data into read-only structures (dicts become
+    FrozenDicts, lists become tuples).
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return freeze(json.load(f))
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    """
+    Loads a taxonomy file.
+
+    Returns:
+        FrozenDict: version plus keyword lists, section headers and the technical skill tree
+    """
+    return _load_json(path)
+
+
+def load_recommendations(path=RECOMMENDATIONS_PATH):
+    """
+    Loads the static recommendation content shown with every analysis.
+
+    Returns:
+        FrozenDict: version, high_impact, skill_optimization, quick_wins, ats_suggestions,
+        achievement_formats
+    """
+    return _load_json(path)
+
+
+TAXONOMY = load_taxonomy()
+RECOMMENDATIONS = load_recommendations()
+TAXONOMY_VERSION = TAXONOMY["version"]
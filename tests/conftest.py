@@ -0,0 +1,32 @@
+# tests/conftest.py
+"""
+Shared fixtures: a small fixed resume corpus for the equivalence tests.
+"""
+import pytest
+
+from benchmarks.corpus import generate_resume, render_txt
+
+# Hand-written resumes covering the matching edge cases (aliases, names that
+# contain other names, inline and stand-alone headers, phrases across lines)
+HANDWRITTEN_RESUMES = (
+    "Jane Doe\njane@example.com\n\nSUMMARY\nSenior data engineer who led a team of 6 and managed "
+    "platform migrations.\n\nWORK EXPERIENCE\nAcme Corp - Data Engineer\n- Implemented Airflow and "
+    "apache spark pipelines on k8s, reducing run time from 40 min to 5 min\n- Designed PostgreSQL "
+    "schemas and optimized SQL queries by 35%\n- Worked on CI/CD with GitHub Actions\n\nSkills: "
+    "Python, SQL, Docker, Kubernetes, AWS\nEducation\nBSc Computer Science\n",
+    "John Smith\n\nProfessional Summary\nJavaScript developer (nodejs, React.js, ecmascript).\n\n"
+    "Experience\nCalled customers weekly and helped with support tickets.\nSpringfield office, "
+    "responsible for the website.\n\nTechnical Skills\nLanguages: JavaScript (Expert), C++ (Advanced), "
+    "C# (Intermediate)\nFrameworks: Ruby on\nRails, Vue.js\n",
+    "Short resume with no headers at all. Java, Scala and Spark experience; mentored interns.",
+)
+
+
+@pytest.fixture(scope="session")
+def resume_texts():
+    """
+    The handwritten resumes plus generated ones (small, typical and one long).
+    """
+    generated = [render_txt(generate_resume(profile, seed=seed)).decode("utf-8")
+                 for profile, seed in (("small", 0), ("small", 1), ("typical", 0), ("typical", 1), ("long", 0))]
+    return list(HANDWRITTEN_RESUMES) + generated
@@ -0,0 +1,47 @@
+# tests/test_achievements.py
+"""
+Tests for quantified-achievement detection (reviewer/achievements.py).
+"""
+import pytest
+
+from reviewer.achievements import analyze_achievements, find_metrics
+
+# Every example promised by the module docstring, with the kind it is found as
+DOCSTRING_EXAMPLES = [
+    ("from 40 min to 5 min", "delta"),
+    ("$2M → $3.5M", "delta"),
+    ("team of 8", "team"),
+    ("managed 12 engineers", "team"),
+    ("5-person team", "team"),
+    ("saved 10 hours a week", "time"),
+    ("3 days per release", "time"),
+    ("$1.2M", "currency"),
+    ("€300k", "currency"),
+    ("500k USD", "currency"),
+    ("40%", "percentage"),
+    ("12.5 percent", "percentage"),
+    ("from 40% to 10%", "delta"),
+    ("reduced load time from 8s to 2s", "delta"),
+    # The format recommended in reviewer/data/recommendations.json
+    ("reducing data retrieval time from 5s to 200ms", "delta"),
+]
+
+
+@pytest.mark.parametrize("text, kind", DOCSTRING_EXAMPLES)
+def test_docstring_examples(text, kind):
+    metrics = find_metrics(text)
+    assert [found_kind for found_kind, _, _ in metrics] == [kind]
+
+
+def test_year_range_is_not_a_delta():
+    assert find_metrics("Worked there from 2019 to 2023") == []
+
+
+def test_statements_rated_by_share_quantified():
+    text = ("Experience\n"
+            "- Reduced deployment time from 40 min to 5 min for every service\n"
+            "- Worked on the internal reporting tools for the finance team\n")
+    achievements, rating, strong_points, weak_points = analyze_achievements(text)
+    assert [kind for kind, _, _, _ in achievements] == ["delta"]
+    assert rating == 10
+    assert len(strong_points) == 1 and len(weak_points) == 1
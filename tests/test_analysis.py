@@ -0,0 +1,42 @@
+# tests/test_analysis.py
+"""
+Equivalence tests for the analysis entry points: a cached resume profile
+matched per role, and page-by-page scoring, must agree with a full
+analyze_resume() of the same text.
+"""
+from analysis_cache import cached_analyze_resume, clear_analysis_cache, normalize_resume_text
+from reviewer import IncrementalResumeAnalyzer, analyze_resume, build_resume_profile, match_resume_profile
+
+ROLES = ("Senior Data Engineer", "Data Analyst", "Frontend Developer", "")
+JOB_DESCRIPTION = ("We are hiring a data engineer with 3+ years of experience in Python, SQL, Airflow and "
+                   "Kubernetes to build reliable pipelines.")
+
+
+def test_profile_matched_per_role_equals_full_analysis(resume_texts):
+    for text in resume_texts:
+        # One profile for every role: matching must not change it
+        profile = build_resume_profile(text)
+        for role in ROLES:
+            assert match_resume_profile(profile, role) == analyze_resume(text, role)
+        assert match_resume_profile(profile, ROLES[0], JOB_DESCRIPTION) == \
+            analyze_resume(text, ROLES[0], JOB_DESCRIPTION)
+
+
+def test_switching_roles_through_the_cache_equals_full_analysis(resume_texts):
+    clear_analysis_cache()
+    for text in resume_texts:
+        expected_text = normalize_resume_text(text)
+        for role in ROLES:
+            assert cached_analyze_resume(text, role) == analyze_resume(expected_text, role)
+        # A repeated request is served from the cache and is still equal
+        assert cached_analyze_resume(text, ROLES[0]) == analyze_resume(expected_text, ROLES[0])
+
+
+def test_incremental_scores_equal_full_analysis(resume_texts):
+    for text in resume_texts:
+        pages = text.split("\n\n")
+        for role in ROLES:
+            analyzer = IncrementalResumeAnalyzer(role)
+            for page in pages:
+                analyzer.feed(page)
+            assert analyzer.scores() == analyze_resume("\n".join(pages), role)["scores"]
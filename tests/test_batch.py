@@ -0,0 +1,34 @@
+# tests/test_batch.py
+"""
+Tests for the batch CLI (batch.py): ranking a resume pool directly and
+through a resume index must give the same table.
+"""
+import pandas as pd
+import pytest
+
+import batch
+from reviewer.resume_index import ResumeIndex
+
+ROLE = "Senior Data Engineer"
+JOB_DESCRIPTION = "We need a data engineer with SQL, Airflow, Spark, Kafka, Python and AWS skills."
+
+
+@pytest.fixture
+def pool(tmp_path, resume_texts):
+    for number, text in enumerate(resume_texts):
+        (tmp_path / f"resume{number:02d}.txt").write_text(text, encoding="utf-8")
+    (tmp_path / "empty.txt").write_text("", encoding="utf-8")
+    (tmp_path / "broken.pdf").write_bytes(b"%PDF-1.4 broken")
+    return tmp_path
+
+
+@pytest.mark.parametrize("job_description", ["", JOB_DESCRIPTION])
+def test_index_ranking_equals_batch_ranking(pool, tmp_path, job_description):
+    direct = batch.rank_resumes(str(pool), ROLE, job_description, workers=1)
+    with ResumeIndex(str(tmp_path / "pool.db")) as index:
+        _, failures = batch.index_resumes(str(pool), index, workers=1)
+        indexed = batch.rank_index(index, ROLE, job_description, failures)
+
+    assert list(direct["error"] != "") == [False] * (len(direct) - 2) + [True, True]
+    pd.testing.assert_frame_equal(indexed, direct)
+    assert indexed.to_csv(index=False) == direct.to_csv(index=False)
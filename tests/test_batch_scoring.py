@@ -0,0 +1,45 @@
+# tests/test_batch_scoring.py
+"""
+Equivalence tests: vectorized batch scores must equal analyze_resume() per
+document.
+"""
+import numpy as np
+import pytest
+
+from reviewer import analyze_resume
+from reviewer import batch_scoring
+
+ROLES = ("Senior Data Engineer", "Data Analyst", "")
+
+
+@pytest.mark.parametrize("role", ROLES)
+def test_score_resumes_equals_analyze_resume(resume_texts, role):
+    scores = batch_scoring.score_resumes(resume_texts, role)
+    for index, text in enumerate(resume_texts):
+        result = analyze_resume(text, role)
+        row = {name: values[index].item() for name, values in scores.items()}
+        assert {name: row[name] for name in ("structure", "content", "clarity", "overall")} == \
+            result["scores"]
+        assert row["role_match"] == result.role_match
+        assert row["ats_score"] == result.ats_score
+        assert row["clarity_score"] == result.clarity_score
+        assert (row["project_complexity"], row["technical_depth"], row["tool_diversity"]) == \
+            tuple(result.quality_metrics)
+        assert row["words"] == result.words
+
+
+def test_skill_columns_equal_analyze_resume(resume_texts):
+    scans = [batch_scoring.scan_resume(text, []) for text in resume_texts]
+    term_hits, _, _ = batch_scoring.hit_matrix(scans, 0)
+    for text, columns in zip(resume_texts, batch_scoring.skill_columns(term_hits)):
+        result = analyze_resume(text, "")
+        assert columns["skills"] == ", ".join(result.skills)
+        assert columns["missing_skills"] == ", ".join(result.missing_skills)
+
+
+def test_blocks_do_not_change_scores(resume_texts, monkeypatch):
+    expected = batch_scoring.score_resumes(resume_texts, ROLES[0])
+    monkeypatch.setattr(batch_scoring, "BLOCK_ROWS", 2)
+    blocked = batch_scoring.score_resumes(resume_texts, ROLES[0])
+    for name, values in expected.items():
+        assert np.array_equal(blocked[name], values)
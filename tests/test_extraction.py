@@ -0,0 +1,55 @@
+# tests/test_extraction.py
+"""
+Tests for the upload limits of PDF extraction (reviewer/extraction.py).
+"""
+import pytest
+
+from benchmarks.corpus import as_upload, render_pdf
+from reviewer import extraction, pdf_backends
+from reviewer.extraction import UploadRejected, iter_resume_pages
+
+PAGE_COUNT = 12
+
+
+def _understated_pdf():
+    # A 12-page PDF whose page tree declares 3 pages (same length, so the xref stays valid)
+    pages = [[f"Page {number} of a resume"] for number in range(1, PAGE_COUNT + 1)]
+    data = render_pdf(pages)
+    assert b"/Count 12" in data
+    return data.replace(b"/Count 12", b"/Count  3")
+
+
+@pytest.fixture
+def layout_counter(monkeypatch):
+    # Count pages the way installs without pypdfium2 do: from the declared /Count
+    monkeypatch.setattr(pdf_backends, "page_count_backend",
+                        lambda: pdf_backends.get_backend(pdf_backends.LAYOUT_BACKEND))
+    monkeypatch.setattr(extraction, "MAX_PDF_PAGES", 5)
+
+
+@pytest.mark.parametrize("backend", ["pdfplumber", "pdfium"])
+def test_understated_page_count_never_passes_the_cap(layout_counter, monkeypatch, backend):
+    monkeypatch.setattr(extraction, "EXTRACTION_WORKERS", 1)
+    pages_read = []
+    try:
+        for page_text in iter_resume_pages(as_upload(_understated_pdf(), "long.pdf"), backend=backend):
+            pages_read.append(page_text)
+    except UploadRejected as e:
+        assert "more than 5 pages" in str(e)
+    # PDFium also stops at the declared count; pdfplumber reads on and is stopped at the cap
+    assert len(pages_read) == (5 if backend == "pdfplumber" else 3)
+
+
+def test_understated_page_count_is_rejected_in_parallel(layout_counter, monkeypatch):
+    monkeypatch.setattr(extraction, "EXTRACTION_WORKERS", 2)
+    monkeypatch.setattr(extraction, "PARALLEL_MIN_PAGES", 2)
+    with pytest.raises(UploadRejected, match="more than 5 pages"):
+        list(iter_resume_pages(as_upload(_understated_pdf(), "long.pdf"), backend="pdfplumber"))
+
+
+def test_pdf_within_the_cap_is_read_whole(monkeypatch):
+    monkeypatch.setattr(extraction, "MAX_PDF_PAGES", PAGE_COUNT)
+    pages = [[f"Page {number} of a resume"] for number in range(1, PAGE_COUNT + 1)]
+    texts = list(iter_resume_pages(as_upload(render_pdf(pages), "resume.pdf")))
+    assert len(texts) == PAGE_COUNT
+    assert "Page 12" in texts[-1]
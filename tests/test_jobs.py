@@ -0,0 +1,64 @@
+# tests/test_jobs.py
+"""
+Tests for the background job pool (jobs.py).
+
+Run from the repository root with `python -m pytest`.
+"""
+import io
+import threading
+import time
+
+import jobs
+import metrics
+
+
+class FakeUpload(io.BytesIO):
+    """Stands in for the object st.file_uploader returns."""
+
+    def __init__(self, data, name="resume.txt", file_id="upload-1"):
+        super().__init__(data)
+        self.name = name
+        self.file_id = file_id
+        self.size = len(data)
+
+
+def _wait_finished(job, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        assert time.monotonic() < deadline, f"job still {job.status} after {timeout}s"
+        time.sleep(0.01)
+
+
+def test_cancel_running_extraction(monkeypatch):
+    started = threading.Event()
+    resume = threading.Event()
+
+    class BlockingAnalyzer(jobs.IncrementalResumeAnalyzer):
+        # Holds the job inside its first page until the test has cancelled it
+        def feed(self, chunk):
+            started.set()
+            resume.wait(10)
+            super().feed(chunk)
+
+    monkeypatch.setattr(jobs, "IncrementalResumeAnalyzer", BlockingAnalyzer)
+
+    def failures():
+        return metrics.REGISTRY.get_sample_value(
+            "resume_extraction_failures_total", {"file_type": "txt", "reason": "error"}
+        ) or 0
+
+    failures_before = failures()
+    # Unique bytes, so the extraction cache cannot answer without parsing
+    upload = FakeUpload(f"Python developer, cancel test {time.time_ns()}".encode("utf-8"))
+    job = jobs.submit_extraction(upload, "Data Engineer")
+    try:
+        assert started.wait(10)
+        assert job.status == jobs.RUNNING
+        job.cancel()
+    finally:
+        resume.set()
+    _wait_finished(job)
+
+    assert job.status == jobs.CANCELLED
+    assert job.result is None
+    assert failures() == failures_before
@@ -0,0 +1,94 @@
+# tests/test_matcher.py
+"""
+Tests for token-boundary phrase matching (reviewer/matcher.py) and the
+keyword scan built on it, against the substring scan it replaced.
+"""
+import re
+
+import pytest
+
+from reviewer.analysis import KEYWORD_INDEX, TECHNICAL_SKILLS, _indicator_variants
+from reviewer.matcher import PhraseIndex, tokenize
+
+
+@pytest.fixture(scope="module")
+def index():
+    return PhraseIndex([
+        ("java", "java"), ("javascript", "javascript"), ("js", "javascript"),
+        ("c", "c"), ("c++", "c++"), ("c#", "c#"), ("k8s", "kubernetes"), ("kubernetes", "kubernetes"),
+        ("spring", "spring"), ("ruby on rails", "ruby on rails"), ("led", "led"),
+    ])
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("javascript developer", {"javascript"}),
+    ("java developer", {"java"}),
+    ("java and javascript", {"java", "javascript"}),
+    ("node.js", {"javascript"}),
+    ("c++ and c#", {"c++", "c#"}),
+    ("written in c, not c++", {"c", "c++"}),
+    ("objective-c", {"c"}),
+    ("deployed to k8s", {"kubernetes"}),
+    ("springfield office", set()),
+    ("called customers", set()),
+    ("led the ruby on rails migration", {"led", "ruby on rails"}),
+    ("ruby on\nrails", {"ruby on rails"}),
+    ("ruby rails", set()),
+])
+def test_token_boundaries_and_aliases(index, text, expected):
+    assert index.find_in_text(text) == expected
+
+
+def test_find_grouped_equals_find_on_joined_tokens(index):
+    groups = [tokenize("led a ruby"), tokenize("on rails team"), tokenize("java")]
+    joined = [token for group in groups for token in group]
+    assert set().union(*index.find_grouped(groups)) == index.find(joined)
+    assert index.find_grouped(groups)[0] == {"led", "ruby on rails"}
+
+
+def _substring_hits(text_lower):
+    # The scan KEYWORD_INDEX replaced: `term in text` for every term
+    return {term for term in KEYWORD_INDEX.keys() if term in text_lower}
+
+
+def _boundary_hits(text_lower):
+    # Substring hits that start and end on a token boundary
+    return {term for term in KEYWORD_INDEX.keys()
+            if re.search(rf"(?<![a-z0-9]){re.escape(term)}(?![a-z0-9+#])", text_lower)}
+
+
+def _boundary_hits_of(phrase, text_lower):
+    # Whether the tokens of `phrase` occur in a row, whatever separates them
+    pattern = r"[^a-z0-9+#]+".join(re.escape(token) for token in tokenize(phrase))
+    return re.search(rf"(?<![a-z0-9]){pattern}(?![a-z0-9+#])", text_lower) is not None
+
+
+def _spellings(term):
+    # Every phrase indexed under `term`: aliases and inflections
+    aliases = next((info.get("aliases", ()) for skills in TECHNICAL_SKILLS.values()
+                    for skill, info in skills.items() if skill == term), ())
+    return (term,) + tuple(aliases) + _indicator_variants(term)
+
+
+def test_index_finds_every_whole_word_substring_hit(resume_texts):
+    for text in resume_texts:
+        text_lower = text.lower()
+        assert _boundary_hits(text_lower) <= KEYWORD_INDEX.find_in_text(text_lower)
+
+
+def test_index_hits_beyond_substring_scan_come_from_aliases(resume_texts):
+    for text in resume_texts:
+        text_lower = text.lower()
+        for term in KEYWORD_INDEX.find_in_text(text_lower) - _substring_hits(text_lower):
+            assert any(_boundary_hits_of(spelling, text_lower) for spelling in _spellings(term)), term
+
+
+def test_substring_false_positives_are_gone():
+    text_lower = "called customers from the springfield office using javascript"
+    dropped = _substring_hits(text_lower) - KEYWORD_INDEX.find_in_text(text_lower)
+    assert {"led", "spring", "java"} <= dropped
+
+
+@pytest.mark.parametrize("text, term", [("led two teams", "team"), ("one of our experts", "expert")])
+def test_indicator_inflections(text, term):
+    assert term in KEYWORD_INDEX.find_in_text(text)
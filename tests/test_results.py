@@ -0,0 +1,39 @@
+# tests/test_results.py
+"""
+Tests for the typed analysis result (reviewer/results.py).
+"""
+import marshal
+import pickle
+
+import pytest
+
+from reviewer import AnalysisResult, analyze_resume
+from reviewer.results import FORMAT_VERSION
+
+
+@pytest.fixture(scope="module")
+def results(resume_texts):
+    return [analyze_resume(text, "Senior Data Engineer", "Python, SQL and Airflow; 3+ years of experience")
+            for text in resume_texts]
+
+
+def test_bytes_round_trip(results):
+    for result in results:
+        restored = AnalysisResult.from_bytes(result.to_bytes())
+        assert restored == result
+        assert restored.to_dict() == result.to_dict()
+
+
+def test_pickle_round_trip(results):
+    for result in results:
+        assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_old_format_version_is_rejected(results):
+    version, *values = marshal.loads(results[0].to_bytes())
+    assert version == FORMAT_VERSION
+    with pytest.raises(ValueError, match="format"):
+        AnalysisResult.from_bytes(marshal.dumps((FORMAT_VERSION - 1, *values)))
+    # Format 2 had no achievement fields
+    with pytest.raises(ValueError, match="format"):
+        AnalysisResult.from_bytes(marshal.dumps((2, *values[:-4])))
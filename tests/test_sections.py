@@ -0,0 +1,54 @@
+# tests/test_sections.py
+"""
+Tests for resume segmentation (reviewer/sections.py).
+"""
+from reviewer.sections import segment
+from reviewer.taxonomy import RECOMMENDATIONS
+
+
+def _kinds(text):
+    return [(section.kind, text[section.start:section.end]) for section in segment(text)]
+
+
+def test_standalone_and_inline_headers():
+    text = "Jane Doe\nSkills: Python, SQL\nEducation: BSc Computer Science\nWORK EXPERIENCE\nAcme Corp"
+    assert _kinds(text) == [
+        ("contact", "Jane Doe\n"),
+        ("skills", "Skills: Python, SQL\n"),
+        ("education", "Education: BSc Computer Science\n"),
+        ("experience", "WORK EXPERIENCE\nAcme Corp"),
+    ]
+
+
+def test_recommended_skills_block_stays_one_section():
+    # "Languages: Python (Expert), ..." lists programming languages, not spoken ones
+    example = RECOMMENDATIONS["skill_optimization"]["technical_skills"]["example"]
+    sections = segment(example)
+    assert [section.kind for section in sections if section.kind != "contact"] == ["skills"]
+    skills = sections[-1]
+    assert "Languages: Python (Expert)" in example[skills.start:skills.end]
+    assert "Tools: Git" in example[skills.start:skills.end]
+
+
+def test_inline_label_in_body_is_not_a_header():
+    text = "Summary\nData engineer.\nExperience: 5 years building data platforms\nExperience\nAcme Corp"
+    assert _kinds(text) == [
+        ("summary", "Summary\nData engineer.\nExperience: 5 years building data platforms\n"),
+        ("experience", "Experience\nAcme Corp"),
+    ]
+
+
+def test_standalone_header_ends_a_compatible_section():
+    text = "Technical Skills\nPython, SQL\nLanguages\nEnglish, French"
+    assert [kind for kind, _ in _kinds(text)] == ["skills", "languages"]
+
+
+def test_inline_header_of_another_kind_starts_a_section():
+    text = "Experience\nAcme Corp, data engineer\n\nSkills: Python, SQL\nExperience: 5 years with Airflow"
+    assert [kind for kind, _ in _kinds(text)] == ["experience", "skills", "experience"]
+
+
+def test_segment_continues_the_given_section():
+    page = "Languages: Python, Go\nEducation\nBSc"
+    assert [(section.kind, section.title) for section in segment(page, "skills")] == \
+        [("skills", ""), ("education", "Education")]